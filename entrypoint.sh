@@ -20,6 +20,8 @@ echo "Starting gunicorn..."
 exec pipenv run gunicorn "src:create_app()" \
     --bind "0.0.0.0:${PORT:-5000}" \
     --workers "${GUNICORN_WORKERS:-2}" \
+    --worker-class gthread \
+    --threads "${GUNICORN_THREADS:-4}" \
     --timeout 120 \
     --preload \
     --access-logfile - \
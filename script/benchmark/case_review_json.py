@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark serializing a case review response.
+
+Compares the path the case endpoints used to take (Case.to_dict, then
+jsonify, which runs dataclasses.asdict over ApiResponse and the generic JSON
+encoder) with case_json_response, which writes the known shapes directly.
+Both outputs are checked to be byte-identical before timing.
+
+Usage:
+    PYTHONPATH=. python script/benchmark/case_review_json.py
+    PYTHONPATH=. python script/benchmark/case_review_json.py --children 500 --leaves 50
+"""
+
+import argparse
+import timeit
+
+from flask import Flask, jsonify
+
+from src.cases.controller.response.case_json import case_json_response
+from src.cases.model.case import Case, TreeNode, TreeNodeView
+from src.common.model.ApiResponse import ApiResponse
+
+
+def synthetic_review(children: int, leaves: int) -> Case:
+    """A review shaped like a pruned case: frozen base nodes, per-config views
+    on some of them, string leaves and styled sections."""
+    background = [
+        TreeNode(f"History {i}", [f"History {i} leaf {j}" for j in range(leaves)], {"collapse": i % 2 == 0})
+        for i in range(children)
+    ]
+    complaint = [
+        TreeNode(f"Complaint {i}", [TreeNode(f"Symptom {i}.{j}", "present") for j in range(leaves)])
+        for i in range(children)
+    ]
+    exam = [
+        TreeNode(f"Exam {i}", [TreeNode(f"Finding {i}.{j}", f"{j} mg/dL") for j in range(leaves)])
+        for i in range(children)
+    ]
+    frozen = [
+        TreeNode("BACKGROUND", background).freeze(),
+        TreeNode("PATIENT COMPLAINT", complaint).freeze(),
+        TreeNode("PHYSICAL EXAMINATION", exam).freeze(),
+    ]
+    details = [frozen[0], TreeNodeView(frozen[1], style={"highlight": True}), frozen[2]]
+    important = [TreeNode("AI CRC Risk Score", ["Predicted Colorectal Cancer Score: 12"])]
+    return Case("patient 1", "1", details, important)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--children", type=int, default=100, help="children per section")
+    parser.add_argument("--leaves", type=int, default=20, help="leaves per child")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    review = synthetic_review(args.children, args.leaves)
+    app = Flask(__name__)
+    with app.app_context():
+
+        def run_jsonify():
+            return jsonify(ApiResponse.success(review.to_dict())).get_data()
+
+        def run_case_json():
+            return case_json_response(ApiResponse.success(review)).get_data()
+
+        body = run_case_json()
+        assert run_jsonify() == body, "outputs differ"
+
+        nodes = 3 * args.children * (args.leaves + 1)
+        print(f"~{nodes} nodes, {len(body) / 1024:.0f} KiB body, best of {args.repeat} x {args.number}")
+        for name, func in (("to_dict + jsonify", run_jsonify), ("case_json_response", run_case_json)):
+            best = min(timeit.repeat(func, number=args.number, repeat=args.repeat)) / args.number
+            print(f"{name:22s} {best * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
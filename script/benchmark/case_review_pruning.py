@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Benchmark case-review pruning on large synthetic case trees.
+
+Compares the pruning get_case_review used to do (re-parse path_config, three
+passes mutating a freshly built tree, dataclasses.asdict serialization) with
+the current path: path_config compiled once into a trie, one prune_case_tree
+walk over a shared frozen tree, TreeNodeView.to_dict serialization.  Both
+outputs are checked to be identical before timing.
+
+Usage:
+    PYTHONPATH=. python script/benchmark/case_review_pruning.py
+    PYTHONPATH=. python script/benchmark/case_review_pruning.py --children 5000 --leaves 50
+"""
+
+import argparse
+import dataclasses
+import random
+import timeit
+from collections import defaultdict
+from operator import itemgetter
+
+from src.cases.model.case import TreeNode
+from src.cases.service.case_pruning import prune_case_tree
+from src.user.utils.path_trie import compile_path_config
+
+
+def synthetic_case(children: int, leaves: int) -> list[dict]:
+    """BACKGROUND, PATIENT COMPLAINT and PHYSICAL EXAMINATION with `children`
+    children each, `leaves` leaves per child."""
+    background = [
+        TreeNode("Patient Demographics", [TreeNode("Age", "36"), TreeNode("Gender", "F")])
+    ] + [
+        TreeNode(f"History {i}", [f"History {i} leaf {j}" for j in range(leaves)])
+        for i in range(children)
+    ]
+    complaint = [
+        TreeNode(f"Complaint {i}", [TreeNode(f"Symptom {i}.{j}", "yes") for j in range(leaves)])
+        for i in range(children)
+    ]
+    physical_examination = [TreeNode("BMI (body mass index) centile", "Normal")] + [
+        TreeNode(f"Exam {i}", [TreeNode(f"Finding {i}.{j}", str(j)) for j in range(leaves)])
+        for i in range(children)
+    ]
+    tree = [
+        TreeNode("BACKGROUND", background),
+        TreeNode("PATIENT COMPLAINT", complaint),
+        TreeNode("PHYSICAL EXAMINATION", physical_examination),
+    ]
+    return [node.to_dict() for node in tree]
+
+
+def synthetic_path_config(children: int, leaves: int, ratio: float, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    path_config = []
+    for i in range(children):
+        for j in range(leaves):
+            if rng.random() < ratio:
+                style = {"collapse": rng.random() < 0.5}
+                if rng.random() < 0.05:
+                    style["top"] = rng.randint(1, 10)
+                path_config.append({"path": f"BACKGROUND.History {i}.History {i} leaf {j}", "style": style})
+        if rng.random() < ratio:
+            path_config.append({"path": f"PHYSICAL EXAMINATION.Group.Exam {i}", "style": {}})
+    return path_config
+
+
+def legacy_prune(case_details: list[TreeNode], path_config: list[dict]):
+    """The pruning get_case_review did before case_pruning, kept verbatim."""
+    parent_to_entries: dict[str, list[dict]] = defaultdict(list)
+    for entry in path_config or []:
+        path_str = (entry.get("path") or "").strip()
+        style = entry.get("style") or {}
+        if not path_str:
+            continue
+        segments = path_str.split(".")
+        if len(segments) < 2:
+            continue
+        parent_to_entries[".".join(segments[:-1])].append({"leaf": segments[-1], "style": style})
+
+    important_infos: list[dict] = []
+    for top in case_details:
+        if top.key != "BACKGROUND":
+            continue
+        for child in top.values:
+            if child.key == "Patient Demographics":
+                continue
+            pk = f"BACKGROUND.{child.key}"
+            if pk not in parent_to_entries:
+                child.values = []
+                continue
+            entries = parent_to_entries[pk]
+            keep = {e["leaf"] for e in entries}
+            child.values = [v for v in child.values if v in keep]
+            merged: dict = {}
+            for e in entries:
+                s = e["style"]
+                if "collapse" in s:
+                    merged["collapse"] = not s["collapse"]
+                if "highlight" in s:
+                    merged["highlight"] = s["highlight"]
+                if "top" in s:
+                    merged["top"] = max(merged.get("top", -1), s["top"])
+            child.style = merged
+            if merged.get("top") is not None:
+                important_infos.append({"key": child.key, "values": child.values, "weight": merged["top"]})
+
+    phys_exam_keep = set()
+    has_phys_exam_config = False
+    for pk, entries in parent_to_entries.items():
+        if pk.startswith("PHYSICAL EXAMINATION."):
+            has_phys_exam_config = True
+            for e in entries:
+                phys_exam_keep.add(e["leaf"])
+    for top in case_details:
+        if top.key != "PHYSICAL EXAMINATION":
+            continue
+        filtered_children = []
+        for child in top.values:
+            if has_phys_exam_config:
+                should_keep = child.key in phys_exam_keep
+            else:
+                should_keep = child.key != "BMI (body mass index) centile"
+            if should_keep:
+                if child.key == "BMI (body mass index) centile":
+                    child.key = "BMI (body mass index) range"
+                filtered_children.append(child)
+        top.values = filtered_children
+
+    case_details = [
+        section
+        for section in case_details
+        if not (section.key == "PHYSICAL EXAMINATION" and not section.values)
+    ]
+    important_infos.sort(key=itemgetter("weight"))
+    return case_details, [TreeNode(e["key"], e["values"]) for e in important_infos]
+
+
+def run_legacy(tree: list[dict], path_config: list[dict]):
+    # the old code pruned a freshly built tree in place, so every request paid
+    # for a new mutable tree; TreeNode.from_dict stands in for that build
+    details, important = legacy_prune([TreeNode.from_dict(n) for n in tree], path_config)
+    return [dataclasses.asdict(n) for n in details], [dataclasses.asdict(n) for n in important]
+
+
+def run_current(frozen_tree, path_trie: dict):
+    details, important_infos = prune_case_tree(frozen_tree, path_trie)
+    important_infos.sort(key=itemgetter("weight"))
+    important = [TreeNode(e["key"], e["values"]) for e in important_infos]
+    return [n.to_dict() for n in details], [n.to_dict() for n in important]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--children", type=int, default=2000, help="children per section")
+    parser.add_argument("--leaves", type=int, default=20, help="leaves per child")
+    parser.add_argument("--ratio", type=float, default=0.3, help="share of leaves named in path_config")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    tree = synthetic_case(args.children, args.leaves)
+    path_config = synthetic_path_config(args.children, args.leaves, args.ratio, args.seed)
+    frozen_tree = tuple(TreeNode.from_dict(n).freeze() for n in tree)
+    path_trie = compile_path_config(path_config)
+
+    assert run_legacy(tree, path_config) == run_current(frozen_tree, path_trie), "outputs differ"
+
+    nodes = 3 * args.children * (args.leaves + 1)
+    print(f"~{nodes} nodes, {len(path_config)} path_config entries, best of {args.repeat}")
+    for name, func in (
+        ("legacy get_case_review pruning", lambda: run_legacy(tree, path_config)),
+        ("prune_case_tree (views + trie)", lambda: run_current(frozen_tree, path_trie)),
+        ("  of which prune only", lambda: prune_case_tree(frozen_tree, path_trie)),
+    ):
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print(f"{name:34s} {best * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Benchmark loading the OMOP rows of case trees as entities vs column projections.
+
+Inserts synthetic visits (each with its person, observations and measurements)
+into the database at DATABASE_URL inside a transaction that is rolled back at
+the end, then loads them the way load_case_rows_batch used to (full ORM
+entities through the identity map) and the way it does now (ObservationRow /
+MeasurementRow / PersonRow / VisitRow tuples of only the columns used).  Both
+are checked to carry the same values before timing; allocations are measured
+with tracemalloc.  The database must be migrated.
+
+Usage:
+    DATABASE_URL=postgresql://... PYTHONPATH=. python script/benchmark/case_row_loading.py
+    DATABASE_URL=... PYTHONPATH=. python script/benchmark/case_row_loading.py --cases 50 --rows 400
+"""
+
+import argparse
+import os
+import timeit
+import tracemalloc
+
+from sqlalchemy import select, text
+
+from src import create_app, db
+from src.cases.model.clinical_data.person.measurement import Measurement
+from src.cases.model.clinical_data.person.observation import Observation
+from src.cases.model.clinical_data.person.person import Person
+from src.cases.model.clinical_data.person.visit_occurrence import VisitOccurrence
+from src.cases.repository.measurement_repository import (
+    MeasurementRepository,
+    MeasurementRow,
+)
+from src.cases.repository.observation_repository import (
+    ObservationRepository,
+    ObservationRow,
+)
+from src.cases.repository.person_repository import PersonRepository, PersonRow
+from src.cases.repository.visit_occurrence_repository import (
+    VisitOccurrenceRepository,
+    VisitRow,
+)
+
+# keeps synthetic ids clear of real data
+BASE = 3_000_000
+
+
+def insert_synthetic_cases(session, cases: int, rows: int):
+    # synthetic rows do not satisfy every OMOP foreign key; replica mode skips
+    # FK triggers for this (rolled back) transaction only
+    session.execute(text("SET LOCAL session_replication_role = replica"))
+    statements = [
+        f"""INSERT INTO person (person_id, gender_concept_id, year_of_birth,
+               race_concept_id, ethnicity_concept_id, person_source_value)
+           SELECT {BASE} + i, 8507, 1960, 0, 0, 'patient ' || i
+           FROM generate_series(1, {cases}) i""",
+        f"""INSERT INTO visit_occurrence (visit_occurrence_id, person_id,
+               visit_concept_id, visit_start_date, visit_end_date, visit_type_concept_id)
+           SELECT {BASE} + i, {BASE} + i, 9202, DATE '2024-01-01', DATE '2024-01-01', 0
+           FROM generate_series(1, {cases}) i""",
+        f"""INSERT INTO observation (observation_id, person_id, observation_concept_id,
+               observation_date, observation_type_concept_id, value_as_string,
+               unit_concept_id, visit_occurrence_id)
+           SELECT {BASE} + i, {BASE} + i % {cases} + 1, 4000000 + i % 300,
+               DATE '2024-01-01', i % 20, 'value ' || i, 8510, {BASE} + i % {cases} + 1
+           FROM generate_series(0, {cases * rows - 1}) i""",
+        f"""INSERT INTO measurement (measurement_id, person_id, measurement_concept_id,
+               measurement_date, measurement_type_concept_id, value_as_number,
+               unit_concept_id, visit_occurrence_id)
+           SELECT {BASE} + i, {BASE} + i % {cases} + 1, 3000000 + i % 300,
+               DATE '2024-01-01', 0, i % 97, 8582, {BASE} + i % {cases} + 1
+           FROM generate_series(0, {cases * rows - 1}) i""",
+    ]
+    for statement in statements:
+        session.execute(text(statement))
+
+
+def load_entities(session, visit_ids):
+    """What load_case_rows_batch loaded before the projections."""
+    visits = session.scalars(
+        select(VisitOccurrence).where(VisitOccurrence.visit_occurrence_id.in_(visit_ids))
+    ).all()
+    persons = session.scalars(
+        select(Person).where(Person.person_id.in_({visit.person_id for visit in visits}))
+    ).all()
+    observations = session.scalars(
+        select(Observation)
+        .where(Observation.visit_occurrence_id.in_(visit_ids))
+        .order_by(Observation.observation_id)
+    ).all()
+    measurements = session.scalars(
+        select(Measurement)
+        .where(Measurement.visit_occurrence_id.in_(visit_ids))
+        .order_by(Measurement.measurement_id)
+    ).all()
+    return visits, persons, observations, measurements
+
+
+def load_rows(session, visit_ids):
+    visits = VisitOccurrenceRepository(session).get_visit_occurrences(visit_ids)
+    persons = PersonRepository(session).get_persons({visit.person_id for visit in visits})
+    observations = ObservationRepository(session).get_observations_by_visits(visit_ids)
+    measurements = MeasurementRepository(session).get_measurements_by_visits(visit_ids)
+    return visits, persons, observations, measurements
+
+
+def as_rows(entities):
+    def project(row_type, items):
+        return [row_type(*(getattr(item, field) for field in row_type._fields)) for item in items]
+
+    visits, persons, observations, measurements = entities
+    return (
+        project(VisitRow, visits),
+        project(PersonRow, persons),
+        project(ObservationRow, observations),
+        project(MeasurementRow, measurements),
+    )
+
+
+def measure(session, load, visit_ids, repeat: int):
+    def run():
+        # a fresh identity map per load, as every request gets
+        session.expunge_all()
+        return load(session, visit_ids)
+
+    best = min(timeit.repeat(run, number=1, repeat=repeat))
+    session.expunge_all()
+    tracemalloc.start()
+    loaded = load(session, visit_ids)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del loaded
+    return best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cases", type=int, default=20, help="visits loaded together")
+    parser.add_argument("--rows", type=int, default=300, help="observations and measurements per visit")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    app = create_app({"SQLALCHEMY_DATABASE_URI": os.environ["DATABASE_URL"]})
+    with app.app_context():
+        session = db.session
+        try:
+            insert_synthetic_cases(session, args.cases, args.rows)
+            visit_ids = [BASE + i for i in range(1, args.cases + 1)]
+
+            assert as_rows(load_entities(session, visit_ids)) == load_rows(session, visit_ids), "rows differ"
+
+            print(f"{args.cases} cases, {2 * args.rows} rows each, best of {args.repeat}")
+            print(f"{'':26s} {'per case':>12s} {'peak alloc/case':>16s}")
+            for name, load in (("ORM entities", load_entities), ("column projections", load_rows)):
+                best, peak = measure(session, load, visit_ids, args.repeat)
+                print(f"{name:26s} {best * 1000 / args.cases:9.2f} ms {peak / 1024 / args.cases:12.1f} KiB")
+        finally:
+            session.rollback()
+
+
+if __name__ == "__main__":
+    main()
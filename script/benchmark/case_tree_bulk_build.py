@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark building case trees for a whole synthetic cohort.
+
+Commits a synthetic cohort (persons, visits, observations, measurements and a
+page_config when the database has none) to the database at DATABASE_URL,
+builds every tree with case_tree_builder for growing cohort sizes, and
+deletes the synthetic rows again.  Time per case should stay flat as the
+cohort grows.  The database must be migrated.
+
+Usage:
+    DATABASE_URL=postgresql://... PYTHONPATH=. python script/benchmark/case_tree_bulk_build.py
+    DATABASE_URL=... PYTHONPATH=. python script/benchmark/case_tree_bulk_build.py --sizes 5000 20000 --workers 8
+"""
+
+import argparse
+import json
+import os
+import time
+
+from sqlalchemy import text
+
+from src import create_app, db
+from src.cases.service.case_tree_builder import (
+    DEFAULT_CHUNK_SIZE,
+    build_case_trees,
+    build_case_trees_in_processes,
+)
+
+# keeps synthetic ids clear of real data
+BASE = 4_000_000
+CONCEPTS = 300
+SYNTHETIC_PAGE_CONFIG = {
+    "BACKGROUND": {f"History {i}": [BASE + i] for i in range(1, 11)},
+    "PATIENT COMPLAINT": {"Chief Complaint": [38000282]},
+    "PHYSICAL EXAMINATION": {f"Exam {i}": [BASE + 100 + i] for i in range(1, 11)},
+}
+
+
+def insert_cohort(session, patients: int, rows: int) -> bool:
+    """Commit the cohort; True when a synthetic page_config was added too."""
+    session.execute(text("SET LOCAL session_replication_role = replica"))
+    statements = [
+        f"""INSERT INTO concept (concept_id, concept_name, domain_id, vocabulary_id,
+               concept_class_id, concept_code, valid_start_date, valid_end_date)
+           SELECT {BASE} + i, 'concept ' || i, '1', '1', '1', 'code', DATE '2024-01-01',
+               DATE '2099-01-01'
+           FROM generate_series(0, {CONCEPTS}) i""",
+        f"""INSERT INTO person (person_id, gender_concept_id, year_of_birth,
+               race_concept_id, ethnicity_concept_id, person_source_value)
+           SELECT {BASE} + i, {BASE}, 1960, 0, 0, 'patient ' || i
+           FROM generate_series(1, {patients}) i""",
+        f"""INSERT INTO visit_occurrence (visit_occurrence_id, person_id,
+               visit_concept_id, visit_start_date, visit_end_date, visit_type_concept_id)
+           SELECT {BASE} + i, {BASE} + i, 9202, DATE '2024-01-01', DATE '2024-01-01', 0
+           FROM generate_series(1, {patients}) i""",
+        f"""INSERT INTO observation (observation_id, person_id, observation_concept_id,
+               observation_date, observation_type_concept_id, value_as_string,
+               visit_occurrence_id)
+           SELECT {BASE} + i, {BASE} + i % {patients} + 1, {BASE} + i % 10 + 1,
+               DATE '2024-01-01', 38000282, 'value ' || i % 50, {BASE} + i % {patients} + 1
+           FROM generate_series(0, {patients * rows - 1}) i""",
+        f"""INSERT INTO measurement (measurement_id, person_id, measurement_concept_id,
+               measurement_date, measurement_type_concept_id, value_as_number,
+               unit_concept_id, visit_occurrence_id)
+           SELECT {BASE} + i, {BASE} + i % {patients} + 1, {BASE} + 100 + i % 10 + 1,
+               DATE '2024-01-01', 0, i % 97, {BASE} + 200, {BASE} + i % {patients} + 1
+           FROM generate_series(0, {patients * rows - 1}) i""",
+    ]
+    for statement in statements:
+        session.execute(text(statement))
+    add_page_config = (
+        session.execute(text("SELECT 1 FROM system_config WHERE id = 'page_config'")).first() is None
+    )
+    if add_page_config:
+        session.execute(
+            text("INSERT INTO system_config (id, json_config) VALUES ('page_config', CAST(:config AS json))"),
+            {"config": json.dumps(SYNTHETIC_PAGE_CONFIG)},
+        )
+    for table in ("person", "visit_occurrence", "observation", "measurement", "concept"):
+        session.execute(text(f"ANALYZE {table}"))
+    session.commit()
+    return add_page_config
+
+
+def delete_cohort(session, page_config_added: bool):
+    session.rollback()
+    for table, column in (
+        ("observation", "observation_id"),
+        ("measurement", "measurement_id"),
+        ("visit_occurrence", "visit_occurrence_id"),
+        ("person", "person_id"),
+        ("concept", "concept_id"),
+    ):
+        session.execute(text(f"DELETE FROM {table} WHERE {column} >= {BASE}"))
+    if page_config_added:
+        session.execute(text("DELETE FROM system_config WHERE id = 'page_config'"))
+    session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2500, 5000, 10000, 20000])
+    parser.add_argument("--rows", type=int, default=20, help="observations and measurements per patient")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="0 builds in this process")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    app = create_app({"SQLALCHEMY_DATABASE_URI": os.environ["DATABASE_URL"]})
+    with app.app_context():
+        # needs the app context
+        from src.cases.controller.case_controller import get_case_service
+
+        session = db.session
+        page_config_added = insert_cohort(session, max(args.sizes), args.rows)
+        try:
+            print(f"{args.rows * 2} rows per patient, {args.workers} workers, chunks of {args.chunk_size}")
+            for size in args.sizes:
+                case_ids = [BASE + i for i in range(1, size + 1)]
+                started = time.perf_counter()
+                if args.workers:
+                    built = build_case_trees_in_processes(app, case_ids, args.workers, args.chunk_size)
+                else:
+                    built = build_case_trees(get_case_service(), case_ids, args.chunk_size)
+                count = sum(1 for _ in built)
+                elapsed = time.perf_counter() - started
+                assert count == size, f"built {count} of {size} trees"
+                print(f"{size:7d} cases {elapsed:8.2f} s {elapsed * 1e6 / size:9.0f} us/case")
+        finally:
+            delete_cohort(session, page_config_added)
+
+
+if __name__ == "__main__":
+    main()
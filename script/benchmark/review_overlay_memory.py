@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark the memory of cached case reviews.
+
+One synthetic case is reviewed under many path_configs, as when a case is
+assigned to many clinicians.  Compares caching, per config, the serialized
+review, the built Case and the ReviewOverlay (which leaves the clinical
+content to the one shared base tree).  Every overlay is checked to rebuild
+its review byte for byte before measuring.
+
+Usage:
+    PYTHONPATH=. python script/benchmark/review_overlay_memory.py
+    PYTHONPATH=. python script/benchmark/review_overlay_memory.py --configs 200 --children 200
+"""
+
+import argparse
+import random
+import tracemalloc
+
+from src.cases.controller.response.case_json import dumps_case_json
+from src.cases.model.case import Case, TreeNode
+from src.cases.service.case_pruning import prune_case_tree
+from src.cases.service.review_overlay import apply_overlay, overlay_of
+from src.user.utils.path_trie import compile_path_config
+
+
+def synthetic_case_tree(children: int, leaves: int) -> tuple:
+    sections = [
+        TreeNode(
+            "BACKGROUND",
+            [
+                TreeNode(f"History {i}", [f"History {i} finding {j}" for j in range(leaves)])
+                for i in range(children)
+            ],
+        ),
+        TreeNode(
+            "PATIENT COMPLAINT",
+            [TreeNode(f"Complaint {i}", f"complaint {i} details") for i in range(children)],
+        ),
+        TreeNode(
+            "PHYSICAL EXAMINATION",
+            [
+                TreeNode(f"Exam {i}", [TreeNode(f"Finding {i}.{j}", f"{j} mg/dL") for j in range(leaves)])
+                for i in range(children)
+            ],
+        ),
+    ]
+    return tuple(section.freeze() for section in sections)
+
+
+def synthetic_path_config(rng: random.Random, children: int, leaves: int) -> list[dict]:
+    paths = [
+        {
+            "path": f"BACKGROUND.History {i}.History {i} finding {j}",
+            "style": {"collapse": rng.random() < 0.5, **({"top": i} if j == 0 and i % 10 == 0 else {})},
+        }
+        for i in range(children)
+        for j in range(leaves)
+        if rng.random() < 0.6
+    ]
+    paths += [{"path": f"PHYSICAL EXAMINATION.Exam {i}"} for i in range(children) if rng.random() < 0.7]
+    return paths
+
+
+def review_of(case_details, path_trie) -> Case:
+    details, important_infos = prune_case_tree(case_details, path_trie)
+    important_infos.sort(key=lambda info: info["weight"])
+    return Case(
+        "patient 1",
+        "1",
+        details,
+        [TreeNode(info["key"], info["values"]) for info in important_infos],
+    )
+
+
+def measure(build) -> tuple[object, int]:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        value = build()
+        return value, tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--configs", type=int, default=100, help="path_configs reviewing the case")
+    parser.add_argument("--children", type=int, default=100, help="children per section")
+    parser.add_argument("--leaves", type=int, default=10, help="leaves per child")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    case_details, base_bytes = measure(lambda: synthetic_case_tree(args.children, args.leaves))
+    path_tries = [
+        compile_path_config(synthetic_path_config(rng, args.children, args.leaves)) for _ in range(args.configs)
+    ]
+    reviews = [review_of(case_details, path_trie) for path_trie in path_tries]
+    bodies = [dumps_case_json(review) for review in reviews]
+    for review, body in zip(reviews, bodies):
+        rebuilt = apply_overlay(overlay_of(review, case_details), "patient 1", 1, case_details)
+        assert dumps_case_json(rebuilt) == body, "overlay does not rebuild its review"
+
+    _, json_bytes = measure(lambda: [dumps_case_json(review) for review in reviews])
+    _, case_bytes = measure(lambda: [review_of(case_details, path_trie) for path_trie in path_tries])
+    _, overlay_bytes = measure(lambda: [overlay_of(review, case_details) for review in reviews])
+
+    print(f"{args.configs} configs of one case, base tree {base_bytes / 1024:.0f} KiB (shared)")
+    for name, size in (
+        ("serialized review", json_bytes),
+        ("Case on base tree", case_bytes),
+        ("ReviewOverlay", overlay_bytes),
+    ):
+        print(f"{name:18s} {size / 1024:9.0f} KiB total {size / args.configs / 1024:7.1f} KiB/config")
+
+
+if __name__ == "__main__":
+    main()
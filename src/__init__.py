@@ -43,6 +43,14 @@ def create_app(config_object=None):
         app, db, directory=path.join(path.dirname(path.abspath(__file__)), "migrations")
     )
 
+    if not config_object:
+        # gunicorn serves create_app() itself, not src/app.py; GET handlers
+        # also write (cached case trees, case progress cursors)
+        @app.after_request
+        def commit_after_request(response):
+            db.session.commit()
+            return response
+
     with app.app_context():
         # comment db init to avoid failure, need change to migrate
         if not config_object:
@@ -32,4 +32,6 @@ class Analytics(db.Model):
     __table_args__ = (
         # ensure only one analytics row per case_config_id per user
         db.UniqueConstraint("user_email", "case_config_id"),
+        # export sort key
+        db.Index("ix_analytics_user_email_case_id_id", "user_email", "case_id", "id"),
     )
@@ -3,11 +3,15 @@ from flask import Blueprint, jsonify, request
 from src import db
 from src.answer.repository.answer_repository import AnswerRepository
 from src.answer.service.answer_service import AnswerService
+from src.cases.controller.case_controller import case_prefetcher
+from src.cases.repository.case_progress_repository import CaseProgressRepository
 from src.common.model.ApiResponse import ApiResponse
+from src.configration.controller.answer_config_controller import answer_config_cache
 from src.configration.repository.answer_config_repository import (
     AnswerConfigurationRepository,
 )
 from src.user.repository.display_config_repository import DisplayConfigRepository
+from src.user.utils import auth_utils
 from src.user.utils.auth_utils import jwt_validation_required
 
 answer_blueprint = Blueprint("answer", __name__)
@@ -16,6 +20,8 @@ answer_service = AnswerService(
     answer_repository=AnswerRepository(db.session),
     configuration_repository=DisplayConfigRepository(db.session),
     answer_config_repository=AnswerConfigurationRepository(db.session),
+    case_progress_repository=CaseProgressRepository(db.session),
+    answer_config_cache=answer_config_cache,
 )
 
 
@@ -25,5 +31,8 @@ def add_answer_response(task_id):
     data = request.get_json()
 
     answer_response = answer_service.add_answer_response(task_id, data)
+    if case_prefetcher is not None:
+        # a review still prefetched is of the case just answered
+        case_prefetcher.drop(auth_utils.get_user_email_from_jwt())
 
     return jsonify(ApiResponse.success({"id": answer_response.id})), 200
@@ -24,4 +24,9 @@ class Answer(db.Model):
     modified_timestamp: datetime = db.Column(
         db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
     )
-    __table_args__ = (db.UniqueConstraint("task_id", "case_id", "user_email"),)
+    __table_args__ = (
+        db.UniqueConstraint("task_id", "case_id", "user_email"),
+        db.Index("ix_answer_user_email_task_id", "user_email", "task_id"),
+        # export sort key
+        db.Index("ix_answer_user_email_id", "user_email", "id"),
+    )
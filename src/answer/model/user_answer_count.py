@@ -0,0 +1,25 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, Integer, String
+
+from src import db
+
+
+class UserAnswerCount(db.Model):
+    """
+    Number of answers per user, kept in step with the answer table by
+    AnswerRepository.add_answer in the same transaction as the insert, so
+    reading it costs one primary-key lookup instead of listing the answers.
+    Answers inserted around the repository are not counted; a user without a
+    row is counted from the answer table instead.
+    """
+
+    __tablename__ = "user_answer_count"
+
+    user_email = Column(String(128), primary_key=True)
+    answer_count = Column(Integer, nullable=False, default=0)
+    modified_timestamp = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
@@ -1,9 +1,11 @@
-from typing import List
+from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from src.answer.model.answer import Answer
+from src.answer.model.user_answer_count import UserAnswerCount
 
 
 class AnswerRepository:
@@ -20,16 +22,49 @@ class AnswerRepository:
     def add_answer(self, answer: Answer) -> Answer:  # pragma: no cover
         """
         Insert + commit.  Returns the persisted Answer instance.
+        The user's answer count is updated in the same transaction.
         """
         self.session.add(answer)
+        if answer.user_email is not None:
+            self.session.flush()
+            self._increment_answer_count(answer.user_email)
         self.session.commit()
         return answer
 
-    # ------------------------------------------------------------------ #
-    def get_answered_case_list_by_user(self, user_email: str) -> List[str]:
-        statement = (
-            select(Answer.task_id)
+    def _increment_answer_count(self, user_email: str) -> None:
+        # a user's first counted answer seeds the row from the answer table,
+        # which already holds the flushed answer
+        now = datetime.now(timezone.utc)
+        statement = insert(UserAnswerCount).values(
+            user_email=user_email,
+            answer_count=self._count_answers(user_email).scalar_subquery(),
+            modified_timestamp=now,
+        )
+        self.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=["user_email"],
+                set_=dict(
+                    answer_count=UserAnswerCount.answer_count + 1,
+                    modified_timestamp=now,
+                ),
+            )
+        )
+
+    def get_answer_count(self, user_email: str) -> int:
+        """Number of answers of the user, from its counter row when it has one."""
+        count = self.session.execute(
+            select(UserAnswerCount.answer_count).where(
+                UserAnswerCount.user_email == user_email
+            )
+        ).scalar()
+        if count is None:
+            count = self.session.execute(self._count_answers(user_email)).scalar()
+        return count
+
+    @staticmethod
+    def _count_answers(user_email: str):
+        return (
+            select(func.count())
             .select_from(Answer)
             .where(Answer.user_email == user_email)
         )
-        return self.session.execute(statement).scalars().all()
@@ -1,5 +1,6 @@
 from src.answer.model.answer import Answer
 from src.answer.repository.answer_repository import AnswerRepository
+from src.cases.repository.case_progress_repository import CaseProgressRepository
 from src.common.exception.BusinessException import (
     BusinessException,
     BusinessExceptionEnum,
@@ -7,6 +8,7 @@ from src.common.exception.BusinessException import (
 from src.configration.repository.answer_config_repository import (
     AnswerConfigurationRepository,
 )
+from src.configration.service.answer_config_cache import AnswerConfigCache
 from src.user.repository.display_config_repository import DisplayConfigRepository
 from src.user.utils import auth_utils
 
@@ -17,10 +19,14 @@ class AnswerService:
         answer_repository: AnswerRepository,
         configuration_repository: DisplayConfigRepository,
         answer_config_repository: AnswerConfigurationRepository,
+        case_progress_repository: CaseProgressRepository | None = None,
+        answer_config_cache: AnswerConfigCache | None = None,
     ):
         self.answer_repository = answer_repository
         self.configuration_repository = configuration_repository
         self.answer_config_repository = answer_config_repository
+        self.case_progress_repository = case_progress_repository
+        self.answer_config_cache = answer_config_cache
 
     def add_answer_response(self, task_id: int, data: dict):
         user_email = auth_utils.get_user_email_from_jwt()
@@ -35,9 +41,14 @@ class AnswerService:
         if not configuration or configuration.user_email != user_email:
             raise BusinessException(BusinessExceptionEnum.NoAccessToCaseReview)
 
-        answer_config = self.answer_config_repository.get_answer_config(
-            answer_config_id
-        )
+        if self.answer_config_cache is not None:
+            answer_config = self.answer_config_cache.get(
+                answer_config_id, self.answer_config_repository
+            )
+        else:
+            answer_config = self.answer_config_repository.get_answer_config(
+                answer_config_id
+            )
         if answer_config is None:
             raise BusinessException(BusinessExceptionEnum.NoAnswerConfigAvailable)
 
@@ -51,4 +62,17 @@ class AnswerService:
             answer=answer,
         )
 
-        return self.answer_repository.add_answer(diagnose)
+        saved = self.answer_repository.add_answer(diagnose)
+        self.advance_case_progress(user_email)
+        return saved
+
+    def advance_case_progress(self, user_email: str) -> None:
+        """Move the user's next-case cursor past the config just answered."""
+        if self.case_progress_repository is None:
+            return
+        current = self.configuration_repository.get_next_unanswered_configuration(
+            user_email
+        )
+        self.case_progress_repository.save_progress(
+            user_email, None if current is None else current[1]
+        )
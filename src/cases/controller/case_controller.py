@@ -1,21 +1,51 @@
-from flask import Blueprint, jsonify
+import logging
+import os
+
+import click
+from flask import Blueprint, current_app, jsonify, request
 
 from src import db
 from src.answer.repository.answer_repository import AnswerRepository
+from src.cases.controller.response.case_json import case_json_response
+from src.cases.repository.case_progress_repository import CaseProgressRepository
+from src.cases.repository.case_tree_cache_repository import CaseTreeCacheRepository
 from src.cases.repository.concept_repository import ConceptRepository
 from src.cases.repository.drug_exposure_repository import DrugExposureRepository
 from src.cases.repository.measurement_repository import MeasurementRepository
 from src.cases.repository.observation_repository import ObservationRepository
 from src.cases.repository.person_repository import PersonRepository
 from src.cases.repository.visit_occurrence_repository import VisitOccurrenceRepository
-from src.cases.service.case_service import CaseService
+from src.cases.service.case_prefetcher import (
+    DEFAULT_PREFETCH_TTL_SECONDS,
+    DEFAULT_PREFETCH_WORKERS,
+    CasePrefetcher,
+)
+from src.cases.service.case_pruning import fold_collapsed
+from src.cases.service.case_service import (
+    DEFAULT_CASE_TREE_CACHE_SIZE,
+    DEFAULT_CONCEPT_CACHE_SIZE,
+    DEFAULT_REVIEW_OVERLAY_CACHE_SIZE,
+    CaseService,
+    PageConfig,
+)
+from src.cases.service.case_tree_builder import DEFAULT_CHUNK_SIZE
+from src.cases.service.case_warmup import WarmupProgress, warm_case_caches
+from src.cases.service.concept_hierarchy import ConceptHierarchy
+from src.cases.service.concept_name_cache import ConceptNameCache
+from src.common.cache.lru_cache import LruCache
+from src.common.cache.singleflight import Singleflight
+from src.common.cache.system_config_cache import SystemConfigCache
 from src.common.model.ApiResponse import ApiResponse
+from src.common.model.ErrorCode import ErrorCode
 from src.common.repository.system_config_repository import SystemConfigRepository
+from src.common.utils.conditional_request import not_modified, with_validators
 from src.user.repository.display_config_repository import DisplayConfigRepository
 from src.user.utils import auth_utils
 from src.user.utils.auth_utils import jwt_validation_required
 
-case_blueprint = Blueprint("case", __name__)
+# CLI commands run as `flask cases <command>`
+case_blueprint = Blueprint("case", __name__, cli_group="cases")
+DEFAULT_CASE_REVIEW_BATCH_LIMIT = 50
 visit_occurrence_repository = VisitOccurrenceRepository(db.session)
 concept_repository = ConceptRepository(db.session)
 measurement_repository = MeasurementRepository(db.session)
@@ -25,29 +55,291 @@ drug_exposure_repository = DrugExposureRepository(db.session)
 configuration_repository = DisplayConfigRepository(db.session)
 system_config_repository = SystemConfigRepository(db.session)
 diagose_repository = AnswerRepository(db.session)
-case_service = CaseService(
-    visit_occurrence_repository=visit_occurrence_repository,
-    concept_repository=concept_repository,
-    measurement_repository=measurement_repository,
-    observation_repository=observation_repository,
-    person_repository=person_repository,
-    drug_exposure_repository=drug_exposure_repository,
-    configuration_repository=configuration_repository,
-    system_config_repository=system_config_repository,
-    diagnose_repository=diagose_repository,
+case_tree_repository = CaseTreeCacheRepository(db.session)
+case_progress_repository = CaseProgressRepository(db.session)
+# One concept-name cache per worker process, shared by every request.
+concept_name_cache = ConceptNameCache(
+    current_app.config.get("CONCEPT_CACHE_SIZE", DEFAULT_CONCEPT_CACHE_SIZE)
+)
+# Parsed page_config, checked for changes every PAGE_CONFIG_CHECK_SECONDS
+# (every call when unset).
+page_config_cache = SystemConfigCache(
+    "page_config",
+    PageConfig.of,
+    check_interval=current_app.config.get("PAGE_CONFIG_CHECK_SECONDS", 0),
 )
+# Child concepts of the page_config measurement sections, rebuilt per config.
+concept_hierarchy = ConceptHierarchy()
+# Frozen base case trees, shared by every request; pruning never mutates them.
+case_tree_cache = LruCache(
+    current_app.config.get("CASE_TREE_CACHE_SIZE", DEFAULT_CASE_TREE_CACHE_SIZE)
+)
+# Concurrent requests for one missing tree wait for a single load.
+case_tree_loads = Singleflight()
+# With CASE_TREE_BUILD_LOCK, worker processes take turns too (Postgres
+# advisory lock held until the built tree is committed).
+lock_case_tree_builds = current_app.config.get("CASE_TREE_BUILD_LOCK", False)
+# Per-config review overlays on those trees; small, so many more are kept.
+review_overlays = LruCache(
+    current_app.config.get(
+        "REVIEW_OVERLAY_CACHE_SIZE", DEFAULT_REVIEW_OVERLAY_CACHE_SIZE
+    )
+)
+
+
+def get_case_service() -> CaseService:
+    """
+    A new CaseService, one per request.  Repositories and caches are shared
+    by every thread of the worker (the session is scoped to the app context,
+    the caches are locked); the service itself is not.
+    """
+    return CaseService(
+        visit_occurrence_repository=visit_occurrence_repository,
+        concept_repository=concept_repository,
+        measurement_repository=measurement_repository,
+        observation_repository=observation_repository,
+        person_repository=person_repository,
+        drug_exposure_repository=drug_exposure_repository,
+        configuration_repository=configuration_repository,
+        system_config_repository=system_config_repository,
+        diagnose_repository=diagose_repository,
+        concept_name_cache=concept_name_cache,
+        case_tree_repository=case_tree_repository,
+        case_tree_cache=case_tree_cache,
+        case_progress_repository=case_progress_repository,
+        concept_hierarchy=concept_hierarchy,
+        review_overlays=review_overlays,
+        case_tree_loads=case_tree_loads,
+        lock_case_tree_builds=lock_case_tree_builds,
+        page_config_cache=page_config_cache,
+    )
+
+
+def prefetch_case_review(user_email, config_id):
+    case_review = get_case_service().build_case_review(config_id, user_email)
+    # no request around a background build to commit its case_tree_cache write
+    db.session.commit()
+    return case_review
+
+
+# Warms the case GET /api/cases hands out, for GET /api/case-reviews to pick up.
+case_prefetcher = None
+if current_app.config.get("CASE_PREFETCH_ENABLED", False):
+    case_prefetcher = CasePrefetcher(
+        current_app._get_current_object(),
+        prefetch_case_review,
+        max_workers=current_app.config.get(
+            "CASE_PREFETCH_WORKERS", DEFAULT_PREFETCH_WORKERS
+        ),
+        ttl_seconds=current_app.config.get(
+            "CASE_PREFETCH_TTL_SECONDS", DEFAULT_PREFETCH_TTL_SECONDS
+        ),
+    )
+
+
+@case_blueprint.after_request
+def log_concept_name_cache_stats(response):
+    # hit ratio of the shared name cache; a low one means CONCEPT_CACHE_SIZE
+    # is too small for the concepts the cases reference
+    if current_app.logger.isEnabledFor(logging.DEBUG):
+        current_app.logger.debug("concept name cache: %s", concept_name_cache.stats())
+    return response
 
 
 @case_blueprint.route("/case-reviews/<string:case_config_id>", methods=["GET"])
 @jwt_validation_required()
 def get_case_detail(case_config_id):
-    case_review = case_service.get_case_review(case_config_id)
-    return jsonify(ApiResponse.success(case_review)), 200
+    """
+    The case review; with ?lazy=true the values of collapsed section children
+    are left out, to be fetched from the section endpoint when expanded.
+    """
+    lazy = request.args.get("lazy") == "true"
+    case_service = get_case_service()
+    etag = case_service.get_case_review_etag(
+        case_config_id, *(("lazy",) if lazy else ())
+    )
+    unchanged = not_modified(etag)
+    if unchanged is not None:
+        return unchanged
+
+    case_review = None
+    if case_prefetcher is not None:
+        case_review = case_prefetcher.take(
+            auth_utils.get_user_email_from_jwt(), case_config_id
+        )
+    if case_review is None:
+        if lazy:
+            case_review = case_service.get_lazy_case_review(case_config_id)
+        else:
+            case_review = case_service.get_case_review(case_config_id)
+    elif lazy:
+        case_review = fold_collapsed(case_review)
+    response = case_json_response(ApiResponse.success(case_review))
+    return with_validators(response, etag), 200
+
+
+@case_blueprint.route("/case-reviews/<string:case_config_id>/section", methods=["GET"])
+@jwt_validation_required()
+def get_case_review_section(case_config_id):
+    """One child of a review section, e.g. ?section=BACKGROUND&child=Family History."""
+    section_key = request.args.get("section")
+    child_key = request.args.get("child")
+    if not section_key or not child_key:
+        return (
+            jsonify(
+                ApiResponse.fail(
+                    ErrorCode.BAD_REQUEST, "'section' and 'child' are required"
+                )
+            ),
+            400,
+        )
+    case_service = get_case_service()
+    etag = case_service.get_case_review_etag(case_config_id, section_key, child_key)
+    unchanged = not_modified(etag)
+    if unchanged is not None:
+        return unchanged
+
+    node = case_service.get_case_review_section(case_config_id, section_key, child_key)
+    if node is None:
+        return (
+            jsonify(
+                ApiResponse.fail(
+                    ErrorCode.NOT_FOUND, f"No '{child_key}' in '{section_key}'"
+                )
+            ),
+            404,
+        )
+    response = case_json_response(ApiResponse.success(node))
+    return with_validators(response, etag), 200
+
+
+@case_blueprint.route("/case-reviews/batch", methods=["POST"])
+@jwt_validation_required()
+def get_case_details():
+    """
+    Several case reviews in one response, for {"configIds": [...]} (the
+    caller's configs, in that order) or {"next": n} (up to n of the caller's
+    unanswered configs).
+    """
+    body = request.get_json(silent=True) or {}
+    limit = current_app.config.get(
+        "CASE_REVIEW_BATCH_LIMIT", DEFAULT_CASE_REVIEW_BATCH_LIMIT
+    )
+    config_ids = body.get("configIds")
+    count = body.get("next")
+    if config_ids is not None:
+        if (
+            not isinstance(config_ids, list)
+            or not config_ids
+            or not all(isinstance(config_id, str) for config_id in config_ids)
+        ):
+            return (
+                jsonify(
+                    ApiResponse.fail(
+                        ErrorCode.BAD_REQUEST,
+                        "'configIds' must be a non-empty array of strings",
+                    )
+                ),
+                400,
+            )
+        if len(config_ids) > limit:
+            return (
+                jsonify(
+                    ApiResponse.fail(
+                        ErrorCode.BAD_REQUEST,
+                        f"At most {limit} case reviews per request",
+                    )
+                ),
+                400,
+            )
+    elif not isinstance(count, int) or isinstance(count, bool) or count < 1:
+        return (
+            jsonify(
+                ApiResponse.fail(
+                    ErrorCode.BAD_REQUEST,
+                    "'configIds' array or positive 'next' count is required",
+                )
+            ),
+            400,
+        )
+
+    user_email = auth_utils.get_user_email_from_jwt()
+    if config_ids is not None:
+        reviews = get_case_service().get_case_reviews(config_ids, user_email)
+    else:
+        reviews = get_case_service().get_next_case_reviews(
+            min(count, limit), user_email
+        )
+    return (
+        case_json_response(
+            ApiResponse.success(
+                [
+                    {"configId": config_id, "review": case_review}
+                    for config_id, case_review in reviews
+                ]
+            )
+        ),
+        200,
+    )
 
 
 @case_blueprint.route("/cases", methods=["GET"])
 @jwt_validation_required()
 def get_cases_by_user():
     user_email = auth_utils.get_user_email_from_jwt()
-    summaries = case_service.get_cases_by_user(user_email)
-    return jsonify(ApiResponse.success(summaries)), 200
+    summaries = get_case_service().get_cases_by_user(user_email)
+    if case_prefetcher is not None and summaries:
+        case_prefetcher.submit(user_email, summaries[0].config_id)
+    return case_json_response(ApiResponse.success(summaries)), 200
+
+
+@case_blueprint.cli.command("warm")
+@click.option(
+    "--workers",
+    type=click.IntRange(min=0),
+    default=os.cpu_count(),
+    show_default=True,
+    help="Processes building trees; 0 builds in this process.",
+)
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=DEFAULT_CHUNK_SIZE,
+    show_default=True,
+    help="Cases loaded and stored per batch.",
+)
+@click.option("--force", is_flag=True, help="Rebuild trees that are already stored.")
+def warm_cases(workers, chunk_size, force):
+    """Store the case tree of every assigned case and check each review."""
+
+    def report(phase: str, progress: WarmupProgress):
+        if phase == "trees":
+            done = progress.trees_cached + progress.trees_built
+            click.echo(
+                f"trees {done}/{progress.cases} "
+                f"({progress.trees_per_second:.1f} trees/s)"
+            )
+        else:
+            checked = progress.reviews_checked + len(progress.failed_configurations)
+            click.echo(f"reviews checked {checked}/{progress.configurations}")
+
+    progress = warm_case_caches(
+        current_app._get_current_object(),
+        get_case_service(),
+        case_tree_repository,
+        db.session,
+        workers=workers,
+        chunk_size=chunk_size,
+        force=force,
+        report=report,
+    )
+    click.echo(
+        f"{progress.cases} cases: {progress.trees_built} trees built, "
+        f"{progress.trees_cached} already stored, {progress.reviews_checked} reviews "
+        f"checked in {progress.elapsed:.1f} s"
+    )
+    if progress.failed_configurations:
+        raise click.ClickException(
+            f"{len(progress.failed_configurations)} reviews failed: "
+            + ", ".join(progress.failed_configurations)
+        )
@@ -0,0 +1,140 @@
+"""
+Compact JSON for case responses, written chunk by chunk from the known
+shapes instead of going through dataclasses.asdict and the generic encoder.
+The bytes are the ones jsonify produces outside debug mode (sorted keys,
+compact separators, ASCII-escaped strings, trailing newline).
+"""
+
+from json import dumps
+from json.encoder import encode_basestring_ascii as quote
+from types import MappingProxyType
+
+from flask import Response
+
+from src.cases.controller.response.case_summary import CaseSummary
+from src.cases.model.case import Case, FrozenTreeNode, TreeNode, TreeNodeView
+from src.common.model.ApiResponse import ApiResponse, Error
+
+
+def _write_str(value: str, out: list[str]):
+    out.append(quote(value))
+
+
+def _write_null(value, out: list[str]):
+    out.append("null")
+
+
+def _write_scalar(value, out: list[str]):
+    # bool, int, float: rare leaves (style flags, case ids)
+    out.append(dumps(value))
+
+
+def _write_list(values, out: list[str]):
+    out.append("[")
+    for i, value in enumerate(values):
+        if i:
+            out.append(",")
+        _write(value, out)
+    out.append("]")
+
+
+def _write_dict(value, out: list[str]):
+    out.append("{")
+    for i, key in enumerate(sorted(value)):
+        if i:
+            out.append(",")
+        out.append(quote(key))
+        out.append(":")
+        _write(value[key], out)
+    out.append("}")
+
+
+def _write_node(node, out: list[str]):
+    out.append('{"key":')
+    out.append(quote(node.key))
+    out.append(',"style":')
+    _write(node.style, out)
+    out.append(',"values":')
+    _write(node.values, out)
+    out.append("}")
+
+
+def _write_case(case: Case, out: list[str]):
+    out.append('{"caseNumber":')
+    out.append(quote(case.caseNumber))
+    out.append(',"details":')
+    _write_list(case.details, out)
+    out.append(',"importantInfos":')
+    _write_list(case.importantInfos, out)
+    out.append(',"personName":')
+    _write(case.personName, out)
+    out.append("}")
+
+
+def _write_case_summary(summary: CaseSummary, out: list[str]):
+    out.append('{"age":')
+    _write(summary.age, out)
+    out.append(',"case_id":')
+    _write(summary.case_id, out)
+    out.append(',"config_id":')
+    _write(summary.config_id, out)
+    out.append(',"gender":')
+    _write(summary.gender, out)
+    out.append(',"patient_chief_complaint":')
+    _write(summary.patient_chief_complaint, out)
+    out.append("}")
+
+
+def _write_error(error: Error, out: list[str]):
+    out.append('{"code":')
+    _write(error.code, out)
+    out.append(',"message":')
+    _write(error.message, out)
+    out.append("}")
+
+
+def _write_api_response(response: ApiResponse, out: list[str]):
+    out.append('{"data":')
+    _write(response.data, out)
+    out.append(',"error":')
+    _write(response.error, out)
+    out.append("}")
+
+
+_WRITERS = {
+    str: _write_str,
+    type(None): _write_null,
+    bool: _write_scalar,
+    int: _write_scalar,
+    float: _write_scalar,
+    list: _write_list,
+    tuple: _write_list,
+    dict: _write_dict,
+    MappingProxyType: _write_dict,
+    TreeNode: _write_node,
+    FrozenTreeNode: _write_node,
+    TreeNodeView: _write_node,
+    Case: _write_case,
+    CaseSummary: _write_case_summary,
+    Error: _write_error,
+    ApiResponse: _write_api_response,
+}
+
+
+def _write(value, out: list[str]):
+    writer = _WRITERS.get(type(value))
+    if writer is None:
+        raise TypeError(f"Cannot serialize {type(value).__name__} as case JSON")
+    writer(value, out)
+
+
+def dumps_case_json(value) -> bytes:
+    out: list[str] = []
+    _write(value, out)
+    out.append("\n")
+    return "".join(out).encode("ascii")
+
+
+def case_json_response(api_response: ApiResponse) -> Response:
+    """jsonify(api_response) for payloads made of Case, TreeNode and CaseSummary."""
+    return Response(dumps_case_json(api_response), mimetype="application/json")
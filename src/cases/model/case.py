@@ -1,7 +1,14 @@
 from dataclasses import dataclass
+from types import MappingProxyType
 
 
-@dataclass
+def _value_to_dict(value):
+    if isinstance(value, (list, tuple)):
+        return [v.to_dict() if hasattr(v, "to_dict") else v for v in value]
+    return value
+
+
+@dataclass(slots=True)
 class TreeNode:
     key: str
     values: str | list | None
@@ -10,10 +17,115 @@ class TreeNode:
     def add_node(self, children):
         self.values.append(children)
 
+    def to_dict(self) -> dict:
+        return {
+            "key": self.key,
+            "values": _value_to_dict(self.values),
+            "style": self.style,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TreeNode":
+        values = data["values"]
+        if isinstance(values, list):
+            values = [cls.from_dict(v) if isinstance(v, dict) else v for v in values]
+        return cls(data["key"], values, data.get("style"))
+
+    def freeze(self) -> "FrozenTreeNode":
+        values = self.values
+        if isinstance(values, list):
+            values = tuple(v.freeze() if isinstance(v, TreeNode) else v for v in values)
+        style = None if self.style is None else MappingProxyType(dict(self.style))
+        return FrozenTreeNode(self.key, values, style)
+
+
+@dataclass(frozen=True, eq=False, slots=True)
+class FrozenTreeNode:
+    """
+    Read-only TreeNode.  Base case trees are frozen once built so a single
+    instance can be shared by every request and user; per-config changes go
+    into a TreeNodeView instead.
+    """
+
+    key: str
+    values: str | tuple | None
+    style: MappingProxyType | None = None
+
+    def to_dict(self) -> dict:
+        return {
+            "key": self.key,
+            "values": _value_to_dict(self.values),
+            "style": None if self.style is None else dict(self.style),
+        }
+
+    def __eq__(self, other):
+        if not hasattr(other, "to_dict"):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __hash__(self):
+        return hash((self.key, self.values))
+
+
+_INHERIT = object()
 
-@dataclass
+
+class TreeNodeView:
+    """
+    Copy-on-write overlay on a FrozenTreeNode: only the overridden key, values
+    or style are stored, everything else is read through from the base node.
+    """
+
+    __slots__ = ("base", "_key", "_values", "_style")
+
+    def __init__(self, base, key=_INHERIT, values=_INHERIT, style=_INHERIT):
+        self.base = base
+        self._key = key
+        self._values = values
+        self._style = style
+
+    @property
+    def key(self) -> str:
+        return self.base.key if self._key is _INHERIT else self._key
+
+    @property
+    def values(self):
+        return self.base.values if self._values is _INHERIT else self._values
+
+    @property
+    def style(self):
+        return self.base.style if self._style is _INHERIT else self._style
+
+    def to_dict(self) -> dict:
+        style = self.style
+        return {
+            "key": self.key,
+            "values": _value_to_dict(self.values),
+            "style": None if style is None else dict(style),
+        }
+
+    def __eq__(self, other):
+        if not hasattr(other, "to_dict"):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"TreeNodeView(key={self.key!r}, values={self.values!r}, style={self.style!r})"
+
+
+@dataclass(slots=True)
 class Case:
     personName: str
     caseNumber: str
     details: list[TreeNode]
     importantInfos: list[TreeNode]
+
+    def to_dict(self) -> dict:
+        return {
+            "personName": self.personName,
+            "caseNumber": self.caseNumber,
+            "details": [node.to_dict() for node in self.details],
+            "importantInfos": [node.to_dict() for node in self.importantInfos],
+        }
@@ -0,0 +1,24 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, String
+
+from src import db
+
+
+class CaseProgress(db.Model):
+    """
+    Per-user cursor on the next unanswered display_config.  It is advanced when
+    an answer is submitted and re-validated on read, so a stale cursor (configs
+    re-uploaded, answers imported) only costs one extra query.  A NULL
+    next_config_id means the user had nothing left to answer.
+    """
+
+    __tablename__ = "case_progress"
+
+    user_email = Column(String(128), primary_key=True)
+    next_config_id = Column(String, nullable=True)
+    modified_timestamp = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
@@ -0,0 +1,23 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, Integer, String
+
+from src import db
+
+
+class CaseTreeCache(db.Model):
+    """
+    Unpruned case tree (the output of CaseService.get_case_detail) serialized
+    as JSON.  OMOP data is immutable after ingest, so an entry only goes stale
+    when page_config changes, which changes page_config_hash.
+    """
+
+    __tablename__ = "case_tree_cache"
+
+    case_id = Column(Integer, primary_key=True)
+    page_config_hash = Column(String(64), primary_key=True)
+    person_name = Column(String, nullable=True)
+    tree = Column(db.JSON, nullable=False)
+    created_timestamp = Column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
@@ -3,6 +3,7 @@ from src import db
 
 class DrugExposure(db.Model):
     __tablename__ = "drug_exposure"
+    __table_args__ = (db.Index("ix_drug_exposure_visit", "visit_occurrence_id"),)
 
     drug_exposure_id = db.Column(db.Integer, primary_key=True, nullable=False)
     person_id = db.Column(db.Integer, db.ForeignKey("person.person_id"), nullable=False)
@@ -3,6 +3,13 @@ from src import db
 
 class Measurement(db.Model):
     __tablename__ = "measurement"
+    __table_args__ = (
+        db.Index(
+            "ix_measurement_visit_concept",
+            "visit_occurrence_id",
+            "measurement_concept_id",
+        ),
+    )
 
     measurement_id = db.Column(db.Integer, primary_key=True, nullable=False)
     person_id = db.Column(db.Integer, db.ForeignKey("person.person_id"), nullable=False)
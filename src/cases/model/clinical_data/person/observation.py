@@ -3,6 +3,18 @@ from src import db
 
 class Observation(db.Model):
     __tablename__ = "observation"
+    __table_args__ = (
+        db.Index(
+            "ix_observation_visit_concept",
+            "visit_occurrence_id",
+            "observation_concept_id",
+        ),
+        db.Index(
+            "ix_observation_visit_type",
+            "visit_occurrence_id",
+            "observation_type_concept_id",
+        ),
+    )
 
     observation_id = db.Column(db.Integer, primary_key=True, nullable=False)
     person_id = db.Column(db.Integer, db.ForeignKey("person.person_id"), nullable=False)
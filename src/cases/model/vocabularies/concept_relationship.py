@@ -3,6 +3,13 @@ from src import db
 
 class ConceptRelationship(db.Model):
     __tablename__ = "concept_relationship"
+    __table_args__ = (
+        db.Index(
+            "ix_concept_relationship_concept_1_relationship",
+            "concept_id_1",
+            "relationship_id",
+        ),
+    )
 
     concept_id_1 = db.Column(
         db.Integer,
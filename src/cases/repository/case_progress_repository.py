@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+
+from sqlalchemy.dialects.postgresql import insert
+
+from src.cases.model.case_progress import CaseProgress
+
+
+class CaseProgressRepository:
+    def __init__(self, session):
+        self.session = session
+
+    def get_progress(self, user_email: str) -> CaseProgress | None:
+        return self.session.get(CaseProgress, user_email)
+
+    def save_progress(self, user_email: str, next_config_id: str | None) -> None:
+        now = datetime.now(timezone.utc)
+        self.session.execute(
+            insert(CaseProgress)
+            .values(
+                user_email=user_email,
+                next_config_id=next_config_id,
+                modified_timestamp=now,
+            )
+            .on_conflict_do_update(
+                index_elements=["user_email"],
+                set_=dict(next_config_id=next_config_id, modified_timestamp=now),
+            )
+        )
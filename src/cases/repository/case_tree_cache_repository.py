@@ -0,0 +1,108 @@
+import hashlib
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.cases.model.case_tree_cache import CaseTreeCache
+
+
+def case_tree_lock_key(case_id: int, page_config_hash: str) -> int:
+    """A signed 64-bit advisory lock key for the tree of case_id."""
+    digest = hashlib.blake2b(
+        f"case_tree:{case_id}:{page_config_hash}".encode(), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+class CaseTreeCacheRepository:
+    def __init__(self, session):
+        self.session = session
+
+    def get_case_tree(self, case_id: int, page_config_hash: str) -> CaseTreeCache:
+        return self.session.get(CaseTreeCache, (case_id, page_config_hash))
+
+    def get_case_trees(self, case_ids, page_config_hash: str) -> list[CaseTreeCache]:
+        statement = select(CaseTreeCache).where(
+            CaseTreeCache.case_id.in_(case_ids),
+            CaseTreeCache.page_config_hash == page_config_hash,
+        )
+        return self.session.execute(statement).scalars().all()
+
+    def get_cached_case_ids(self, case_ids, page_config_hash: str) -> set[int]:
+        """The case_ids among ``case_ids`` with a tree for page_config_hash."""
+        statement = select(CaseTreeCache.case_id).where(
+            CaseTreeCache.case_id.in_(case_ids),
+            CaseTreeCache.page_config_hash == page_config_hash,
+        )
+        return set(self.session.execute(statement).scalars())
+
+    def lock_case_tree(self, case_id: int, page_config_hash: str) -> None:
+        """
+        Wait for and take a transaction-scoped advisory lock on the tree of
+        (case_id, page_config_hash), so builders in other connections take
+        turns; it is released at commit or rollback.
+        """
+        lock_key = case_tree_lock_key(case_id, page_config_hash)
+        self.session.execute(select(func.pg_advisory_xact_lock(lock_key)))
+
+    def save_case_tree(
+        self, case_id: int, page_config_hash: str, person_name: str, tree: list
+    ) -> None:
+        """
+        Upsert the tree for (case_id, page_config_hash) and drop the entries
+        built for any previous page_config.  ON CONFLICT keeps concurrent
+        builders of the same case from failing each other.
+        """
+        self.session.execute(
+            delete(CaseTreeCache).where(
+                CaseTreeCache.case_id == case_id,
+                CaseTreeCache.page_config_hash != page_config_hash,
+            )
+        )
+        self.session.execute(
+            insert(CaseTreeCache)
+            .values(
+                case_id=case_id,
+                page_config_hash=page_config_hash,
+                person_name=person_name,
+                tree=tree,
+            )
+            .on_conflict_do_update(
+                index_elements=["case_id", "page_config_hash"],
+                set_=dict(person_name=person_name, tree=tree),
+            )
+        )
+
+    def save_case_trees(self, page_config_hash: str, trees: dict) -> None:
+        """
+        save_case_tree for many cases in two statements; ``trees`` maps
+        case_id -> (person_name, tree).
+        """
+        if not trees:
+            return
+        self.session.execute(
+            delete(CaseTreeCache).where(
+                CaseTreeCache.case_id.in_(trees),
+                CaseTreeCache.page_config_hash != page_config_hash,
+            )
+        )
+        statement = insert(CaseTreeCache).values(
+            [
+                dict(
+                    case_id=case_id,
+                    page_config_hash=page_config_hash,
+                    person_name=person_name,
+                    tree=tree,
+                )
+                for case_id, (person_name, tree) in trees.items()
+            ]
+        )
+        self.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=["case_id", "page_config_hash"],
+                set_=dict(
+                    person_name=statement.excluded.person_name,
+                    tree=statement.excluded.tree,
+                ),
+            )
+        )
@@ -1,4 +1,9 @@
+from typing import Iterable
+
+from sqlalchemy import select
+
 from src.cases.model.vocabularies.concept import Concept
+from src.cases.model.vocabularies.concept_relationship import ConceptRelationship
 
 
 class ConceptRepository:
@@ -7,3 +12,21 @@ class ConceptRepository:
 
     def get_concept(self, concept_id: int) -> Concept:
         return self.session.get(Concept, concept_id)
+
+    def get_concept_names(self, concept_ids: Iterable[int]) -> dict[int, str]:
+        statement = select(Concept.concept_id, Concept.concept_name).where(
+            Concept.concept_id.in_(list(concept_ids))
+        )
+        return dict(self.session.execute(statement).all())
+
+    def get_concept_relationships(
+        self, parent_concept_ids: Iterable[int], relationship_ids: list[str]
+    ) -> list[tuple[int, int]]:
+        """(concept_id_1, concept_id_2) pairs, one per matching relationship row."""
+        statement = select(
+            ConceptRelationship.concept_id_1, ConceptRelationship.concept_id_2
+        ).where(
+            ConceptRelationship.concept_id_1.in_(list(parent_concept_ids)),
+            ConceptRelationship.relationship_id.in_(relationship_ids),
+        )
+        return [tuple(row) for row in self.session.execute(statement).all()]
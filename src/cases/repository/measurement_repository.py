@@ -1,38 +1,65 @@
+from decimal import Decimal
+from typing import NamedTuple
+
 from sqlalchemy import select
 
 from src.cases.model.clinical_data.person.measurement import Measurement
-from src.cases.model.vocabularies.concept_relationship import ConceptRelationship
+
+PARENT_RELATIONSHIP_IDS = ["Subsumes", "Is characterized by"]
+
+
+class MeasurementRow(NamedTuple):
+    """The columns of a measurement that case trees are built from."""
+
+    visit_occurrence_id: int | None
+    measurement_concept_id: int
+    value_as_number: Decimal | None
+    value_as_concept_id: int | None
+    unit_source_value: str | None
+    unit_concept_id: int | None
+    operator_concept_id: int | None
+
+
+MEASUREMENT_ROW_COLUMNS = [
+    getattr(Measurement, field) for field in MeasurementRow._fields
+]
 
 
 class MeasurementRepository:
     def __init__(self, session):
         self.session = session
 
-    def get_measurements(self, visit_id: int, concept_ids):
+    def get_measurements_by_visit(self, visit_id: int) -> list[MeasurementRow]:
         statement = (
-            select(Measurement)
-            .select_from(Measurement)
-            .where(
-                Measurement.measurement_concept_id.in_(concept_ids),
-                Measurement.visit_occurrence_id == visit_id,
-            )
+            select(*MEASUREMENT_ROW_COLUMNS)
+            .where(Measurement.visit_occurrence_id == visit_id)
+            .order_by(Measurement.measurement_id)
         )
-        return self.session.execute(statement).scalars().all()
+        return self.__rows(statement)
 
-    def get_measurements_of_parents(self, visit_id: int, parent_concept_ids):
+    def get_measurements_of_concepts(
+        self, visit_id: int, concept_ids
+    ) -> list[MeasurementRow]:
         statement = (
-            select(Measurement)
-            .select_from(Measurement)
-            .join(
-                ConceptRelationship,
-                Measurement.measurement_concept_id == ConceptRelationship.concept_id_2,
-            )
+            select(*MEASUREMENT_ROW_COLUMNS)
             .where(
                 Measurement.visit_occurrence_id == visit_id,
-                ConceptRelationship.concept_id_1.in_(parent_concept_ids),
-                ConceptRelationship.relationship_id.in_(
-                    ["Subsumes", "Is characterized by"]
-                ),
+                Measurement.measurement_concept_id.in_(concept_ids),
             )
+            .order_by(Measurement.measurement_id)
         )
-        return self.session.execute(statement).scalars().all()
+        return self.__rows(statement)
+
+    def get_measurements_by_visits(self, visit_ids) -> list[MeasurementRow]:
+        # grouped by visit, so callers split the rows in one pass
+        statement = (
+            select(*MEASUREMENT_ROW_COLUMNS)
+            .where(Measurement.visit_occurrence_id.in_(visit_ids))
+            .order_by(Measurement.visit_occurrence_id, Measurement.measurement_id)
+        )
+        return self.__rows(statement)
+
+    def __rows(self, statement) -> list[MeasurementRow]:
+        # plain tuples: no entities, no identity map, only the columns used
+        result = self.session.execute(statement).tuples()
+        return list(map(MeasurementRow._make, result))
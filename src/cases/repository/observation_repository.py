@@ -1,8 +1,30 @@
-from sqlalchemy import select
+from decimal import Decimal
+from typing import NamedTuple
+
+from sqlalchemy import or_, select
 
 from src.cases.model.clinical_data.person.observation import Observation
 
 
+class ObservationRow(NamedTuple):
+    """The columns of an observation that case trees are built from."""
+
+    visit_occurrence_id: int | None
+    observation_concept_id: int
+    observation_type_concept_id: int
+    value_as_string: str | None
+    value_as_number: Decimal | None
+    value_as_concept_id: int | None
+    unit_source_value: str | None
+    unit_concept_id: int | None
+    qualifier_concept_id: int | None
+
+
+OBSERVATION_ROW_COLUMNS = [
+    getattr(Observation, field) for field in ObservationRow._fields
+]
+
+
 class ObservationRepository:
     def __init__(self, session):
         self.session = session
@@ -28,3 +50,64 @@ class ObservationRepository:
             )
         )
         return self.session.execute(statement).scalars().all()
+
+    def get_observations_by_visit(self, visit_id: int) -> list[ObservationRow]:
+        statement = (
+            select(*OBSERVATION_ROW_COLUMNS)
+            .where(Observation.visit_occurrence_id == visit_id)
+            .order_by(Observation.observation_id)
+        )
+        return self.__rows(statement)
+
+    def get_observations_of_concepts(
+        self, visit_id: int, concept_ids, type_ids
+    ) -> list[ObservationRow]:
+        """Rows of the visit with one of concept_ids or one of type_ids."""
+        statement = (
+            select(*OBSERVATION_ROW_COLUMNS)
+            .where(
+                Observation.visit_occurrence_id == visit_id,
+                or_(
+                    Observation.observation_concept_id.in_(concept_ids),
+                    Observation.observation_type_concept_id.in_(type_ids),
+                ),
+            )
+            .order_by(Observation.observation_id)
+        )
+        return self.__rows(statement)
+
+    def get_valued_observation_concepts(self, visit_id: int, concept_ids) -> set[int]:
+        """
+        Those of concept_ids the visit has an observation with a value for,
+        i.e. one that renders to a non-empty value in a case tree; no rows
+        are loaded.
+        """
+        statement = (
+            select(Observation.observation_concept_id)
+            .distinct()
+            .where(
+                Observation.visit_occurrence_id == visit_id,
+                Observation.observation_concept_id.in_(concept_ids),
+                or_(
+                    Observation.value_as_string != "",
+                    Observation.value_as_number != 0,
+                    Observation.value_as_concept_id != 0,
+                    Observation.unit_source_value != "",
+                ),
+            )
+        )
+        return set(self.session.execute(statement).scalars())
+
+    def get_observations_by_visits(self, visit_ids) -> list[ObservationRow]:
+        # grouped by visit, so callers split the rows in one pass
+        statement = (
+            select(*OBSERVATION_ROW_COLUMNS)
+            .where(Observation.visit_occurrence_id.in_(visit_ids))
+            .order_by(Observation.visit_occurrence_id, Observation.observation_id)
+        )
+        return self.__rows(statement)
+
+    def __rows(self, statement) -> list[ObservationRow]:
+        # plain tuples: no entities, no identity map, only the columns used
+        result = self.session.execute(statement).tuples()
+        return list(map(ObservationRow._make, result))
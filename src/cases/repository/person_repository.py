@@ -1,9 +1,29 @@
+from typing import NamedTuple
+
+from sqlalchemy import select
+
 from src.cases.model.clinical_data.person.person import Person
 
 
+class PersonRow(NamedTuple):
+    """The demographics of a person that case trees are built from."""
+
+    person_id: int
+    gender_concept_id: int
+    year_of_birth: int
+    person_source_value: str | None
+
+
+PERSON_ROW_COLUMNS = [getattr(Person, field) for field in PersonRow._fields]
+
+
 class PersonRepository:
     def __init__(self, session):
         self.session = session
 
     def get_person(self, person_id: int):
         return self.session.get(Person, person_id)
+
+    def get_persons(self, person_ids) -> list[PersonRow]:
+        statement = select(*PERSON_ROW_COLUMNS).where(Person.person_id.in_(person_ids))
+        return list(map(PersonRow._make, self.session.execute(statement).tuples()))
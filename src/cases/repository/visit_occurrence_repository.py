@@ -1,9 +1,31 @@
+from datetime import date
+from typing import NamedTuple
+
+from sqlalchemy import select
+
 from src.cases.model.clinical_data.person.visit_occurrence import VisitOccurrence
 
 
+class VisitRow(NamedTuple):
+    """The columns of a visit that case trees are built from."""
+
+    visit_occurrence_id: int
+    person_id: int
+    visit_start_date: date
+
+
+VISIT_ROW_COLUMNS = [getattr(VisitOccurrence, field) for field in VisitRow._fields]
+
+
 class VisitOccurrenceRepository:
     def __init__(self, session):
         self.session = session
 
     def get_visit_occurrence(self, visit_id: int):
         return self.session.get(VisitOccurrence, visit_id)
+
+    def get_visit_occurrences(self, visit_ids) -> list[VisitRow]:
+        statement = select(*VISIT_ROW_COLUMNS).where(
+            VisitOccurrence.visit_occurrence_id.in_(visit_ids)
+        )
+        return list(map(VisitRow._make, self.session.execute(statement).tuples()))
@@ -0,0 +1,103 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+from src.cases.model.case import Case
+
+DEFAULT_PREFETCH_WORKERS = 2
+DEFAULT_PREFETCH_TTL_SECONDS = 60
+
+
+class PrefetchedReviews:
+    """
+    One prefetched case review per user, kept for ttl_seconds.  A slot is
+    handed out once; dropping it also discards a build still in flight.
+    """
+
+    def __init__(self, ttl_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._slots: dict[str, tuple[str, Case, float]] = {}
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def generation(self, user_email: str) -> int:
+        with self._lock:
+            return self._generations.get(user_email, 0)
+
+    def put(self, user_email: str, config_id: str, case: Case, generation: int) -> bool:
+        """Fill the slot unless it was dropped since ``generation`` was read."""
+        with self._lock:
+            if self._generations.get(user_email, 0) != generation:
+                return False
+            self._slots[user_email] = (config_id, case, self.clock() + self.ttl_seconds)
+            return True
+
+    def take(self, user_email: str, config_id: str) -> Case | None:
+        with self._lock:
+            slot = self._slots.get(user_email)
+            if slot is None or slot[0] != config_id:
+                return None
+            del self._slots[user_email]
+        _, case, expires_at = slot
+        return case if self.clock() < expires_at else None
+
+    def drop(self, user_email: str) -> None:
+        with self._lock:
+            self._slots.pop(user_email, None)
+            self._generations[user_email] = self._generations.get(user_email, 0) + 1
+
+
+class CasePrefetcher:
+    """
+    Builds a user's next case review on a bounded thread pool so it is ready
+    when the review is opened.  ``build(user_email, config_id)`` runs inside
+    an app context of ``app`` and must do its own access check.
+    """
+
+    def __init__(
+        self,
+        app,
+        build: Callable[[str, str], Case],
+        max_workers: int = DEFAULT_PREFETCH_WORKERS,
+        ttl_seconds: float = DEFAULT_PREFETCH_TTL_SECONDS,
+    ):
+        self.app = app
+        self.build = build
+        self.reviews = PrefetchedReviews(ttl_seconds)
+        # threads start on the first submit, i.e. after gunicorn has forked
+        self._executor = ThreadPoolExecutor(
+            max_workers, thread_name_prefix="case-prefetch"
+        )
+        self._pending: set[tuple[str, str]] = set()
+        self._lock = threading.Lock()
+
+    def submit(self, user_email: str, config_id: str) -> Future | None:
+        """Queue a build unless the same one is already queued or running."""
+        key = (user_email, config_id)
+        with self._lock:
+            if key in self._pending:
+                return None
+            self._pending.add(key)
+        generation = self.reviews.generation(user_email)
+        return self._executor.submit(self._prefetch, key, generation)
+
+    def take(self, user_email: str, config_id: str) -> Case | None:
+        return self.reviews.take(user_email, config_id)
+
+    def drop(self, user_email: str) -> None:
+        self.reviews.drop(user_email)
+
+    def _prefetch(self, key: tuple[str, str], generation: int) -> None:
+        user_email, config_id = key
+        try:
+            with self.app.app_context():
+                case = self.build(user_email, config_id)
+            self.reviews.put(user_email, config_id, case, generation)
+        except Exception:
+            # the review is simply built on demand instead
+            self.app.logger.exception("Prefetching case review %s failed", config_id)
+        finally:
+            with self._lock:
+                self._pending.discard(key)
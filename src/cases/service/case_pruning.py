@@ -0,0 +1,152 @@
+"""
+Single-pass pruning of a shared case tree against a compiled path_config.
+
+What happens to each top-level section is declared in SECTION_RULES; sections
+without a rule are passed through untouched, so a new page_config section
+needs no code here.  Changes are recorded on TreeNodeViews, never on the base
+tree, and every node is visited once.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+from src.cases.model.case import Case, TreeNodeView
+from src.user.utils.path_trie import find_parent
+
+BMI_CENTILE = "BMI (body mass index) centile"
+BMI_RANGE = "BMI (body mass index) range"
+
+
+@dataclass(frozen=True)
+class SectionRule:
+    # children passed through as built, whatever path_config says
+    always_keep: frozenset[str] = frozenset()
+    # filter each child's leaves to those configured under "<section>.<child>"
+    # and apply the merged style; children without entries are emptied
+    keep_leaves_by_path: bool = False
+    # once path_config names anything under the section, keep only the
+    # children it names
+    keep_children_by_path: bool = False
+    # children hidden unless path_config names them
+    default_hidden: frozenset[str] = frozenset()
+    renames: Mapping[str, str] = field(default_factory=dict)
+    drop_if_empty: bool = False
+
+
+SECTION_RULES: Mapping[str, SectionRule] = MappingProxyType(
+    {
+        "BACKGROUND": SectionRule(
+            always_keep=frozenset({"Patient Demographics"}),
+            keep_leaves_by_path=True,
+        ),
+        "PHYSICAL EXAMINATION": SectionRule(
+            keep_children_by_path=True,
+            default_hidden=frozenset({BMI_CENTILE}),
+            renames=MappingProxyType({BMI_CENTILE: BMI_RANGE}),
+            drop_if_empty=True,
+        ),
+    }
+)
+
+
+def prune_case_tree(
+    case_details, path_trie: dict, rules: Mapping[str, SectionRule] = SECTION_RULES
+) -> tuple[list, list[dict]]:
+    """
+    (pruned sections, important infos).  Important infos are the children
+    whose merged style has a "top" weight, in tree order.
+    """
+    important_infos: list[dict] = []
+    pruned = []
+    for section in case_details:
+        rule = rules.get(section.key)
+        if rule is not None:
+            section = prune_section(section, rule, path_trie, important_infos)
+            if section is None:
+                continue
+        pruned.append(section)
+    return pruned, important_infos
+
+
+def prune_section(section, rule: SectionRule, path_trie: dict, important_infos):
+    configured = path_trie["section_keep"].get(section.key)
+    configured = None if configured is None else set(configured)
+    children = []
+    for child in section.values:
+        key = child.key
+        if key in rule.always_keep:
+            children.append(child)
+            continue
+
+        if rule.keep_children_by_path and configured is not None:
+            if key not in configured:
+                continue
+        elif key in rule.default_hidden:
+            if configured is None or key not in configured:
+                continue
+
+        if rule.keep_leaves_by_path:
+            child = prune_leaves(section.key, child, path_trie, important_infos)
+        if key in rule.renames:
+            child = TreeNodeView(child, key=rule.renames[key])
+        children.append(child)
+
+    if rule.drop_if_empty and not children:
+        return None
+    return TreeNodeView(section, values=children)
+
+
+def prune_leaves(section_key: str, child, path_trie: dict, important_infos):
+    node = find_parent(path_trie, [section_key, *child.key.split(".")])
+    if node is None:
+        return TreeNodeView(child, values=[])
+    keep = set(node["keep"])
+    kept_values = [v for v in child.values if v in keep]
+    style = dict(node["style"])
+    if style.get("top") is not None:
+        important_infos.append(
+            {"key": child.key, "values": kept_values, "weight": style["top"]}
+        )
+    return TreeNodeView(child, values=kept_values, style=style)
+
+
+def is_collapsed(node) -> bool:
+    style = getattr(node, "style", None)
+    return bool(style) and style.get("collapse") is True
+
+
+def folded_children(path_trie: dict, section_key: str, child_keys) -> list[str]:
+    """
+    Those of child_keys that prune_leaves styles collapsed without a "top"
+    weight, i.e. whose values fold_collapsed leaves out and which add nothing
+    to the important infos.
+    """
+    folded = []
+    for key in child_keys:
+        node = find_parent(path_trie, [section_key, *key.split(".")])
+        style = {} if node is None else node["style"]
+        if style.get("collapse") is True and style.get("top") is None:
+            folded.append(key)
+    return folded
+
+
+def fold_collapsed(case: Case) -> Case:
+    """
+    The review with the values of every collapsed section child left out
+    (None), for clients that fetch a child when it is expanded.  Important
+    infos are kept whole.
+    """
+    details = []
+    for section in case.details:
+        children = section.values
+        if isinstance(children, (list, tuple)) and any(map(is_collapsed, children)):
+            section = TreeNodeView(
+                section,
+                values=[
+                    TreeNodeView(child, values=None) if is_collapsed(child) else child
+                    for child in children
+                ],
+            )
+        details.append(section)
+    return Case(case.personName, case.caseNumber, details, case.importantInfos)
@@ -0,0 +1,47 @@
+import heapq
+from collections import defaultdict
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Callable, Iterable
+
+_position = itemgetter(0)
+
+
+class RowIndex:
+    """
+    OMOP rows of one visit, indexed by a concept-id column.
+
+    ``select`` answers the same question as a ``WHERE column IN (...)`` query
+    against the visit, returning rows in their original (table) order.
+    """
+
+    def __init__(self, rows: Iterable, key: Callable):
+        self._buckets: dict[int, list[tuple[int, object]]] = defaultdict(list)
+        for position, row in enumerate(rows):
+            self._buckets[key(row)].append((position, row))
+
+    def select(self, concept_ids) -> list:
+        if not isinstance(concept_ids, (list, tuple, set)):
+            concept_ids = [concept_ids]
+        buckets = [
+            self._buckets[concept_id]
+            for concept_id in dict.fromkeys(concept_ids)
+            if concept_id in self._buckets
+        ]
+        if len(buckets) == 1:
+            return [row for _, row in buckets[0]]
+        return [row for _, row in heapq.merge(*buckets, key=_position)]
+
+
+@dataclass
+class CaseRows:
+    """Everything read from OMOP for one case, loaded up front in bulk."""
+
+    visit_occurrence: object
+    person: object
+    observations_by_concept: RowIndex
+    observations_by_type: RowIndex
+    measurements_by_concept: RowIndex
+    # parent -> child concept ids prefetched for every measurement section
+    # (batch loads); None makes each build query the ones it needs
+    child_concepts: dict | None = None
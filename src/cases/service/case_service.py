@@ -1,22 +1,68 @@
-from collections import defaultdict
-from operator import itemgetter
+import hashlib
+import json
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from itertools import groupby
+from operator import attrgetter, itemgetter
 
 from src.answer.repository.answer_repository import AnswerRepository
 from src.cases.controller.response.case_summary import CaseSummary
-from src.cases.model.case import Case, TreeNode
+from src.cases.model.case import Case, FrozenTreeNode, TreeNode
+from src.cases.repository.case_progress_repository import CaseProgressRepository
+from src.cases.repository.case_tree_cache_repository import CaseTreeCacheRepository
 from src.cases.repository.concept_repository import ConceptRepository
 from src.cases.repository.drug_exposure_repository import DrugExposureRepository
 from src.cases.repository.measurement_repository import MeasurementRepository
 from src.cases.repository.observation_repository import ObservationRepository
 from src.cases.repository.person_repository import PersonRepository
 from src.cases.repository.visit_occurrence_repository import VisitOccurrenceRepository
+from src.cases.service.case_pruning import (
+    BMI_CENTILE,
+    BMI_RANGE,
+    fold_collapsed,
+    folded_children,
+    prune_case_tree,
+)
+from src.cases.service.case_rows import CaseRows, RowIndex
+from src.cases.service.concept_hierarchy import ConceptHierarchy, load_child_concepts
+from src.cases.service.concept_name_cache import (
+    ConceptNameCache,
+    collect_concept_ids,
+    concept_ids_of_rows,
+)
+from src.cases.service.review_overlay import ReviewOverlay, apply_overlay, overlay_of
+from src.common.cache.lru_cache import LruCache
+from src.common.cache.singleflight import Singleflight
+from src.common.cache.system_config_cache import SystemConfigCache
 from src.common.exception.BusinessException import (
     BusinessException,
     BusinessExceptionEnum,
 )
 from src.common.repository.system_config_repository import SystemConfigRepository
+from src.common.utils.conditional_request import content_etag
 from src.user.repository.display_config_repository import DisplayConfigRepository
 from src.user.utils.auth_utils import get_user_email_from_jwt
+from src.user.utils.path_trie import get_path_trie
+
+OBSERVATION_CONCEPT_FIELDS = (
+    "observation_concept_id",
+    "value_as_concept_id",
+    "unit_concept_id",
+    "qualifier_concept_id",
+)
+MEASUREMENT_CONCEPT_FIELDS = (
+    "measurement_concept_id",
+    "value_as_concept_id",
+    "unit_concept_id",
+    "operator_concept_id",
+)
+DEFAULT_CONCEPT_CACHE_SIZE = 50_000
+DEFAULT_CASE_TREE_CACHE_SIZE = 1_000
+DEFAULT_REVIEW_OVERLAY_CACHE_SIZE = 20_000
+# Bump whenever the shape or content of built case trees or reviews changes,
+# so trees cached by an older release are rebuilt instead of served and
+# clients holding an old review ETag get the new review.
+CASE_TREE_FORMAT_VERSION = 1
 
 
 def group_by(source_list, key_selector):
@@ -26,6 +72,14 @@ def group_by(source_list, key_selector):
     return target_list
 
 
+def split_by_visit(rows) -> dict[int, list]:
+    """Rows sorted by visit_occurrence_id, split into one run per visit."""
+    return {
+        visit_id: list(visit_rows)
+        for visit_id, visit_rows in groupby(rows, attrgetter("visit_occurrence_id"))
+    }
+
+
 def get_value_of_rows(rows: list, get_func) -> str | None | list:
     if len(rows) == 1:
         return get_func(rows[0])
@@ -71,12 +125,99 @@ def attach_style(display_configuration, case_details, important_infos):
             break
 
 
+def select_children(measurements: RowIndex, children_by_parent, parent_concept_ids):
+    """
+    In-memory equivalent of joining the visit's measurements against the
+    parent -> child relationships: a measurement is repeated once per
+    relationship row that links one of ``parent_concept_ids`` to it.
+    """
+    multiplicity = Counter(
+        child_id
+        for parent_id in set(parent_concept_ids)
+        for child_id in children_by_parent.get(parent_id, ())
+    )
+    if not multiplicity:
+        return []
+    return [
+        row
+        for row in measurements.select(list(multiplicity))
+        for _ in range(multiplicity[row.measurement_concept_id])
+    ]
+
+
+def index_case_rows(
+    visit_occurrence, person, observations, measurements, child_concepts=None
+) -> CaseRows:
+    return CaseRows(
+        visit_occurrence=visit_occurrence,
+        person=person,
+        observations_by_concept=RowIndex(
+            observations, attrgetter("observation_concept_id")
+        ),
+        observations_by_type=RowIndex(
+            observations, attrgetter("observation_type_concept_id")
+        ),
+        measurements_by_concept=RowIndex(
+            measurements, attrgetter("measurement_concept_id")
+        ),
+        child_concepts=child_concepts,
+    )
+
+
+def page_config_hash(page_config: dict) -> str:
+    canonical = json.dumps(page_config, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(
+        f"{CASE_TREE_FORMAT_VERSION}:{canonical}".encode()
+    ).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class PageConfig:
+    """page_config with what every build derives from it, computed once."""
+
+    config: dict
+    config_hash: str
+    concept_ids: frozenset[int]
+
+    @classmethod
+    def of(cls, page_config: dict) -> "PageConfig":
+        return cls(
+            page_config,
+            page_config_hash(page_config),
+            frozenset(collect_concept_ids(page_config)),
+        )
+
+
+def select_sections(page_config: dict, section_key, child_key=None) -> dict:
+    """
+    The part of page_config build_case_detail needs for section_key, cut
+    down to child_key when that is one of its entries; {} for a section
+    page_config does not have.
+    """
+    title_config = page_config.get(section_key)
+    if title_config is None:
+        return {}
+    if child_key in title_config:
+        return {section_key: {child_key: title_config[child_key]}}
+    if section_key == "BACKGROUND":
+        # its only child outside page_config, Patient Demographics, is
+        # built from the person alone
+        return {section_key: {}}
+    return {section_key: title_config}
+
+
 def add_if_value_present(data, node):
     if node.values:
         data.append(node)
 
 
 class CaseService:
+    """
+    Builds case trees and reviews.  The service keeps no per-request state:
+    everything a build needs travels in CaseRows and the loaded configuration,
+    so concurrent requests never see each other's patient.
+    """
+
     def __init__(
         self,
         visit_occurrence_repository: VisitOccurrenceRepository,
@@ -88,8 +229,16 @@ class CaseService:
         configuration_repository: DisplayConfigRepository,
         system_config_repository: SystemConfigRepository,
         diagnose_repository: AnswerRepository,
+        concept_name_cache: ConceptNameCache | None = None,
+        case_tree_repository: CaseTreeCacheRepository | None = None,
+        case_tree_cache: LruCache | None = None,
+        case_progress_repository: CaseProgressRepository | None = None,
+        concept_hierarchy: ConceptHierarchy | None = None,
+        review_overlays: LruCache | None = None,
+        case_tree_loads: Singleflight | None = None,
+        lock_case_tree_builds: bool = False,
+        page_config_cache: SystemConfigCache[PageConfig] | None = None,
     ):
-        self.person = None
         self.visit_occurrence_repository = visit_occurrence_repository
         self.concept_repository = concept_repository
         self.measurement_repository = measurement_repository
@@ -99,13 +248,156 @@ class CaseService:
         self.configuration_repository = configuration_repository
         self.system_config_repository = system_config_repository
         self.diagnose_repository = diagnose_repository
+        # Shared across requests when injected by the controller; a private
+        # cache keeps standalone services (scripts, tests) isolated.
+        if concept_name_cache is None:
+            concept_name_cache = ConceptNameCache(DEFAULT_CONCEPT_CACHE_SIZE)
+        self.concept_name_cache = concept_name_cache
+        self.case_tree_repository = case_tree_repository
+        if case_tree_cache is None:
+            case_tree_cache = LruCache(DEFAULT_CASE_TREE_CACHE_SIZE)
+        self.case_tree_cache = case_tree_cache
+        self.case_progress_repository = case_progress_repository
+        if concept_hierarchy is None:
+            concept_hierarchy = ConceptHierarchy()
+        self.concept_hierarchy = concept_hierarchy
+        # review inputs (see get_case_review_etag) -> ReviewOverlay on the base
+        # tree of the case; configs with the same inputs share one overlay
+        if review_overlays is None:
+            review_overlays = LruCache(DEFAULT_REVIEW_OVERLAY_CACHE_SIZE)
+        self.review_overlays = review_overlays
+        if case_tree_loads is None:
+            case_tree_loads = Singleflight()
+        self.case_tree_loads = case_tree_loads
+        self.lock_case_tree_builds = lock_case_tree_builds
+        # Without it (scripts, tests) page_config is read on every call.
+        self.page_config_cache = page_config_cache
 
     def get_case_detail(self, case_id):
         """
         Build the full TreeNode hierarchy for this single case_id (== person_id).
         We do not prune anything here; we simply load every possible leaf.
+        All OMOP rows of the visit are loaded up front and dispatched in memory.
         """
         page_config = self.get_page_configuration()
+        case_rows = self.load_case_rows(case_id, page_config)
+        return self.build_case_detail(case_rows, page_config)
+
+    def get_case_tree(self, case_id) -> tuple[str, tuple[FrozenTreeNode, ...]]:
+        """
+        (person name, unpruned case tree) for case_id.  The tree is frozen so
+        it can be shared: it is looked up in the in-process cache, then in the
+        tree repository (when given), and only built when both miss.
+        Concurrent misses of one tree in this process wait for a single
+        load; with lock_case_tree_builds, so do other processes (see
+        __load_case_tree).
+        """
+        page = self.get_page_config()
+        return self.__get_case_tree(case_id, page.config, page.config_hash)
+
+    def __get_case_tree(
+        self, case_id, page_config, config_hash
+    ) -> tuple[str, tuple[FrozenTreeNode, ...]]:
+        cache_key = (case_id, config_hash)
+        cached = self.case_tree_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        return self.case_tree_loads.do(
+            cache_key,
+            lambda: self.__load_case_tree(case_id, page_config, config_hash),
+        )
+
+    def __load_case_tree(
+        self, case_id, page_config, config_hash
+    ) -> tuple[str, tuple[FrozenTreeNode, ...]]:
+        cache_key = (case_id, config_hash)
+        # a load that finished between the miss above and this one
+        cached = self.case_tree_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        stored = None
+        if self.case_tree_repository is not None:
+            stored = self.case_tree_repository.get_case_tree(case_id, config_hash)
+            if stored is None and self.lock_case_tree_builds:
+                # Held until this transaction ends, i.e. until the tree saved
+                # below is committed; a worker process waiting here then reads
+                # it instead of building it again.
+                self.case_tree_repository.lock_case_tree(case_id, config_hash)
+                stored = self.case_tree_repository.get_case_tree(case_id, config_hash)
+        if stored is not None:
+            person_name = stored.person_name
+            case_details = [TreeNode.from_dict(node) for node in stored.tree]
+        else:
+            case_rows = self.load_case_rows(case_id, page_config)
+            case_details = self.build_case_detail(case_rows, page_config)
+            person_name = case_rows.person.person_source_value
+            if self.case_tree_repository is not None:
+                self.case_tree_repository.save_case_tree(
+                    case_id,
+                    config_hash,
+                    person_name,
+                    [node.to_dict() for node in case_details],
+                )
+        case_tree = (person_name, tuple(node.freeze() for node in case_details))
+        self.case_tree_cache.put(cache_key, case_tree)
+        return case_tree
+
+    def get_case_trees(
+        self, case_ids
+    ) -> dict[int, tuple[str, tuple[FrozenTreeNode, ...]]]:
+        """
+        get_case_tree for many cases.  Cache misses are read from the tree
+        repository in one query, and whatever is still missing is built from
+        rows loaded set-based across all visits and saved in one upsert.
+        Cases without a visit are left out.
+        """
+        page = self.get_page_config()
+        return self.__get_case_trees(case_ids, page.config, page.config_hash)
+
+    def __get_case_trees(
+        self, case_ids, page_config, config_hash
+    ) -> dict[int, tuple[str, tuple[FrozenTreeNode, ...]]]:
+        case_trees = {}
+        missing = []
+        for case_id in dict.fromkeys(case_ids):
+            cached = self.case_tree_cache.get((case_id, config_hash))
+            if cached is None:
+                missing.append(case_id)
+            else:
+                case_trees[case_id] = cached
+
+        found: dict[int, tuple[str, list[TreeNode]]] = {}
+        if missing and self.case_tree_repository is not None:
+            for stored in self.case_tree_repository.get_case_trees(
+                missing, config_hash
+            ):
+                found[stored.case_id] = (
+                    stored.person_name,
+                    [TreeNode.from_dict(node) for node in stored.tree],
+                )
+        to_build = [case_id for case_id in missing if case_id not in found]
+        if to_build:
+            built = {}
+            for case_id, case_rows in self.load_case_rows_batch(
+                to_build, page_config
+            ).items():
+                case_details = self.build_case_detail(case_rows, page_config)
+                found[case_id] = (case_rows.person.person_source_value, case_details)
+                built[case_id] = (
+                    case_rows.person.person_source_value,
+                    [node.to_dict() for node in case_details],
+                )
+            if self.case_tree_repository is not None:
+                self.case_tree_repository.save_case_trees(config_hash, built)
+
+        for case_id, (person_name, case_details) in found.items():
+            case_tree = (person_name, tuple(node.freeze() for node in case_details))
+            self.case_tree_cache.put((case_id, config_hash), case_tree)
+            case_trees[case_id] = case_tree
+        return case_trees
+
+    def build_case_detail(self, case_rows: CaseRows, page_config) -> list[TreeNode]:
         title_resolvers = {
             "BACKGROUND": self.get_nodes_of_background,
             "PATIENT COMPLAINT": self.get_nodes_of_observation,
@@ -114,18 +406,160 @@ class CaseService:
         data: list[TreeNode] = []
         for key, title_config in page_config.items():
             # Each top‐level key (e.g. "BACKGROUND") becomes a TreeNode whose children we fill in next.
-            candidate = TreeNode(key, title_resolvers[key](case_id, title_config))
+            candidate = TreeNode(key, title_resolvers[key](case_rows, title_config))
             if candidate.values:
                 data.append(candidate)
         return data
 
-    def get_nodes_of_measurement(self, case_id, title_config):
+    def load_case_rows(self, case_id, page_config) -> CaseRows:
+        """
+        Load the visit, the person and every observation and measurement of
+        the visit in a fixed number of queries, and warm the concept-name cache
+        for all of them (plus those of page_config) in one more.  Observations
+        and measurements come as ObservationRow / MeasurementRow tuples holding
+        only the columns the tree is built from; child concepts of the
+        measurement sections come from the shared concept hierarchy.
+        """
+        visit_occurrence = self.visit_occurrence_repository.get_visit_occurrence(
+            case_id
+        )
+        person = self.person_repository.get_person(visit_occurrence.person_id)
+        observations = self.observation_repository.get_observations_by_visit(case_id)
+        measurements = self.measurement_repository.get_measurements_by_visit(case_id)
+        self.prefetch_concept_names(
+            {person.gender_concept_id}
+            | self.__describe_page_config(page_config).concept_ids
+            | concept_ids_of_rows(observations, *OBSERVATION_CONCEPT_FIELDS)
+            | concept_ids_of_rows(measurements, *MEASUREMENT_CONCEPT_FIELDS)
+        )
+        return index_case_rows(
+            visit_occurrence,
+            person,
+            observations,
+            measurements,
+            self.get_child_concepts_of_page(page_config),
+        )
+
+    def load_section_rows(self, case_id, sections: dict, page: PageConfig) -> CaseRows:
+        """
+        load_case_rows for ``sections``, a part of page_config: only the
+        observations and measurements they reference are read (each
+        measurement section with the child concepts of the whole page), and
+        a table none of them reads is not queried at all.
+        """
+        visit_occurrence = self.visit_occurrence_repository.get_visit_occurrence(
+            case_id
+        )
+        person = self.person_repository.get_person(visit_occurrence.person_id)
+        observations = []
+        concept_ids = collect_concept_ids(sections.get("BACKGROUND", {}))
+        type_ids = collect_concept_ids(sections.get("PATIENT COMPLAINT", {}))
+        if concept_ids or type_ids:
+            observations = self.observation_repository.get_observations_of_concepts(
+                case_id, concept_ids, type_ids
+            )
+        measurements = []
+        child_concepts = {}
+        if "PHYSICAL EXAMINATION" in sections:
+            child_concepts = self.get_child_concepts_of_page(page.config)
+            parent_ids = collect_concept_ids(sections["PHYSICAL EXAMINATION"])
+            measurements = self.measurement_repository.get_measurements_of_concepts(
+                case_id,
+                parent_ids
+                | {
+                    child_id
+                    for parent_id in parent_ids
+                    for child_id in child_concepts.get(parent_id, ())
+                },
+            )
+        self.prefetch_concept_names(
+            {person.gender_concept_id}
+            | collect_concept_ids(sections)
+            | concept_ids_of_rows(observations, *OBSERVATION_CONCEPT_FIELDS)
+            | concept_ids_of_rows(measurements, *MEASUREMENT_CONCEPT_FIELDS)
+        )
+        return index_case_rows(
+            visit_occurrence, person, observations, measurements, child_concepts
+        )
+
+    def load_case_rows_batch(self, case_ids, page_config) -> dict[int, CaseRows]:
+        """
+        load_case_rows for many cases at once: one query per table across all
+        visits and one for the concept names of every row; child concepts of
+        the measurement sections come from the shared concept hierarchy.
+        Cases without a visit or person are left out.  All rows are
+        column-projected tuples (VisitRow, PersonRow, ObservationRow,
+        MeasurementRow), not entities.
+        """
+        visits = self.visit_occurrence_repository.get_visit_occurrences(case_ids)
+        if not visits:
+            return {}
+        persons = {
+            person.person_id: person
+            for person in self.person_repository.get_persons(
+                {visit.person_id for visit in visits}
+            )
+        }
+        visit_ids = [visit.visit_occurrence_id for visit in visits]
+        observations = self.observation_repository.get_observations_by_visits(
+            visit_ids
+        )
+        measurements = self.measurement_repository.get_measurements_by_visits(
+            visit_ids
+        )
+        self.prefetch_concept_names(
+            {person.gender_concept_id for person in persons.values()}
+            | self.__describe_page_config(page_config).concept_ids
+            | concept_ids_of_rows(observations, *OBSERVATION_CONCEPT_FIELDS)
+            | concept_ids_of_rows(measurements, *MEASUREMENT_CONCEPT_FIELDS)
+        )
+        child_concepts = self.get_child_concepts_of_page(page_config)
+        observations_by_visit = split_by_visit(observations)
+        measurements_by_visit = split_by_visit(measurements)
+        return {
+            visit.visit_occurrence_id: index_case_rows(
+                visit,
+                persons[visit.person_id],
+                observations_by_visit.get(visit.visit_occurrence_id, []),
+                measurements_by_visit.get(visit.visit_occurrence_id, []),
+                child_concepts,
+            )
+            for visit in visits
+            if visit.person_id in persons
+        }
+
+    def get_child_concepts(self, parent_concept_ids) -> dict[int, list[int]]:
+        return load_child_concepts(parent_concept_ids, self.concept_repository)
+
+    def get_child_concepts_of_page(self, page_config) -> dict[int, list[int]]:
+        """Child concepts of every measurement section, built once per config."""
+        return self.concept_hierarchy.get_children(
+            self.__describe_page_config(page_config).config_hash,
+            page_config,
+            self.concept_repository,
+        )
+
+    def get_nodes_of_measurement(self, case_rows: CaseRows, title_config):
+        measurements = case_rows.measurements_by_concept
+        direct_measurements = {
+            key: measurements.select(title_concept_ids)
+            for key, title_concept_ids in title_config.items()
+        }
+        # Sections without direct rows fall back to the concepts grouped under
+        # them, as held by the concept hierarchy; rows indexed without it
+        # query the relationships of all such sections at once.
+        children_by_parent = case_rows.child_concepts
+        if children_by_parent is None:
+            children_by_parent = self.get_child_concepts(
+                concept_id
+                for key, title_concept_ids in title_config.items()
+                if not direct_measurements[key]
+                for concept_id in title_concept_ids
+            )
         data: list[TreeNode] = []
         for key, title_concept_ids in title_config.items():
             section_name = self.get_concept_name(title_concept_ids[0])
-            parent_measurements = self.measurement_repository.get_measurements(
-                case_id, title_concept_ids
-            )
+            parent_measurements = direct_measurements[key]
             if parent_measurements:
                 # Leaf‐level measurements (no further grouping needed)
                 data.append(
@@ -138,10 +572,8 @@ class CaseService:
                 )
             else:
                 # Sometimes OMOP groups measurement_concept_id under parents; handle that.
-                children_measurements = (
-                    self.measurement_repository.get_measurements_of_parents(
-                        case_id, title_concept_ids
-                    )
+                children_measurements = select_children(
+                    measurements, children_by_parent, title_concept_ids
                 )
                 parent_node = TreeNode(section_name, [])
                 measurements_by_concept = group_by(
@@ -150,8 +582,8 @@ class CaseService:
                 for concept_id, rows in measurements_by_concept.items():
                     label = self.get_concept_name(concept_id)
                     # Normalize BMI label to "range" at build time for consistent UI
-                    if label == "BMI (body mass index) centile":
-                        label = "BMI (body mass index) range"
+                    if label == BMI_CENTILE:
+                        label = BMI_RANGE
                     parent_node.add_node(
                         TreeNode(
                             label,
@@ -164,8 +596,8 @@ class CaseService:
         for node in data:
             if node.key == "Body measure" and node.values and isinstance(node.values[0], TreeNode):
                 for child in node.values:
-                    if child.key == "BMI (body mass index) centile":
-                        child.key = "BMI (body mass index) range"
+                    if child.key == BMI_CENTILE:
+                        child.key = BMI_RANGE
         return data
 
     def get_value_of_measurement(self, measurement) -> str | None:
@@ -194,13 +626,11 @@ class CaseService:
             value = self.get_concept_name(measurement.operator_concept_id) + " " + value
         return value
 
-    def get_nodes_of_observation(self, case_id, title_config):
+    def get_nodes_of_observation(self, case_rows: CaseRows, title_config):
         data: list[TreeNode] = []
         for key, concept_type_ids in title_config.items():
             parent_node = TreeNode(key, [])
-            observations = self.observation_repository.get_observations_by_type(
-                case_id, concept_type_ids
-            )
+            observations = case_rows.observations_by_type.select(concept_type_ids)
             observations_by_concept = group_by(
                 observations, lambda o: o.observation_concept_id
             )
@@ -233,56 +663,57 @@ class CaseService:
             )
         return value
 
-    def get_nodes_of_background(self, case_id, title_config):
+    def get_nodes_of_background(self, case_rows: CaseRows, title_config):
         """
         Build everything under “BACKGROUND.”  First add “Patient Demographics,” then
         one TreeNode per sub‐category (e.g. “Family History,” “Medical History,” etc.).
         Each sub‐category TreeNode's .values is a list of strings (all possible leaf texts).
         """
         data: list[TreeNode] = [
-            self.get_nodes_of_patient(case_id),
+            self.get_nodes_of_patient(case_rows),
         ]
         for key, config in title_config.items():
-            node = TreeNode(key, self.get_nodes_of_nested_fields(case_id, config))
+            node = TreeNode(key, self.get_nodes_of_nested_fields(case_rows, config))
             if node.values:
                 data.append(node)
         return data
 
-    def get_nodes_of_patient(self, case_id):
-        visit_occurrence = self.visit_occurrence_repository.get_visit_occurrence(
-            case_id
-        )
-        person = self.person_repository.get_person(visit_occurrence.person_id)
-        age = get_age(person, visit_occurrence)
+    def get_nodes_of_patient(self, case_rows: CaseRows):
+        person = case_rows.person
+        age = get_age(person, case_rows.visit_occurrence)
         gender = self.get_concept_name(person.gender_concept_id)
-        self.person = person
         # “Patient Demographics” is always a pair of leaves [“Age”, “Gender”]
         return TreeNode(
             "Patient Demographics",
             [TreeNode("Age", age), TreeNode("Gender", gender)],
         )
 
-    def get_nodes_of_nested_fields(self, case_id, config):
+    def get_nodes_of_nested_fields(self, case_rows: CaseRows, config):
         """
         Recursively build nested TreeNodes if config is a dict; if config is a list
-        (i.e. a leaf concept_id list), fetch observations by those concept_ids.
+        (i.e. a leaf concept_id list), pick the visit's observations of those concept_ids.
         """
         if is_leaf_node(config):
-            observations = self.observation_repository.get_observations_by_concept(
-                case_id, config
-            )
+            observations = case_rows.observations_by_concept.select(config)
             return get_value_of_rows(observations, self.get_value_of_observation)
         data: list[TreeNode] = []
         for key, nested_config in config.items():
             node = TreeNode(
-                key, self.get_nodes_of_nested_fields(case_id, nested_config)
+                key, self.get_nodes_of_nested_fields(case_rows, nested_config)
             )
             if node.values:
                 data.append(node)
         return data
 
     def get_concept_name(self, concept_id):
-        return self.concept_repository.get_concept(concept_id).concept_name
+        return self.concept_name_cache.get_name(concept_id, self.concept_repository)
+
+    def prefetch_concept_names(self, concept_ids):
+        """
+        Warm the concept-name cache with one bulk query so the per-value
+        get_concept_name calls that follow are served from memory.
+        """
+        self.concept_name_cache.prefetch(concept_ids, self.concept_repository)
 
     def get_page_configuration(self):
         """
@@ -299,145 +730,239 @@ class CaseService:
           "PHYSICAL EXAMINATION": { "Abdominal": [4152368], ... }
         }
         """
-        return self.system_config_repository.get_config_by_id("page_config").json_config
+        return self.get_page_config().config
 
-    def get_case_review(self, case_config_id):  # pragma: no cover
+    def get_page_config(self) -> PageConfig:
         """
-        1) Load DisplayConfig, verify access.
-        2) Build full unpruned case_details tree.
-        3) Prune under “BACKGROUND” per path_config.
-        4) Handle CSV-provided literal Colorectal Cancer Score leaves (now possibly multiple):
-           • collect all, compute min/max.
-        5) Else if old CRC toggle, fetch from DB as before.
-        6) Return Case with sorted important_infos.
+        page_config with its hash and concept ids.  With a page_config_cache
+        this is served from memory and system_config is only checked for
+        changes every few seconds.
+        """
+        if self.page_config_cache is not None:
+            return self.page_config_cache.get(self.system_config_repository)
+        return PageConfig.of(
+            self.system_config_repository.get_config_by_id("page_config").json_config
+        )
+
+    def __describe_page_config(self, page_config) -> PageConfig:
+        # the cached config carries its hash and concept ids already
+        if self.page_config_cache is not None:
+            cached = self.page_config_cache.peek()
+            if cached is not None and cached.config is page_config:
+                return cached
+        return PageConfig.of(page_config)
+
+    def get_case_review(self, case_config_id):
+        return self.build_case_review(case_config_id, get_user_email_from_jwt())
+
+    def get_lazy_case_review(self, case_config_id) -> Case:
+        """
+        The review folded by fold_collapsed.  It is cut from the case tree
+        when that is cached in this process; otherwise the rows of folded
+        BACKGROUND children are not loaded, only which of them have a value,
+        and those are listed empty for fold_collapsed to fold.
+        """
+        configuration = self.__get_configuration_of_user(
+            case_config_id, get_user_email_from_jwt()
+        )
+        page = self.get_page_config()
+        case_tree = self.case_tree_cache.get((configuration.case_id, page.config_hash))
+        if case_tree is not None:
+            return fold_collapsed(
+                self.__review_case(configuration, case_tree, page.config_hash)
+            )
+
+        background = page.config.get("BACKGROUND", {})
+        folded = folded_children(get_path_trie(configuration), "BACKGROUND", background)
+        sections = dict(page.config)
+        if folded:
+            sections["BACKGROUND"] = {
+                key: config for key, config in background.items() if key not in folded
+            }
+        case_rows = self.load_section_rows(configuration.case_id, sections, page)
+        case_details = self.build_case_detail(case_rows, sections)
+        if folded:
+            valued = self.observation_repository.get_valued_observation_concepts(
+                configuration.case_id,
+                collect_concept_ids({key: background[key] for key in folded}),
+            )
+            listed = {
+                key for key in folded if collect_concept_ids(background[key]) & valued
+            }
+            for section in case_details:
+                if section.key == "BACKGROUND":
+                    built = {child.key: child for child in section.values}
+                    # page_config children in its order, as build_case_detail does
+                    section.values = [
+                        child for child in section.values if child.key not in background
+                    ] + [
+                        built.get(key) or TreeNode(key, [])
+                        for key in background
+                        if key in built or key in listed
+                    ]
+        return fold_collapsed(
+            self.review_case(
+                configuration, case_rows.person.person_source_value, case_details
+            )
+        )
+
+    def get_case_review_section(self, case_config_id, section_key, child_key):
         """
-        # --- 1) Load configuration & verify access ---
+        One child of a top-level section of the review, as folded away by
+        fold_collapsed, or None.  It is cut from the case tree when that is
+        cached in this process; otherwise only the section is built, from the
+        rows select_sections says it needs.
+        """
+        configuration = self.__get_configuration_of_user(
+            case_config_id, get_user_email_from_jwt()
+        )
+        page = self.get_page_config()
+        case_tree = self.case_tree_cache.get((configuration.case_id, page.config_hash))
+        if case_tree is not None:
+            details = self.__review_case(
+                configuration, case_tree, page.config_hash
+            ).details
+        else:
+            sections = select_sections(page.config, section_key, child_key)
+            if not sections:
+                return None
+            case_rows = self.load_section_rows(configuration.case_id, sections, page)
+            details, _ = prune_case_tree(
+                self.build_case_detail(case_rows, sections),
+                get_path_trie(configuration),
+            )
+        for section in details:
+            if section.key == section_key and isinstance(section.values, (list, tuple)):
+                for child in section.values:
+                    if getattr(child, "key", None) == child_key:
+                        return child
+        return None
+
+    def get_case_review_etag(self, case_config_id, *variant) -> str:
+        """
+        ETag of the review get_case_review would return, from its inputs only
+        (page_config, case and path_config; OMOP data is fixed), so a
+        conditional request is answered without building any tree.
+        ``variant`` tells apart other representations of the same review.
+        """
+        configuration = self.__get_configuration_of_user(
+            case_config_id, get_user_email_from_jwt()
+        )
+        return content_etag(
+            self.get_page_config().config_hash,
+            configuration.case_id,
+            configuration.path_config,
+            *variant,
+        )
+
+    def __get_configuration_of_user(self, case_config_id, current_user):
         configuration = self.configuration_repository.get_configuration_by_id(
             case_config_id
         )
-        current_user = get_user_email_from_jwt()
         if not configuration or configuration.user_email != current_user:
             raise BusinessException(BusinessExceptionEnum.NoAccessToCaseReview)
+        return configuration
 
-        # --- 2) Raw, unpruned case tree ---
-        case_details = self.get_case_detail(configuration.case_id)
-
-        # --- 3) Index CSV path_config entries ---
-        raw_path_cfg = configuration.path_config or []
-        parent_to_entries: dict[str, list[dict]] = defaultdict(list)
-
-        # Track CSV-provided literal score overrides (now possibly many)
-        csv_crc_score_leaves: list[str] = []
-        old_crc_toggle = False
-
-        for entry in raw_path_cfg:
-            path_str = (entry.get("path") or "").strip()
-            style = entry.get("style") or {}
-            if not path_str:
-                continue
-
-            segments = path_str.split(".")
-            if len(segments) < 2:
-                continue
-
-            parent_key = ".".join(segments[:-1])
-            leaf_text = segments[-1]
-
-            # collect any literal "Colorectal Cancer Score: X"
-            if path_str.startswith("RISK ASSESSMENT.Colorectal Cancer Score"):
-                csv_crc_score_leaves.append(leaf_text)
-
-            # old-style toggle of entire CRC section
-            if path_str == "RISK ASSESSMENT.CRC risk assessments":
-                old_crc_toggle = True
-
-            parent_to_entries[parent_key].append({"leaf": leaf_text, "style": style})
-
-        # --- 4) Prune under BACKGROUND per path_config ---
-        important_infos: list[dict] = []
-        for top in case_details:
-            if top.key != "BACKGROUND":
-                continue
-            for child in top.values:
-                if child.key == "Patient Demographics":
-                    continue  # always keep
-                pk = f"BACKGROUND.{child.key}"
-                if pk not in parent_to_entries:
-                    child.values = []
-                    continue
-                entries = parent_to_entries[pk]
-                keep = {e["leaf"] for e in entries}
-                child.values = [v for v in child.values if v in keep]
-
-                # merge style directives
-                merged: dict = {}
-                for e in entries:
-                    s = e["style"]
-                    if "collapse" in s:
-                        merged["collapse"] = not s["collapse"]
-                    if "highlight" in s:
-                        merged["highlight"] = s["highlight"]
-                    if "top" in s:
-                        merged["top"] = max(merged.get("top", -1), s["top"])
-
-                child.style = merged
-                if merged.get("top") is not None:
-                    important_infos.append(
-                        {
-                            "key": child.key,
-                            "values": child.values,
-                            "weight": merged["top"],
-                        }
-                    )
-        
-        # --- 4b) Filter and rename PHYSICAL EXAMINATION based on path_config ---
-        # Build a set of all PHYSICAL EXAMINATION leaf texts that should be kept
-        phys_exam_keep = set()
-        has_phys_exam_config = False
-        for pk, entries in parent_to_entries.items():
-            if pk.startswith("PHYSICAL EXAMINATION."):
-                has_phys_exam_config = True
-                # Extract leaf texts (these are the actual child.key values to keep)
-                for e in entries:
-                    phys_exam_keep.add(e["leaf"])
-        
-        # Filter and rename PHYSICAL EXAMINATION children
-        for top in case_details:
-            if top.key != "PHYSICAL EXAMINATION":
-                continue
-            
-            # Filter: if we have PHYSICAL EXAMINATION in path_config, keep only what's specified.
-            # Otherwise, keep everything EXCEPT BMI (BMI only shows when explicitly in path_config)
-            filtered_children = []
-            for child in top.values:
-                should_keep = False
-                
-                if has_phys_exam_config:
-                    # Path config has PHYSICAL EXAMINATION entries - keep only specified items
-                    should_keep = child.key in phys_exam_keep
-                else:
-                    # No PHYSICAL EXAMINATION in path_config - keep everything except BMI
-                    should_keep = child.key != "BMI (body mass index) centile"
-                
-                if should_keep:
-                    # Rename BMI from 'centile' to 'range' if it's BMI
-                    if child.key == "BMI (body mass index) centile":
-                        child.key = "BMI (body mass index) range"
-                    filtered_children.append(child)
-            
-            top.values = filtered_children
+    def build_case_review(self, case_config_id, current_user) -> Case:
+        configuration = self.__get_configuration_of_user(case_config_id, current_user)
+        page = self.get_page_config()
+        case_tree = self.__get_case_tree(
+            configuration.case_id, page.config, page.config_hash
+        )
+        return self.__review_case(configuration, case_tree, page.config_hash)
 
-        # --- 4c) Remove PHYSICAL EXAMINATION section if empty after filtering ---
-        case_details = [
-            section for section in case_details
-            if not (section.key == "PHYSICAL EXAMINATION" and not section.values)
-        ]
+    def get_case_reviews(self, case_config_ids, current_user) -> list[tuple[str, Case]]:
+        """
+        (config id, review) for each of case_config_ids, in order; all of
+        them must belong to current_user.  Trees come from get_case_trees.
+        """
+        configurations = {
+            configuration.id: configuration
+            for configuration in self.configuration_repository.get_configurations_by_ids(
+                case_config_ids
+            )
+        }
+        ordered = []
+        for case_config_id in dict.fromkeys(case_config_ids):
+            configuration = configurations.get(case_config_id)
+            if not configuration or configuration.user_email != current_user:
+                raise BusinessException(BusinessExceptionEnum.NoAccessToCaseReview)
+            ordered.append(configuration)
+        return self.review_cases(ordered)
+
+    def get_next_case_reviews(self, count, current_user) -> list[tuple[str, Case]]:
+        """(config id, review) for up to count unanswered configs of the user."""
+        return self.review_cases(
+            self.configuration_repository.get_unanswered_configurations(
+                current_user, count
+            )
+        )
+
+    def review_cases(self, configurations) -> list[tuple[str, Case]]:
+        page = self.get_page_config()
+        case_trees = self.__get_case_trees(
+            [configuration.case_id for configuration in configurations],
+            page.config,
+            page.config_hash,
+        )
+        reviews = []
+        for configuration in configurations:
+            case_tree = case_trees.get(configuration.case_id)
+            if case_tree is None:
+                raise BusinessException(
+                    BusinessExceptionEnum.InvalidCaseId, str(configuration.case_id)
+                )
+            reviews.append(
+                (
+                    configuration.id,
+                    self.__review_case(configuration, case_tree, page.config_hash),
+                )
+            )
+        return reviews
+
+    def __review_case(self, configuration, case_tree, config_hash) -> Case:
+        """
+        review_case, or the cached overlay of the config applied to the case
+        tree.  Overlays are keyed by what the review depends on, like its
+        ETag, so an edited path_config never gets a stale one.
+        """
+        person_name, case_details = case_tree
+        cache_key = content_etag(
+            config_hash, configuration.case_id, configuration.path_config
+        )
+        overlay: ReviewOverlay | None = self.review_overlays.get(cache_key)
+        if overlay is not None:
+            return apply_overlay(
+                overlay, person_name, configuration.case_id, case_details
+            )
+        review = self.review_case(configuration, person_name, case_details)
+        self.review_overlays.put(cache_key, overlay_of(review, case_details))
+        return review
+
+    def review_case(self, configuration, person_name, case_details):  # pragma: no cover
+        """
+        The review of one access-checked DisplayConfig, from the unpruned tree
+        of its case:
+        1) Prune it in one walk, per the section rules in case_pruning, guided
+           by the path_config trie compiled at upload time.
+        2) Handle CSV-provided literal Colorectal Cancer Score leaves (now possibly multiple):
+           • collect all, compute min/max.
+        3) Else if old CRC toggle, fetch from DB as before.
+        4) Return Case with sorted important_infos.
+        """
+        # --- 1) Compiled path_config (prefix trie built at upload time) ---
+        path_trie = get_path_trie(configuration)
+        csv_crc_score_leaves: list[str] = path_trie["crc_score_leaves"]
+        old_crc_toggle = path_trie["crc_toggle"]
+
+        # --- 1) One walk over the shared base tree, per SECTION_RULES ---
+        case_details, important_infos = prune_case_tree(case_details, path_trie)
 
         # sort and wrap into TreeNodes
         important_infos.sort(key=itemgetter("weight"))
         sorted_important = [TreeNode(e["key"], e["values"]) for e in important_infos]
 
-        # --- 5) Handle AI CRC Risk Score section ---
+        # --- 2/3) Handle AI CRC Risk Score section ---
         ai_label = "AI CRC Risk Score (<6: Low; 6-11: Medium; >11: High)"
 
         if csv_crc_score_leaves:
@@ -490,9 +1015,9 @@ class CaseService:
                 else:
                     sorted_important.append(TreeNode(ai_label, ["N/A"]))
 
-        # 6) done—return full Case
+        # 4) done—return full Case
         return Case(
-            self.person.person_source_value,
+            person_name,
             str(configuration.case_id),
             case_details,
             sorted_important,
@@ -501,17 +1026,31 @@ class CaseService:
     def __get_current_case_by_user(
         self, user_email
     ) -> tuple[int, str] | tuple[None, None]:
-        case_config_pairs = (
-            self.configuration_repository.get_case_configurations_by_user(user_email)
-        )
-        completed_case_list = self.diagnose_repository.get_answered_case_list_by_user(
+        """
+        The user's next unanswered (case_id, config_id).  With a progress
+        repository the stored cursor is checked first (one primary-key lookup
+        plus a single-row anti-join); otherwise, or when the cursor is stale,
+        one anti-join over the user's configs picks the next one.
+        """
+        progress = None
+        if self.case_progress_repository is not None:
+            progress = self.case_progress_repository.get_progress(user_email)
+        if progress is not None and progress.next_config_id is not None:
+            current = self.configuration_repository.get_next_unanswered_configuration(
+                user_email, progress.next_config_id
+            )
+            if current is not None:
+                return current
+
+        current = self.configuration_repository.get_next_unanswered_configuration(
             user_email
         )
-
-        for case_id, config_id in case_config_pairs:
-            if config_id not in completed_case_list:
-                return case_id, config_id
-        return None, None
+        next_config_id = None if current is None else current[1]
+        if self.case_progress_repository is not None and (
+            progress is None or progress.next_config_id != next_config_id
+        ):
+            self.case_progress_repository.save_progress(user_email, next_config_id)
+        return current if current is not None else (None, None)
 
     def get_cases_by_user(self, user_email) -> list[CaseSummary]:
         """
@@ -533,11 +1072,15 @@ class CaseService:
         )
         person = self.person_repository.get_person(visit_occurrence.person_id)
         age = get_age(person, visit_occurrence)
-        gender = self.get_concept_name(person.gender_concept_id)
 
         observations = self.observation_repository.get_observations_by_type(
             case_id, chief_complaint_concept_ids
         )
+        self.prefetch_concept_names(
+            {person.gender_concept_id}
+            | concept_ids_of_rows(observations, "observation_concept_id")
+        )
+        gender = self.get_concept_name(person.gender_concept_id)
         patient_chief_complaint: list[str] = []
         for obs in observations:
             concept_name = self.get_concept_name(obs.observation_concept_id)
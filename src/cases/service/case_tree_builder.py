@@ -0,0 +1,117 @@
+"""
+Case trees for many cases at once: cache warm-up, exports and checks of
+configs against the data.
+
+Case ids are cut into chunks; each chunk is loaded with the set-based
+load_case_rows_batch (one query per table for the whole chunk, rows split per
+visit in one sorted pass) and one tree is emitted per case.  Chunks are built
+either in this process or, for large cohorts, in a pool of worker processes
+with their own app and database connections.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from multiprocessing import get_context
+from typing import Iterable, Iterator
+
+from src import create_app, db
+from src.cases.service.case_service import CaseService
+
+DEFAULT_CHUNK_SIZE = 500
+# app settings a worker process needs to build trees like the server does
+WORKER_CONFIG_KEYS = (
+    "SQLALCHEMY_DATABASE_URI",
+    "SQLALCHEMY_ENGINE_OPTIONS",
+    "CONCEPT_CACHE_SIZE",
+)
+
+BuiltCaseTree = tuple[int, str, list[dict]]
+
+
+def chunked(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def build_case_trees(
+    case_service: CaseService,
+    case_ids,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    page_config: dict | None = None,
+) -> Iterator[BuiltCaseTree]:
+    """
+    (case id, person name, tree as dicts) for each of case_ids that has a
+    visit and a person, in order, built in this process against page_config
+    (the stored one by default).
+    """
+    if page_config is None:
+        page_config = case_service.get_page_configuration()
+    for chunk in chunked(dict.fromkeys(case_ids), chunk_size):
+        yield from build_chunk(case_service, chunk, page_config)
+
+
+def build_chunk(
+    case_service: CaseService, case_ids: list, page_config
+) -> list[BuiltCaseTree]:
+    case_rows = case_service.load_case_rows_batch(case_ids, page_config)
+    built = []
+    for case_id in case_ids:
+        rows = case_rows.get(case_id)
+        if rows is not None:
+            tree = case_service.build_case_detail(rows, page_config)
+            built.append(
+                (
+                    case_id,
+                    rows.person.person_source_value,
+                    [node.to_dict() for node in tree],
+                )
+            )
+    return built
+
+
+def build_case_trees_in_processes(
+    app,
+    case_ids,
+    workers: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    page_config: dict | None = None,
+) -> Iterator[BuiltCaseTree]:
+    """
+    build_case_trees across a pool of ``workers`` processes, one chunk per
+    task.  Workers are spawned (not forked, so no connection of this process
+    is shared) and connect to the database ``app`` is configured for.
+    Without page_config, each chunk reads the stored one.
+    """
+    config = {key: app.config[key] for key in WORKER_CONFIG_KEYS if key in app.config}
+    with ProcessPoolExecutor(
+        workers,
+        mp_context=get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(config,),
+    ) as pool:
+        chunks = chunked(dict.fromkeys(case_ids), chunk_size)
+        build = partial(_build_chunk_in_worker, page_config=page_config)
+        for built in pool.map(build, chunks):
+            yield from built
+
+
+def _init_worker(config: dict):  # pragma: no cover - runs in the worker process
+    create_app(config).app_context().push()
+
+
+def _build_chunk_in_worker(
+    case_ids: list, page_config: dict | None
+) -> list[BuiltCaseTree]:  # pragma: no cover
+    # imported here: the controller module needs the app context pushed above
+    from src.cases.controller.case_controller import get_case_service
+
+    case_service = get_case_service()
+    if page_config is None:
+        page_config = case_service.get_page_configuration()
+    try:
+        return build_chunk(case_service, case_ids, page_config)
+    finally:
+        # read-only; end the transaction so the connection goes back idle
+        db.session.rollback()
@@ -0,0 +1,138 @@
+"""
+Cache warm-up for every assigned case, run after an ingest or a page_config
+change so no reviewer pays for the first tree build (``flask cases warm``).
+Reviews are cached per worker process, so they are not warmed here: every
+config is checked to review cleanly instead, so a broken one (e.g. a case
+without a visit) is reported before a reviewer opens it.
+
+It is safe next to live traffic: trees are written with the same upsert the
+API uses, one short transaction per chunk, against the page_config read when
+the run starts; the only other write is the compiled path trie of configs
+stored by an older release, which requests would compute the same way.
+"""
+
+import time
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Callable
+
+from src.cases.repository.case_tree_cache_repository import CaseTreeCacheRepository
+from src.cases.service.case_service import CaseService, group_by, page_config_hash
+from src.cases.service.case_tree_builder import (
+    DEFAULT_CHUNK_SIZE,
+    build_case_trees,
+    build_case_trees_in_processes,
+    chunked,
+)
+from src.user.utils.path_trie import get_path_trie
+
+
+@dataclass
+class WarmupProgress:
+    cases: int = 0
+    configurations: int = 0
+    trees_cached: int = 0
+    trees_built: int = 0
+    reviews_checked: int = 0
+    failed_configurations: list[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def trees_per_second(self) -> float:
+        return self.trees_built / self.elapsed if self.elapsed else 0.0
+
+
+def warm_case_caches(
+    app,
+    case_service: CaseService,
+    case_tree_repository: CaseTreeCacheRepository,
+    session,
+    workers: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    force: bool = False,
+    report: Callable[[str, WarmupProgress], None] | None = None,
+    clock: Callable[[], float] = time.monotonic,
+) -> WarmupProgress:
+    """
+    Store the base tree of every case in display_config, then check that the
+    review of every config builds from those trees.  Trees already stored for
+    the current page_config are kept unless ``force``.  ``workers`` > 0
+    builds the trees in that many processes (see build_case_trees_in_processes);
+    ``report(phase, progress)`` is called after each chunk.
+    """
+    started = clock()
+    configuration_repository = case_service.configuration_repository
+    # ids only: loaded configs would expire at every commit below
+    config_ids_by_case = {
+        case_id: [configuration.id for configuration in configurations]
+        for case_id, configurations in group_by(
+            configuration_repository.get_all_configurations(), attrgetter("case_id")
+        ).items()
+    }
+    case_ids = sorted(config_ids_by_case)
+    progress = WarmupProgress(
+        cases=len(case_ids),
+        configurations=sum(map(len, config_ids_by_case.values())),
+    )
+
+    def tick(phase: str):
+        progress.elapsed = clock() - started
+        if report is not None:
+            report(phase, progress)
+
+    page_config = case_service.get_page_configuration()
+    config_hash = page_config_hash(page_config)
+    to_build = case_ids
+    if not force:
+        cached = set()
+        for chunk in chunked(case_ids, chunk_size):
+            cached |= case_tree_repository.get_cached_case_ids(chunk, config_hash)
+        to_build = [case_id for case_id in case_ids if case_id not in cached]
+        progress.trees_cached = len(cached)
+    # read-only until the first save; do not hold a snapshot while building
+    session.commit()
+
+    if workers:
+        built = build_case_trees_in_processes(
+            app, to_build, workers, chunk_size, page_config
+        )
+    else:
+        built = build_case_trees(case_service, to_build, chunk_size, page_config)
+    for chunk in chunked(built, chunk_size):
+        case_tree_repository.save_case_trees(
+            config_hash,
+            {case_id: (person_name, tree) for case_id, person_name, tree in chunk},
+        )
+        session.commit()
+        progress.trees_built += len(chunk)
+        tick("trees")
+
+    for chunk in chunked(case_ids, chunk_size):
+        case_trees = case_service.get_case_trees(chunk)
+        configurations = configuration_repository.get_configurations_by_ids(
+            [
+                config_id
+                for case_id in chunk
+                for config_id in config_ids_by_case[case_id]
+            ]
+        )
+        for configuration in configurations:
+            case_tree = case_trees.get(configuration.case_id)
+            try:
+                path_trie = get_path_trie(configuration)
+                if path_trie is not configuration.path_trie:
+                    # stored by an older release; compiled once here, not per request
+                    configuration.path_trie = path_trie
+                if case_tree is None:
+                    raise LookupError(f"case {configuration.case_id} has no visit")
+                case_service.review_case(configuration, *case_tree)
+            except Exception:
+                app.logger.exception("Warming case review %s failed", configuration.id)
+                progress.failed_configurations.append(configuration.id)
+            else:
+                progress.reviews_checked += 1
+        session.commit()
+        tick("checks")
+
+    progress.elapsed = clock() - started
+    return progress
@@ -0,0 +1,61 @@
+import threading
+from collections import defaultdict
+from typing import Iterable
+
+from src.cases.repository.concept_repository import ConceptRepository
+from src.cases.repository.measurement_repository import PARENT_RELATIONSHIP_IDS
+from src.cases.service.concept_name_cache import collect_concept_ids
+
+
+def load_child_concepts(
+    parent_concept_ids: Iterable[int], repository: ConceptRepository
+) -> dict[int, list[int]]:
+    """
+    parent -> child concept ids, one entry per 'Subsumes' /
+    'Is characterized by' relationship row (duplicates are kept so the
+    result mirrors a join against concept_relationship).
+    """
+    parent_concept_ids = set(parent_concept_ids)
+    children: dict[int, list[int]] = defaultdict(list)
+    if not parent_concept_ids:
+        return children
+    for parent_id, child_id in repository.get_concept_relationships(
+        parent_concept_ids, PARENT_RELATIONSHIP_IDS
+    ):
+        children[parent_id].append(child_id)
+    return children
+
+
+class ConceptHierarchy:
+    """
+    Process-wide parent -> child concept map of every PHYSICAL EXAMINATION
+    section in page_config, so a measurement section found only through its
+    children is a plain in-memory lookup instead of a relationship query.
+
+    OMOP vocabularies do not change after ingest, so the map only has to be
+    rebuilt when page_config does; it is keyed by the page_config hash and
+    the map of the previous config is dropped.
+    """
+
+    def __init__(self):
+        self._config_hash: str | None = None
+        self._children: dict[int, list[int]] = {}
+        self._lock = threading.Lock()
+
+    def get_children(
+        self, config_hash: str, page_config: dict, repository: ConceptRepository
+    ) -> dict[int, list[int]]:
+        with self._lock:
+            if self._config_hash == config_hash:
+                return self._children
+        # built outside the lock; racing builds of one config are identical
+        children = dict(
+            load_child_concepts(
+                collect_concept_ids(page_config.get("PHYSICAL EXAMINATION", {})),
+                repository,
+            )
+        )
+        with self._lock:
+            self._config_hash = config_hash
+            self._children = children
+        return children
@@ -0,0 +1,54 @@
+from typing import Iterable
+
+from src.cases.repository.concept_repository import ConceptRepository
+from src.common.cache.lru_cache import LruCache
+
+_MISSING = object()
+
+
+def collect_concept_ids(config) -> set[int]:
+    """
+    Collect every concept id referenced by a (nested) page_config fragment.
+    Leaves are lists of ids (or a single id); everything else is a dict.
+    """
+    if isinstance(config, int):
+        return {config}
+    if isinstance(config, list):
+        return {item for item in config if isinstance(item, int)}
+    ids: set[int] = set()
+    for nested in config.values():
+        ids |= collect_concept_ids(nested)
+    return ids
+
+
+def concept_ids_of_rows(rows: Iterable, *fields: str) -> set[int]:
+    """Collect the non-empty concept ids held in ``fields`` of OMOP rows."""
+    ids: set[int] = set()
+    for row in rows:
+        for field in fields:
+            concept_id = getattr(row, field, None)
+            if concept_id:
+                ids.add(concept_id)
+    return ids
+
+
+class ConceptNameCache(LruCache):
+    """
+    Process-wide concept_id -> concept_name store.
+
+    OMOP vocabularies do not change after ingest, so names are never
+    invalidated; the LRU bound only keeps memory in check.
+    """
+
+    def get_name(self, concept_id: int, repository: ConceptRepository) -> str:
+        name = self.get(concept_id, _MISSING)
+        if name is _MISSING:
+            name = repository.get_concept(concept_id).concept_name
+            self.put(concept_id, name)
+        return name
+
+    def prefetch(self, concept_ids: Iterable[int], repository: ConceptRepository):
+        """Load all uncached names among ``concept_ids`` in one query."""
+        missing = self.missing(cid for cid in concept_ids if cid)
+        if missing:
+            self.put_many(repository.get_concept_names(missing))
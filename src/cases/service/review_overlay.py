@@ -0,0 +1,145 @@
+"""
+Per-config overlays on the shared base tree of a case.
+
+A case is assigned to many clinicians with different path_configs, but their
+reviews differ from the base tree only in the children and leaves they keep,
+renamed keys, styles and the important infos.  A ReviewOverlay records just
+that, by position in the base tree, so cached reviews hold the clinical
+content of a case once (in the base tree cache) however many configs it is
+assigned to, and an overlay never keeps an evicted base tree alive.
+apply_overlay turns base tree and overlay back into the Case that is
+serialized.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+
+from src.cases.model.case import Case, FrozenTreeNode, TreeNode, TreeNodeView
+
+
+@dataclass(frozen=True, slots=True)
+class NodeOverlay:
+    """
+    The changes to the base value at ``index`` of its parent.  ``values``
+    lists the kept base values in order, each either a bare position (kept
+    as built) or a NodeOverlay; an int is a bit mask of kept positions when
+    all of them are kept as built (the common case of filtered leaves), and
+    None keeps all of them.
+    """
+
+    index: int
+    key: str
+    style: Mapping | None
+    values: tuple | int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ReviewOverlay:
+    details: tuple
+    important_infos: tuple[FrozenTreeNode, ...]
+
+
+def overlay_of(review: Case, case_details) -> ReviewOverlay:
+    """The overlay that turns case_details into the details of review."""
+    return ReviewOverlay(
+        _overlay_values(review.details, case_details),
+        tuple(_freeze(node) for node in review.importantInfos),
+    )
+
+
+def apply_overlay(
+    overlay: ReviewOverlay, person_name: str, case_id, case_details
+) -> Case:
+    return Case(
+        person_name,
+        str(case_id),
+        _apply_values(overlay.details, case_details),
+        list(overlay.important_infos),
+    )
+
+
+def _overlay_values(values, base_values) -> tuple:
+    """
+    Match each of values to the base value it was made from.  Pruning only
+    drops and wraps base values, never reorders them, so one forward scan
+    finds them all.
+    """
+    entries = []
+    position = 0
+    for value in values:
+        while position < len(base_values) and not _made_from(
+            value, base_values[position]
+        ):
+            position += 1
+        if position == len(base_values):
+            raise ValueError(f"{value!r} is not part of the base tree")
+        entries.append(_overlay_node(value, base_values[position], position))
+        position += 1
+    return tuple(entries)
+
+
+def _made_from(value, base) -> bool:
+    if value is base:
+        return True
+    if isinstance(value, TreeNodeView):
+        return value.base is base
+    return isinstance(value, str) and value == base
+
+
+def _overlay_node(node, base, index: int):
+    if node is base or not isinstance(node, TreeNodeView):
+        return index
+    values = None
+    if node.values is not base.values:
+        values = _overlay_values(node.values, base.values)
+        if values == tuple(range(len(base.values))):
+            values = None
+        elif all(type(entry) is int for entry in values):
+            values = sum(1 << position for position in values)
+    style = node.style
+    if isinstance(style, dict):
+        style = _shared_style(style)
+    return NodeOverlay(index, node.key, style, values)
+
+
+def _shared_style(style: dict) -> Mapping:
+    # path_config styles are a handful of flag combinations; one read-only
+    # copy of each serves every overlay
+    try:
+        return _interned_style(tuple(style.items()))
+    except TypeError:  # unhashable style values
+        return MappingProxyType(dict(style))
+
+
+@lru_cache(maxsize=1024)
+def _interned_style(items: tuple) -> Mapping:
+    return MappingProxyType(dict(items))
+
+
+def _apply_values(entries, base_values) -> list:
+    applied = []
+    for entry in entries:
+        if isinstance(entry, NodeOverlay):
+            base = base_values[entry.index]
+            values = base.values
+            if type(entry.values) is int:
+                mask = entry.values
+                values = [value for i, value in enumerate(values) if mask >> i & 1]
+            elif entry.values is not None:
+                values = _apply_values(entry.values, values)
+            applied.append(
+                TreeNodeView(base, key=entry.key, values=values, style=entry.style)
+            )
+        else:
+            applied.append(base_values[entry])
+    return applied
+
+
+def _freeze(node):
+    if isinstance(node, TreeNode):
+        return node.freeze()
+    if isinstance(node, TreeNodeView):
+        return TreeNode.from_dict(node.to_dict()).freeze()
+    return node
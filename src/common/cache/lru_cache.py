@@ -0,0 +1,83 @@
+import threading
+from collections import OrderedDict
+from typing import Hashable, Iterable
+
+_MISSING = object()
+
+
+class LruCache:
+    """
+    Thread-safe, size-bounded mapping with least-recently-used eviction.
+
+    Hit/miss/eviction counters are kept so the cache can be monitored;
+    ``put`` and ``put_many`` never count as lookups.
+    """
+
+    def __init__(self, max_size: int):
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive integer")
+        self.max_size = max_size
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default=None):
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value) -> None:
+        with self._lock:
+            self._store(key, value)
+
+    def put_many(self, items: dict) -> None:
+        with self._lock:
+            for key, value in items.items():
+                self._store(key, value)
+
+    def missing(self, keys: Iterable[Hashable]) -> set:
+        """Return the subset of ``keys`` that is not cached (no stats recorded)."""
+        with self._lock:
+            return {key for key in keys if key not in self._data}
+
+    def pop(self, key: Hashable, default=None):
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def _store(self, key: Hashable, value) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
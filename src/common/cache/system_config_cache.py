@@ -0,0 +1,67 @@
+import threading
+import time
+from typing import Callable, Generic, TypeVar
+
+from src.common.repository.system_config_repository import SystemConfigRepository
+
+T = TypeVar("T")
+
+DEFAULT_CHECK_INTERVAL_SECONDS = 30.0
+
+
+class SystemConfigCache(Generic[T]):
+    """
+    Process-wide parsed value of one system_config row.
+
+    The row is read and parsed once; afterwards its version stamp (an md5 of
+    the stored JSON computed by Postgres, a few bytes instead of the blob) is
+    compared at most every ``check_interval`` seconds, and the row is only
+    read and parsed again when the stamp changed.  Between checks ``get``
+    does not touch the database at all.  ``parse`` must treat its argument
+    and result as read-only: the result is shared by every thread.
+    """
+
+    def __init__(
+        self,
+        config_id: str,
+        parse: Callable[[object], T],
+        check_interval: float = DEFAULT_CHECK_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.config_id = config_id
+        self.parse = parse
+        self.check_interval = check_interval
+        self.clock = clock
+        self._value: T | None = None
+        self._stamp: str | None = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def get(self, repository: SystemConfigRepository) -> T:
+        now = self.clock()
+        with self._lock:
+            value, stamp = self._value, self._stamp
+            if value is not None and now - self._checked_at < self.check_interval:
+                return value
+
+        if value is not None and repository.get_config_stamp(self.config_id) == stamp:
+            with self._lock:
+                self._checked_at = now
+            return value
+
+        # read outside the lock; racing loads of one row are identical
+        row = repository.get_config_with_stamp(self.config_id)
+        if row is None:
+            raise LookupError(f"system_config {self.config_id!r} is missing")
+        json_config, stamp = row
+        value = self.parse(json_config)
+        with self._lock:
+            self._value, self._stamp, self._checked_at = value, stamp, now
+            self.loads += 1
+        return value
+
+    def peek(self) -> T | None:
+        """The value last loaded, without checking it is still current."""
+        with self._lock:
+            return self._value
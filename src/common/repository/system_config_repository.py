@@ -1,6 +1,12 @@
+from sqlalchemy import Text, cast, func, select
+
 from src.common.model.system_config import SystemConfig
 
 
+def _stamp_of_config():
+    return func.md5(cast(SystemConfig.json_config, Text))
+
+
 class SystemConfigRepository:
 
     def __init__(self, session):
@@ -8,3 +14,16 @@ class SystemConfigRepository:
 
     def get_config_by_id(self, config_id):
         return self.session.get(SystemConfig, config_id)
+
+    def get_config_with_stamp(self, config_id) -> tuple[object, str] | None:
+        """(json_config, md5 of the stored JSON text), or None."""
+        statement = select(SystemConfig.json_config, _stamp_of_config()).where(
+            SystemConfig.id == config_id
+        )
+        row = self.session.execute(statement).first()
+        return None if row is None else tuple(row)
+
+    def get_config_stamp(self, config_id) -> str | None:
+        """The md5 of the stored JSON text only, to tell whether it changed."""
+        statement = select(_stamp_of_config()).where(SystemConfig.id == config_id)
+        return self.session.execute(statement).scalar()
@@ -0,0 +1,35 @@
+import hashlib
+import json
+from datetime import datetime
+
+from flask import Response, request
+from werkzeug.http import is_resource_modified
+
+
+def content_etag(*parts) -> str:
+    """A strong validator for a response fully determined by ``parts``."""
+    canonical = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()[:32]
+
+
+def with_validators(
+    response: Response, etag: str, last_modified: datetime | None = None
+):
+    # private: payloads are per user; no-cache: clients revalidate every time
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+
+def not_modified(etag: str, last_modified: datetime | None = None) -> Response | None:
+    """
+    A 304 when the request's If-None-Match (or, without one,
+    If-Modified-Since) still matches, else None and the caller builds the
+    full response.
+    """
+    if is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+        return None
+    return with_validators(Response(status=304), etag, last_modified)
@@ -28,3 +28,19 @@ class Config:
 
     # CORS origins — comma-separated list, or "*" for all (default)
     CORS_ORIGINS = os.getenv("CORS_ORIGINS", "*")
+
+    # Upper bound of the per-process OMOP concept-name cache
+    CONCEPT_CACHE_SIZE = int(os.getenv("CONCEPT_CACHE_SIZE", 50000))
+    CASE_TREE_CACHE_SIZE = int(os.getenv("CASE_TREE_CACHE_SIZE", 1000))
+    REVIEW_OVERLAY_CACHE_SIZE = int(os.getenv("REVIEW_OVERLAY_CACHE_SIZE", 20000))
+    CASE_TREE_BUILD_LOCK = os.getenv("CASE_TREE_BUILD_LOCK", "false").lower() == "true"
+    PAGE_CONFIG_CHECK_SECONDS = float(os.getenv("PAGE_CONFIG_CHECK_SECONDS", 30))
+    ANSWER_CONFIG_CHECK_SECONDS = float(os.getenv("ANSWER_CONFIG_CHECK_SECONDS", 10))
+
+    # Build the next case review in the background after GET /api/cases
+    CASE_PREFETCH_ENABLED = os.getenv("CASE_PREFETCH_ENABLED", "true").lower() == "true"
+    CASE_PREFETCH_WORKERS = int(os.getenv("CASE_PREFETCH_WORKERS", 2))
+    CASE_PREFETCH_TTL_SECONDS = int(os.getenv("CASE_PREFETCH_TTL_SECONDS", 60))
+
+    # Most case reviews one POST /api/case-reviews/batch may return
+    CASE_REVIEW_BATCH_LIMIT = int(os.getenv("CASE_REVIEW_BATCH_LIMIT", 50))
@@ -1,10 +1,19 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request
 
 from src import db
 from src.common.model.ApiResponse import ApiResponse
+from src.common.utils.conditional_request import (
+    content_etag,
+    not_modified,
+    with_validators,
+)
 from src.configration.repository.answer_config_repository import (
     AnswerConfigurationRepository,
 )
+from src.configration.service.answer_config_cache import (
+    DEFAULT_CHECK_INTERVAL_SECONDS,
+    AnswerConfigCache,
+)
 from src.configration.service.answer_config_service import AnswerConfigurationService
 from src.answer.repository.answer_repository import AnswerRepository
 from src.user.utils.auth_utils import (
@@ -15,7 +24,14 @@ admin_answer_config_blueprint = Blueprint("admin_answer_config", __name__)
 answer_config_blueprint = Blueprint("answer_config", __name__)
 
 _cfg_repo = AnswerConfigurationRepository(db.session)
-_cfg_service = AnswerConfigurationService(_cfg_repo)
+# Shared with answer submission; rows by id plus the latest pointer, which
+# is checked every ANSWER_CONFIG_CHECK_SECONDS.
+answer_config_cache = AnswerConfigCache(
+    check_interval=current_app.config.get(
+        "ANSWER_CONFIG_CHECK_SECONDS", DEFAULT_CHECK_INTERVAL_SECONDS
+    )
+)
+_cfg_service = AnswerConfigurationService(_cfg_repo, answer_config_cache)
 
 
 def _needs_attention_check(
@@ -27,11 +43,11 @@ def _needs_attention_check(
     This is a simple heuristic to ensure users are paying attention.
 
     :param user_email: The email of the user to check.
-    :param repo: The AnswerRepository instance to query answered cases.
+    :param repo: The AnswerRepository instance to count answered cases.
     :return: bool: True if the user needs an attention check, False otherwise.
     """
-    completed: list[int] = repo.get_answered_case_list_by_user(user_email)
-    return (len(completed) + 1) % 10 == 0  # upcoming case index
+    completed = repo.get_answer_count(user_email)
+    return (completed + 1) % 10 == 0  # upcoming case index
 
 
 @admin_answer_config_blueprint.route("/config/answer", methods=["POST"])
@@ -57,32 +73,43 @@ def get_latest_answer_config():  # pragma: no cover
     :return: Tuple containing a JSON response with the latest answer configuration and HTTP status code.
     """
     # base config (raises -> 500 if none found)
-    cfg_dict = _cfg_service.get_latest_answer_config().to_dict()
+    answer_config = _cfg_service.get_latest_answer_config()
 
     # best-effort extract user email (tests call without JWT)
     try:
         user_email = get_user_email_from_jwt()
     except Exception:  # pragma: no cover
         user_email = None
+    attention_check = bool(user_email) and _needs_attention_check(
+        user_email, AnswerRepository(db.session)
+    )
 
+    # the payload only changes with the config row and the attention check;
+    # with a check the date alone would not tell, so only the ETag is sent
+    etag = content_etag(str(answer_config.id), attention_check)
+    last_modified = None if attention_check else answer_config.created_timestamp
+    unchanged = not_modified(etag, last_modified)
+    if unchanged is not None:
+        return unchanged
+
+    cfg_dict = answer_config.to_dict()
     # dynamic injection of attention check
-    if user_email:
-        repo = AnswerRepository(db.session)
-        if _needs_attention_check(user_email, repo):  # pragma: no cover
-            attention_cfg = {  # pragma: no cover
-                "title": (
-                    "Attention Check – please read carefully and select "
-                    "'All of the above' below"
-                ),
-                "type": "SingleChoice",
-                "options": [
-                    "I wasn’t really reading",
-                    "I’m just clicking through",
-                    "I prefer not to answer",
-                    "All of the above",  # <- correct answer
-                ],
-                "required": "true",
-            }
-            cfg_dict["config"] = list(cfg_dict["config"]) + [attention_cfg]
-
-    return jsonify(ApiResponse.success(cfg_dict)), 200
+    if attention_check:  # pragma: no cover
+        attention_cfg = {
+            "title": (
+                "Attention Check – please read carefully and select "
+                "'All of the above' below"
+            ),
+            "type": "SingleChoice",
+            "options": [
+                "I wasn’t really reading",
+                "I’m just clicking through",
+                "I prefer not to answer",
+                "All of the above",  # <- correct answer
+            ],
+            "required": "true",
+        }
+        cfg_dict["config"] = list(cfg_dict["config"]) + [attention_cfg]
+
+    response = jsonify(ApiResponse.success(cfg_dict))
+    return with_validators(response, etag, last_modified), 200
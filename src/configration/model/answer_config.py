@@ -11,7 +11,9 @@ class AnswerConfig(db.Model):
 
     id: str = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     config: str = db.Column(db.JSON, nullable=False)
-    created_timestamp: datetime = db.Column(db.DateTime, default=datetime.utcnow)
+    created_timestamp: datetime = db.Column(
+        db.DateTime, default=datetime.utcnow, index=True
+    )
 
     def to_dict(self):
         return {
@@ -1,3 +1,8 @@
+from typing import Callable
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import scoped_session
+
 from src.configration.model.answer_config import AnswerConfig
 
 
@@ -11,6 +16,14 @@ class AnswerConfigurationRepository:
 
         return answer_config
 
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Call callback once, when the current transaction commits."""
+        session = self.session
+        if isinstance(session, scoped_session):
+            # the session of this request, not every session of the registry
+            session = session()
+        event.listen(session, "after_commit", lambda _: callback(), once=True)
+
     def query_latest_answer_config(self) -> AnswerConfig:
         answer_config = (
             self.session.query(AnswerConfig)
@@ -20,5 +33,14 @@ class AnswerConfigurationRepository:
 
         return answer_config
 
+    def query_latest_answer_config_id(self):
+        """The id of the latest config only, from the created_timestamp index."""
+        statement = (
+            select(AnswerConfig.id)
+            .order_by(AnswerConfig.created_timestamp.desc())
+            .limit(1)
+        )
+        return self.session.execute(statement).scalar()
+
     def get_answer_config(self, id: str) -> AnswerConfig:
         return self.session.get(AnswerConfig, id)
@@ -0,0 +1,97 @@
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable
+
+from src.common.cache.lru_cache import LruCache
+from src.configration.model.answer_config import AnswerConfig
+from src.configration.repository.answer_config_repository import (
+    AnswerConfigurationRepository,
+)
+
+DEFAULT_ANSWER_CONFIG_CACHE_SIZE = 64
+DEFAULT_CHECK_INTERVAL_SECONDS = 10.0
+
+
+@dataclass(frozen=True, slots=True)
+class CachedAnswerConfig:
+    """
+    Read-only copy of an AnswerConfig row; entities expire with the session
+    that loaded them and cannot be shared between requests.
+    """
+
+    id: uuid.UUID
+    config: list
+    created_timestamp: datetime
+
+    @classmethod
+    def of(cls, answer_config: AnswerConfig) -> "CachedAnswerConfig":
+        return cls(
+            answer_config.id, answer_config.config, answer_config.created_timestamp
+        )
+
+    def to_dict(self):
+        return {
+            "id": str(self.id),
+            "config": self.config,
+            "created_timestamp": self.created_timestamp.isoformat(),
+        }
+
+
+class AnswerConfigCache:
+    """
+    Process-wide AnswerConfig rows by id, plus which of them is the latest.
+
+    Rows are never changed once inserted, so a cached row stays valid until
+    it is evicted; only the latest pointer goes stale.  It is re-read (the
+    id alone, over the created_timestamp index) at most every
+    ``check_interval`` seconds, and on the next lookup after this process
+    commits a new config; other worker processes pick a new config up at their
+    next check.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_ANSWER_CONFIG_CACHE_SIZE,
+        check_interval: float = DEFAULT_CHECK_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rows = LruCache(max_size)
+        self.check_interval = check_interval
+        self.clock = clock
+        self._latest_id = None
+        self._checked_at: float | None = None
+        self._lock = threading.Lock()
+
+    def get(
+        self, config_id, repository: AnswerConfigurationRepository
+    ) -> CachedAnswerConfig | None:
+        key = str(config_id)
+        cached = self.rows.get(key)
+        if cached is None:
+            answer_config = repository.get_answer_config(config_id)
+            if answer_config is None:
+                return None
+            cached = CachedAnswerConfig.of(answer_config)
+            self.rows.put(key, cached)
+        return cached
+
+    def get_latest(
+        self, repository: AnswerConfigurationRepository
+    ) -> CachedAnswerConfig | None:
+        now = self.clock()
+        with self._lock:
+            latest_id, checked_at = self._latest_id, self._checked_at
+        if checked_at is None or now - checked_at >= self.check_interval:
+            latest_id = repository.query_latest_answer_config_id()
+            with self._lock:
+                self._latest_id, self._checked_at = latest_id, now
+        if latest_id is None:
+            return None
+        return self.get(latest_id, repository)
+
+    def invalidate_latest(self) -> None:
+        with self._lock:
+            self._checked_at = None
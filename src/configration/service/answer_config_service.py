@@ -6,14 +6,23 @@ from src.configration.model.answer_config import AnswerConfig
 from src.configration.repository.answer_config_repository import (
     AnswerConfigurationRepository,
 )
+from src.configration.service.answer_config_cache import (
+    AnswerConfigCache,
+    CachedAnswerConfig,
+)
 from src.configration.utils.answer_config_validations.validation_factory import (
     validate_factory,
 )
 
 
 class AnswerConfigurationService:
-    def __init__(self, repository: AnswerConfigurationRepository):
+    def __init__(
+        self,
+        repository: AnswerConfigurationRepository,
+        cache: AnswerConfigCache | None = None,
+    ):
         self.repository = repository
+        self.cache = cache
 
     def add_new_answer_config(self, config: list[dict]):
         if len(config) == 0:
@@ -27,10 +36,18 @@ class AnswerConfigurationService:
 
         answer_config = AnswerConfig(config=config)
 
-        return self.repository.add_answer_config(answer_config).id
-
-    def get_latest_answer_config(self) -> AnswerConfig:
-        answer_config = self.repository.query_latest_answer_config()
+        new_id = self.repository.add_answer_config(answer_config).id
+        if self.cache is not None:
+            # not before: a lookup in between would re-read the old latest id
+            # and keep it for another check_interval
+            self.repository.after_commit(self.cache.invalidate_latest)
+        return new_id
+
+    def get_latest_answer_config(self) -> AnswerConfig | CachedAnswerConfig:
+        if self.cache is not None:
+            answer_config = self.cache.get_latest(self.repository)
+        else:
+            answer_config = self.repository.query_latest_answer_config()
 
         if answer_config is None:
             raise BusinessException(BusinessExceptionEnum.NoAnswerConfigAvailable)
@@ -11,6 +11,7 @@ from src.experiment.service.experiment_service import (
     InvalidExperimentStateError,
 )
 from src.user.model.display_config import DisplayConfig
+from src.user.utils.path_trie import compile_path_config
 
 experiment_blueprint = Blueprint("experiment", __name__)
 
@@ -129,11 +130,13 @@ def batch_create_configs():
             results.append({"status": "failed", "error": "user_email and case_id required"})
             continue
 
+        path_config = config_data.get("path_config")
         dc = DisplayConfig(
             user_email=user_email,
             case_id=case_id,
-            path_config=config_data.get("path_config"),
+            path_config=path_config,
             id=config_data.get("id"),
+            path_trie=compile_path_config(path_config),
         )
         # Set experiment tracking fields if present
         if "experiment_id" in config_data:
@@ -3,7 +3,7 @@ import os
 from datetime import datetime
 from functools import wraps
 
-from flask import Blueprint, Response, jsonify, request
+from flask import Blueprint, Response, jsonify, request, stream_with_context
 
 from src import db
 from src.common.model.ApiResponse import ApiResponse
@@ -69,6 +69,16 @@ def _parse_pagination(req) -> tuple[int, int]:
     return limit, offset
 
 
+def _parse_cursor(req) -> str | None:
+    # a cursor continues from the previous page; offset is then ignored
+    return req.args.get("cursor") or None
+
+
+def _parse_stream(req) -> bool:
+    # the whole export in one response; limit, offset and cursor are ignored
+    return req.args.get("stream", "").lower() == "true"
+
+
 def _parse_since(req) -> datetime | None:
     since_str = req.args.get("since")
     if since_str:
@@ -96,6 +106,28 @@ def _respond(result: dict, req):
     )
 
 
+def _stream_response(rows, req):
+    """
+    Stream rows as CSV (``Accept: text/csv``) or NDJSON, encoding them as
+    they are read from the database; the request context, and with it the
+    database session, stays open until the last row is sent.
+    """
+    accept = req.headers.get("Accept", "application/json")
+    service = _get_export_service()
+
+    if "text/csv" in accept:
+        return Response(
+            stream_with_context(service.iter_csv(rows)),
+            mimetype="text/csv",
+            headers={"Content-Disposition": "attachment; filename=export.csv"},
+        )
+
+    return Response(
+        stream_with_context(service.iter_ndjson(rows)),
+        mimetype="application/x-ndjson",
+    )
+
+
 @export_blueprint.route("/answers", methods=["GET"])
 @api_key_required()
 def export_answers():
@@ -103,7 +135,11 @@ def export_answers():
     limit, offset = _parse_pagination(request)
     since = _parse_since(request)
     service = _get_export_service()
-    result = service.export_answers(limit=limit, offset=offset, since=since)
+    if _parse_stream(request):
+        return _stream_response(service.stream_answers(since=since), request)
+    result = service.export_answers(
+        limit=limit, offset=offset, since=since, cursor=_parse_cursor(request)
+    )
     return _respond(result, request)
 
 
@@ -113,7 +149,11 @@ def export_display_configs():
     """Export current case assignments (display configurations)."""
     limit, offset = _parse_pagination(request)
     service = _get_export_service()
-    result = service.export_display_configs(limit=limit, offset=offset)
+    if _parse_stream(request):
+        return _stream_response(service.stream_display_configs(), request)
+    result = service.export_display_configs(
+        limit=limit, offset=offset, cursor=_parse_cursor(request)
+    )
     return _respond(result, request)
 
 
@@ -124,7 +164,11 @@ def export_analytics():
     limit, offset = _parse_pagination(request)
     since = _parse_since(request)
     service = _get_export_service()
-    result = service.export_analytics(limit=limit, offset=offset, since=since)
+    if _parse_stream(request):
+        return _stream_response(service.stream_analytics(since=since), request)
+    result = service.export_analytics(
+        limit=limit, offset=offset, since=since, cursor=_parse_cursor(request)
+    )
     return _respond(result, request)
 
 
@@ -134,5 +178,9 @@ def export_participants():
     """Export anonymized participant metadata with completion stats."""
     limit, offset = _parse_pagination(request)
     service = _get_export_service()
-    result = service.export_participants(limit=limit, offset=offset)
+    if _parse_stream(request):
+        return _stream_response(service.stream_participants(), request)
+    result = service.export_participants(
+        limit=limit, offset=offset, cursor=_parse_cursor(request)
+    )
     return _respond(result, request)
@@ -1,9 +1,11 @@
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional, Sequence
 
-from sqlalchemy import text
+from sqlalchemy import TextClause, text
 from sqlalchemy.orm import Session
 
+from src.export.repository.keyset import KeyColumn, keyset_page
+
 
 class ExportRepository:
     """
@@ -15,6 +17,62 @@ class ExportRepository:
 
     AI_OBS_CONCEPT_ID = 45614722
 
+    # sort keys of the exports; a page cursor holds the key of its last row
+    ANSWER_KEY = (
+        KeyColumn("user_email", "user_email", nullable=True),
+        KeyColumn("id", "answer_id"),
+    )
+    DISPLAY_CONFIG_KEY = (
+        KeyColumn("user_email", "user_email", nullable=True),
+        KeyColumn("case_id", "case_id", nullable=True),
+        KeyColumn("id", "config_id"),
+    )
+    ANALYTICS_KEY = (
+        KeyColumn("user_email", "user_email"),
+        KeyColumn("case_id", "case_id"),
+        KeyColumn("id", "analytics_id"),
+    )
+    PARTICIPANT_KEY = (KeyColumn("id", "user_id"),)
+
+    # rows fetched per round trip when streaming a whole export
+    STREAM_BATCH_SIZE = 1000
+
+    ANSWER_COLUMNS = """
+        a.id AS answer_id,
+        a.case_id,
+        a.user_email,
+        a.answer,
+        a.display_configuration,
+        a.ai_score_shown,
+        a.answer_config_id,
+        a.created_timestamp AS answer_created_at,
+        v.person_id,
+        v.visit_start_date,
+        p.year_of_birth,
+        g.concept_name AS gender_name,
+        (
+            SELECT o.value_as_string
+            FROM observation o
+            WHERE o.visit_occurrence_id = a.case_id
+              AND o.observation_concept_id = :ai_concept
+            ORDER BY o.observation_datetime NULLS LAST, o.observation_id DESC
+            LIMIT 1
+        ) AS ai_value_as_string,
+        an.case_open_time,
+        an.answer_open_time,
+        an.answer_submit_time,
+        an.to_answer_open_secs,
+        an.to_submit_secs,
+        an.total_duration_secs
+    """
+    ANSWER_JOINS = """
+        LEFT JOIN visit_occurrence v ON v.visit_occurrence_id = a.case_id
+        LEFT JOIN person p ON p.person_id = v.person_id
+        LEFT JOIN concept g ON g.concept_id = p.gender_concept_id
+        LEFT JOIN analytics an ON an.user_email = a.user_email
+            AND an.case_id = a.case_id
+    """
+
     def __init__(self, session: Session):
         self.session = session
 
@@ -23,8 +81,14 @@ class ExportRepository:
         limit: int = 1000,
         offset: int = 0,
         since: Optional[datetime] = None,
+        after: Optional[Sequence] = None,
     ) -> list[dict]:
-        """Export answer data with OMOP joins for demographics, AI scores, and timing."""
+        """
+        Export answer data with OMOP joins for demographics, AI scores, and timing.
+        Pages by ``offset``, or by keyset after the ANSWER_KEY ``after``.
+        ``order_id`` numbers each user's answers across pages: the first user
+        of a page continues from the count of their answers before it.
+        """
         params = {
             "ai_concept": self.AI_OBS_CONCEPT_ID,
             "limit": limit,
@@ -32,54 +96,69 @@ class ExportRepository:
         }
 
         since_clause = ""
+        where = []
         if since:
-            since_clause = "AND a.created_timestamp >= :since"
+            since_clause = "AND b.created_timestamp >= :since"
+            where.append("t.created_timestamp >= :since")
             params["since"] = since
 
+        page, page_params = keyset_page("answer", self.ANSWER_KEY, where, after)
+        params.update(page_params)
+
         sql = text(f"""
+            WITH page AS ({page}),
+            firsts AS (
+                SELECT user_email, MIN(id) AS first_id FROM page GROUP BY user_email
+            ),
+            earlier AS (
+                SELECT
+                    f.user_email,
+                    CASE WHEN f.user_email IS NULL THEN (
+                        SELECT COUNT(*) FROM answer b
+                        WHERE b.user_email IS NULL AND b.id < f.first_id
+                        {since_clause}
+                    ) ELSE (
+                        SELECT COUNT(*) FROM answer b
+                        WHERE b.user_email = f.user_email AND b.id < f.first_id
+                        {since_clause}
+                    ) END AS answers_before
+                FROM firsts f
+            )
             SELECT
-                a.id AS answer_id,
-                a.case_id,
-                a.user_email,
-                a.answer,
-                a.display_configuration,
-                a.ai_score_shown,
-                a.answer_config_id,
-                a.created_timestamp AS answer_created_at,
-                v.person_id,
-                v.visit_start_date,
-                p.year_of_birth,
-                g.concept_name AS gender_name,
-                (
-                    SELECT o.value_as_string
-                    FROM observation o
-                    WHERE o.visit_occurrence_id = a.case_id
-                      AND o.observation_concept_id = :ai_concept
-                    ORDER BY o.observation_datetime NULLS LAST, o.observation_id DESC
-                    LIMIT 1
-                ) AS ai_value_as_string,
-                an.case_open_time,
-                an.answer_open_time,
-                an.answer_submit_time,
-                an.to_answer_open_secs,
-                an.to_submit_secs,
-                an.total_duration_secs,
-                ROW_NUMBER() OVER (PARTITION BY a.user_email ORDER BY a.id ASC) AS order_id
+                {self.ANSWER_COLUMNS},
+                e.answers_before
+                    + ROW_NUMBER() OVER (PARTITION BY a.user_email ORDER BY a.id ASC)
+                    AS order_id
+            FROM page
+            JOIN answer a ON a.id = page.id
+            JOIN earlier e ON e.user_email IS NOT DISTINCT FROM a.user_email
+            {self.ANSWER_JOINS}
+            ORDER BY a.user_email, a.id ASC
+        """)
+        return self._rows(sql, params)
+
+    def stream_answers(self, since: Optional[datetime] = None) -> Iterator[dict]:
+        """
+        All answers as get_answers pages them, read in one query; rows follow
+        the (user_email, id) index, so order_id needs no sort.
+        """
+        params = {"ai_concept": self.AI_OBS_CONCEPT_ID}
+        since_clause = ""
+        if since:
+            since_clause = "WHERE a.created_timestamp >= :since"
+            params["since"] = since
+
+        sql = text(f"""
+            SELECT
+                {self.ANSWER_COLUMNS},
+                ROW_NUMBER() OVER (PARTITION BY a.user_email ORDER BY a.id ASC)
+                    AS order_id
             FROM answer a
-            LEFT JOIN visit_occurrence v ON v.visit_occurrence_id = a.case_id
-            LEFT JOIN person p ON p.person_id = v.person_id
-            LEFT JOIN concept g ON g.concept_id = p.gender_concept_id
-            LEFT JOIN analytics an ON an.user_email = a.user_email
-                AND an.case_id = a.case_id
-            WHERE 1=1
+            {self.ANSWER_JOINS}
             {since_clause}
             ORDER BY a.user_email, a.id ASC
-            LIMIT :limit OFFSET :offset
         """)
-
-        result = self.session.execute(sql, params)
-        columns = result.keys()
-        return [dict(zip(columns, row)) for row in result.fetchall()]
+        return self._stream(sql, params)
 
     def count_answers(self, since: Optional[datetime] = None) -> int:
         """Count total answers for pagination metadata."""
@@ -96,9 +175,18 @@ class ExportRepository:
         self,
         limit: int = 1000,
         offset: int = 0,
+        after: Optional[Sequence] = None,
     ) -> list[dict]:
         """Export display config assignments."""
-        sql = text("""
+        return self._rows(*self._display_configs_query(limit, offset, after))
+
+    def stream_display_configs(self) -> Iterator[dict]:
+        return self._stream(*self._display_configs_query(None, 0, None))
+
+    def _display_configs_query(self, limit, offset, after) -> tuple[TextClause, dict]:
+        page, params = keyset_page("display_config", self.DISPLAY_CONFIG_KEY, (), after)
+        sql = text(f"""
+            WITH page AS ({page})
             SELECT
                 dc.id AS config_id,
                 dc.user_email,
@@ -106,14 +194,12 @@ class ExportRepository:
                 dc.path_config,
                 v.person_id,
                 v.visit_start_date
-            FROM display_config dc
+            FROM page
+            JOIN display_config dc ON dc.id = page.id
             LEFT JOIN visit_occurrence v ON v.visit_occurrence_id = dc.case_id
-            ORDER BY dc.user_email, dc.case_id
-            LIMIT :limit OFFSET :offset
+            ORDER BY dc.user_email, dc.case_id, dc.id
         """)
-        result = self.session.execute(sql, {"limit": limit, "offset": offset})
-        columns = result.keys()
-        return [dict(zip(columns, row)) for row in result.fetchall()]
+        return sql, {"limit": limit, "offset": offset, **params}
 
     def count_display_configs(self) -> int:
         sql = text("SELECT COUNT(*) FROM display_config")
@@ -124,15 +210,26 @@ class ExportRepository:
         limit: int = 1000,
         offset: int = 0,
         since: Optional[datetime] = None,
+        after: Optional[Sequence] = None,
     ) -> list[dict]:
         """Export timing analytics."""
+        return self._rows(*self._analytics_query(limit, offset, since, after))
+
+    def stream_analytics(self, since: Optional[datetime] = None) -> Iterator[dict]:
+        return self._stream(*self._analytics_query(None, 0, since, None))
+
+    def _analytics_query(self, limit, offset, since, after) -> tuple[TextClause, dict]:
         params = {"limit": limit, "offset": offset}
-        since_clause = ""
+        where = []
         if since:
-            since_clause = "WHERE an.created_timestamp >= :since"
+            where.append("t.created_timestamp >= :since")
             params["since"] = since
 
+        page, page_params = keyset_page("analytics", self.ANALYTICS_KEY, where, after)
+        params.update(page_params)
+
         sql = text(f"""
+            WITH page AS ({page})
             SELECT
                 an.id AS analytics_id,
                 an.user_email,
@@ -145,14 +242,11 @@ class ExportRepository:
                 an.to_submit_secs,
                 an.total_duration_secs,
                 an.created_timestamp AS analytics_created_at
-            FROM analytics an
-            {since_clause}
-            ORDER BY an.user_email, an.case_id
-            LIMIT :limit OFFSET :offset
+            FROM page
+            JOIN analytics an ON an.id = page.id
+            ORDER BY an.user_email, an.case_id, an.id
         """)
-        result = self.session.execute(sql, params)
-        columns = result.keys()
-        return [dict(zip(columns, row)) for row in result.fetchall()]
+        return sql, params
 
     def count_analytics(self, since: Optional[datetime] = None) -> int:
         params = {}
@@ -167,9 +261,20 @@ class ExportRepository:
         self,
         limit: int = 1000,
         offset: int = 0,
+        after: Optional[Sequence] = None,
     ) -> list[dict]:
         """Export anonymized participant metadata with completion stats."""
-        sql = text("""
+        return self._rows(*self._participants_query(limit, offset, after))
+
+    def stream_participants(self) -> Iterator[dict]:
+        return self._stream(*self._participants_query(None, 0, None))
+
+    def _participants_query(self, limit, offset, after) -> tuple[TextClause, dict]:
+        page, params = keyset_page(
+            '"user"', self.PARTICIPANT_KEY, ["t.admin_flag = false"], after
+        )
+        sql = text(f"""
+            WITH page AS ({page})
             SELECT
                 u.id AS user_id,
                 u.position,
@@ -180,15 +285,33 @@ class ExportRepository:
                 u.created_timestamp AS user_created_at,
                 (SELECT COUNT(*) FROM answer a WHERE a.user_email = u.email) AS cases_completed,
                 (SELECT COUNT(*) FROM display_config dc WHERE dc.user_email = u.email) AS cases_assigned
-            FROM "user" u
-            WHERE u.admin_flag = false
+            FROM page
+            JOIN "user" u ON u.id = page.id
             ORDER BY u.id
-            LIMIT :limit OFFSET :offset
         """)
-        result = self.session.execute(sql, {"limit": limit, "offset": offset})
-        columns = result.keys()
-        return [dict(zip(columns, row)) for row in result.fetchall()]
+        return sql, {"limit": limit, "offset": offset, **params}
 
     def count_participants(self) -> int:
         sql = text('SELECT COUNT(*) FROM "user" WHERE admin_flag = false')
         return self.session.execute(sql).scalar()
+
+    def _rows(self, sql: TextClause, params: dict) -> list[dict]:
+        result = self.session.execute(sql, params)
+        columns = result.keys()
+        return [dict(zip(columns, row)) for row in result.fetchall()]
+
+    def _stream(self, sql: TextClause, params: dict) -> Iterator[dict]:
+        """
+        Rows of sql read through a server-side cursor, STREAM_BATCH_SIZE at a
+        time, so a whole table is never held in memory.  The query runs when
+        iteration starts, and the session must stay open until it ends.
+        """
+        result = self.session.execute(
+            sql, params, execution_options={"yield_per": self.STREAM_BATCH_SIZE}
+        )
+        try:
+            columns = list(result.keys())
+            for row in result:
+                yield dict(zip(columns, row))
+        finally:
+            result.close()
@@ -0,0 +1,75 @@
+"""
+Keyset pagination for the export queries.
+
+A page after a cursor is selected by the sort key itself, so every page is
+an index range scan however deep into the table it is, where ``OFFSET``
+reads and discards every row before the page.  Sort keys may contain
+nullable columns (sorted last, as Postgres does for ``ASC``); rows after a
+cursor are then the union of one range per key prefix, each of which can
+still be read from a composite index in order.
+"""
+
+from dataclasses import dataclass
+from typing import Sequence
+
+
+@dataclass(frozen=True)
+class KeyColumn:
+    """A sort-key column, by its name in the table and in the exported row."""
+
+    column: str
+    field: str
+    nullable: bool = False
+
+
+def keyset_page(
+    table: str,
+    key: Sequence[KeyColumn],
+    where: Sequence[str] = (),
+    after: Sequence | None = None,
+) -> tuple[str, dict]:
+    """
+    SQL selecting the key columns of one page of ``table`` (aliased ``t``),
+    ordered by ``key``, whose last column must be unique and not null.
+    Without ``after`` the page is ``LIMIT :limit OFFSET :offset``;
+    otherwise it is the ``:limit`` rows following the row keyed ``after``.
+    """
+    columns = ", ".join(f"t.{c.column}" for c in key)
+    order = ", ".join(c.column for c in key)
+    if after is None:
+        return (
+            f"SELECT {columns} FROM {table} t {_where(where)} "
+            f"ORDER BY {order} LIMIT :limit OFFSET :offset",
+            {},
+        )
+
+    branches, params = _after(key, after)
+    ranges = " UNION ALL ".join(
+        f"(SELECT {columns} FROM {table} t {_where([*where, branch])} "
+        f"ORDER BY {order} LIMIT :limit)"
+        for branch in branches
+    )
+    return f"SELECT * FROM ({ranges}) ranges ORDER BY {order} LIMIT :limit", params
+
+
+def _after(key: Sequence[KeyColumn], after: Sequence) -> tuple[list[str], dict]:
+    # rows after (k1, k2, ..., kn): k1 > v1, or k1 = v1 and (k2, ..., kn) after
+    # (v2, ..., vn); with NULLS LAST a NULL value only has NULLs after it, and
+    # a value of a nullable column has all of that column's NULLs after it
+    branches, prefix, params = [], [], {}
+    for position, (column, value) in enumerate(zip(key, after)):
+        name = f"t.{column.column}"
+        if value is None:
+            prefix.append(f"{name} IS NULL")
+            continue
+        param = f"after_{position}"
+        params[param] = value
+        branches.append(" AND ".join([*prefix, f"{name} > :{param}"]))
+        if column.nullable:
+            branches.append(" AND ".join([*prefix, f"{name} IS NULL"]))
+        prefix.append(f"{name} = :{param}")
+    return branches, params
+
+
+def _where(conditions: Sequence[str]) -> str:
+    return f"WHERE {' AND '.join(conditions)}" if conditions else ""
@@ -0,0 +1,27 @@
+import base64
+import json
+from typing import Sequence
+
+from werkzeug.exceptions import BadRequest
+
+
+class InvalidCursor(BadRequest):
+    description = "Invalid export cursor."
+
+
+def encode_cursor(values: Sequence) -> str:
+    """Opaque token for the sort key of the last row of a page."""
+    data = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, length: int) -> list:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:
+        raise InvalidCursor()
+    if not isinstance(values, list) or len(values) != length:
+        raise InvalidCursor()
+    if not all(value is None or isinstance(value, (str, int)) for value in values):
+        raise InvalidCursor()
+    return values
@@ -1,17 +1,30 @@
 import csv
 import io
+import json
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional, Sequence
 
 from src.export.repository.export_repository import ExportRepository
+from src.export.repository.keyset import KeyColumn
+from src.export.service.export_cursor import decode_cursor, encode_cursor
 
 
 class ExportService:
     """
     Business logic for data export. Handles pagination metadata
     and CSV formatting.
+
+    Pages are requested by ``offset`` or, cheaper for deep pages, by the
+    ``cursor`` of the previous page (``next_cursor`` of its pagination).
+    Cursor pages skip the ``total`` count, which costs a full scan.
+
+    The ``stream_*`` methods yield a whole export instead, for
+    ``iter_csv``/``iter_ndjson`` to encode as it is read.
     """
 
+    # rows encoded per chunk of a streamed response
+    STREAM_CHUNK_ROWS = 500
+
     def __init__(self, export_repository: ExportRepository):
         self.repo = export_repository
 
@@ -20,71 +33,190 @@ class ExportService:
         limit: int = 1000,
         offset: int = 0,
         since: Optional[datetime] = None,
+        cursor: Optional[str] = None,
     ) -> dict:
+        if cursor:
+            return self._cursor_page(
+                lambda after: self.repo.get_answers(
+                    limit=limit + 1, since=since, after=after
+                ),
+                self.repo.ANSWER_KEY,
+                cursor,
+                limit,
+            )
         rows = self.repo.get_answers(limit=limit, offset=offset, since=since)
         total = self.repo.count_answers(since=since)
-        return self._paginated_response(rows, total, limit, offset)
+        return self._paginated_response(
+            rows, total, limit, offset, self.repo.ANSWER_KEY
+        )
 
     def export_display_configs(
         self,
         limit: int = 1000,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> dict:
+        if cursor:
+            return self._cursor_page(
+                lambda after: self.repo.get_display_configs(
+                    limit=limit + 1, after=after
+                ),
+                self.repo.DISPLAY_CONFIG_KEY,
+                cursor,
+                limit,
+            )
         rows = self.repo.get_display_configs(limit=limit, offset=offset)
         total = self.repo.count_display_configs()
-        return self._paginated_response(rows, total, limit, offset)
+        return self._paginated_response(
+            rows, total, limit, offset, self.repo.DISPLAY_CONFIG_KEY
+        )
 
     def export_analytics(
         self,
         limit: int = 1000,
         offset: int = 0,
         since: Optional[datetime] = None,
+        cursor: Optional[str] = None,
     ) -> dict:
+        if cursor:
+            return self._cursor_page(
+                lambda after: self.repo.get_analytics(
+                    limit=limit + 1, since=since, after=after
+                ),
+                self.repo.ANALYTICS_KEY,
+                cursor,
+                limit,
+            )
         rows = self.repo.get_analytics(limit=limit, offset=offset, since=since)
         total = self.repo.count_analytics(since=since)
-        return self._paginated_response(rows, total, limit, offset)
+        return self._paginated_response(
+            rows, total, limit, offset, self.repo.ANALYTICS_KEY
+        )
 
     def export_participants(
         self,
         limit: int = 1000,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> dict:
+        if cursor:
+            return self._cursor_page(
+                lambda after: self.repo.get_participants(
+                    limit=limit + 1, after=after
+                ),
+                self.repo.PARTICIPANT_KEY,
+                cursor,
+                limit,
+            )
         rows = self.repo.get_participants(limit=limit, offset=offset)
         total = self.repo.count_participants()
-        return self._paginated_response(rows, total, limit, offset)
+        return self._paginated_response(
+            rows, total, limit, offset, self.repo.PARTICIPANT_KEY
+        )
+
+    def stream_answers(self, since: Optional[datetime] = None) -> Iterator[dict]:
+        return self.repo.stream_answers(since=since)
+
+    def stream_display_configs(self) -> Iterator[dict]:
+        return self.repo.stream_display_configs()
+
+    def stream_analytics(self, since: Optional[datetime] = None) -> Iterator[dict]:
+        return self.repo.stream_analytics(since=since)
+
+    def stream_participants(self) -> Iterator[dict]:
+        return self.repo.stream_participants()
 
     @staticmethod
     def rows_to_csv(rows: list[dict]) -> str:
         """Convert list of dicts to CSV string."""
-        if not rows:
-            return ""
+        return "".join(ExportService.iter_csv(rows))
+
+    @classmethod
+    def iter_csv(cls, rows: Iterable[dict]) -> Iterator[str]:
+        """CSV of rows, in chunks of STREAM_CHUNK_ROWS rows as they are read."""
         output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=rows[0].keys())
-        writer.writeheader()
+        writer = None
+        for count, row in enumerate(rows, 1):
+            if writer is None:
+                writer = csv.DictWriter(output, fieldnames=row.keys())
+                writer.writeheader()
+            writer.writerow(_csv_row(row))
+            if count % cls.STREAM_CHUNK_ROWS == 0:
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate()
+        if output.tell():
+            yield output.getvalue()
+
+    @classmethod
+    def iter_ndjson(cls, rows: Iterable[dict]) -> Iterator[str]:
+        """One JSON object per line, serialized like the JSON responses."""
+        lines = []
         for row in rows:
-            # Serialize datetime and complex types
-            cleaned = {}
-            for k, v in row.items():
-                if isinstance(v, datetime):
-                    cleaned[k] = v.isoformat()
-                elif isinstance(v, (dict, list)):
-                    import json
-                    cleaned[k] = json.dumps(v)
-                else:
-                    cleaned[k] = v
-            writer.writerow(cleaned)
-        return output.getvalue()
+            lines.append(json.dumps(row, default=str) + "\n")
+            if len(lines) == cls.STREAM_CHUNK_ROWS:
+                yield "".join(lines)
+                lines = []
+        if lines:
+            yield "".join(lines)
 
     @staticmethod
     def _paginated_response(
-        rows: list[dict], total: int, limit: int, offset: int
+        rows: list[dict],
+        total: int,
+        limit: int,
+        offset: int,
+        key: Sequence[KeyColumn],
     ) -> dict:
+        has_more = offset + limit < total
         return {
             "data": rows,
             "pagination": {
                 "total": total,
                 "limit": limit,
                 "offset": offset,
-                "has_more": offset + limit < total,
+                "has_more": has_more,
+                "next_cursor": _next_cursor(rows, key) if has_more else None,
+            },
+        }
+
+    @staticmethod
+    def _cursor_page(
+        get_rows: Callable[[list], list[dict]],
+        key: Sequence[KeyColumn],
+        cursor: str,
+        limit: int,
+    ) -> dict:
+        # one row past the page tells whether there is a next one
+        rows = get_rows(decode_cursor(cursor, len(key)))
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        return {
+            "data": rows,
+            "pagination": {
+                "total": None,
+                "limit": limit,
+                "offset": None,
+                "has_more": has_more,
+                "next_cursor": _next_cursor(rows, key) if has_more else None,
             },
         }
+
+
+def _next_cursor(rows: list[dict], key: Sequence[KeyColumn]) -> Optional[str]:
+    if not rows:
+        return None
+    return encode_cursor([rows[-1][column.field] for column in key])
+
+
+def _csv_row(row: dict) -> dict:
+    # Serialize datetime and complex types
+    cleaned = {}
+    for k, v in row.items():
+        if isinstance(v, datetime):
+            cleaned[k] = v.isoformat()
+        elif isinstance(v, (dict, list)):
+            cleaned[k] = json.dumps(v)
+        else:
+            cleaned[k] = v
+    return cleaned
@@ -0,0 +1,36 @@
+"""create case tree cache table
+
+Revision ID: 3f9a1c7e2b4d
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '3f9a1c7e2b4d'
+down_revision = 'a1b2c3d4e5f6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'case_tree_cache',
+        sa.Column('case_id', sa.Integer, nullable=False),
+        sa.Column('page_config_hash', sa.String(64), nullable=False),
+        sa.Column('person_name', sa.String, nullable=True),
+        sa.Column('tree', sa.JSON, nullable=False),
+        sa.Column(
+            'created_timestamp',
+            sa.DateTime(timezone=True),
+            nullable=True,
+            server_default=sa.text('CURRENT_TIMESTAMP'),
+        ),
+        sa.PrimaryKeyConstraint('case_id', 'page_config_hash'),
+    )
+
+
+def downgrade():
+    op.drop_table('case_tree_cache')
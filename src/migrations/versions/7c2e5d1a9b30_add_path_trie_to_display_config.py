@@ -0,0 +1,24 @@
+"""add path_trie to display_config
+
+Revision ID: 7c2e5d1a9b30
+Revises: 3f9a1c7e2b4d
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '7c2e5d1a9b30'
+down_revision = '3f9a1c7e2b4d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing rows stay NULL; their trie is compiled on read until re-uploaded.
+    op.add_column('display_config', sa.Column('path_trie', sa.JSON(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('display_config', 'path_trie')
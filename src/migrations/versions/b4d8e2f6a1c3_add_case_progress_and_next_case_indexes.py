@@ -0,0 +1,44 @@
+"""add case_progress table and next-case indexes
+
+Revision ID: b4d8e2f6a1c3
+Revises: 7c2e5d1a9b30
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'b4d8e2f6a1c3'
+down_revision = '7c2e5d1a9b30'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'case_progress',
+        sa.Column('user_email', sa.String(128), nullable=False),
+        sa.Column('next_config_id', sa.String, nullable=True),
+        sa.Column(
+            'modified_timestamp',
+            sa.DateTime(timezone=True),
+            nullable=True,
+            server_default=sa.text('CURRENT_TIMESTAMP'),
+        ),
+        sa.PrimaryKeyConstraint('user_email'),
+    )
+    # next unanswered config: display_config rows of a user anti-joined
+    # against that user's answers
+    op.create_index(
+        'ix_display_config_user_email', 'display_config', ['user_email']
+    )
+    op.create_index(
+        'ix_answer_user_email_task_id', 'answer', ['user_email', 'task_id']
+    )
+
+
+def downgrade():
+    op.drop_index('ix_answer_user_email_task_id', table_name='answer')
+    op.drop_index('ix_display_config_user_email', table_name='display_config')
+    op.drop_table('case_progress')
@@ -0,0 +1,38 @@
+"""add indexes for case review and dashboard hot paths
+
+Revision ID: c9e1f3a5b7d2
+Revises: b4d8e2f6a1c3
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'c9e1f3a5b7d2'
+down_revision = 'b4d8e2f6a1c3'
+branch_labels = None
+depends_on = None
+
+# display_config(user_email) and answer(user_email, task_id) were added with
+# case_progress in b4d8e2f6a1c3.
+INDEXES = [
+    ('ix_observation_visit_concept', 'observation',
+     ['visit_occurrence_id', 'observation_concept_id']),
+    ('ix_observation_visit_type', 'observation',
+     ['visit_occurrence_id', 'observation_type_concept_id']),
+    ('ix_measurement_visit_concept', 'measurement',
+     ['visit_occurrence_id', 'measurement_concept_id']),
+    ('ix_drug_exposure_visit', 'drug_exposure', ['visit_occurrence_id']),
+    ('ix_concept_relationship_concept_1_relationship', 'concept_relationship',
+     ['concept_id_1', 'relationship_id']),
+]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,24 @@
+"""index answer_config.created_timestamp for the latest-config lookup
+
+Revision ID: d4a7c2e9f1b3
+Revises: c9e1f3a5b7d2
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'd4a7c2e9f1b3'
+down_revision = 'c9e1f3a5b7d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_answer_config_created_timestamp', 'answer_config', ['created_timestamp']
+    )
+
+
+def downgrade():
+    op.drop_index('ix_answer_config_created_timestamp', table_name='answer_config')
@@ -0,0 +1,41 @@
+"""add user_answer_count table
+
+Revision ID: e8b3f5a1c6d7
+Revises: d4a7c2e9f1b3
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'e8b3f5a1c6d7'
+down_revision = 'd4a7c2e9f1b3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'user_answer_count',
+        sa.Column('user_email', sa.String(128), nullable=False),
+        sa.Column(
+            'answer_count', sa.Integer, nullable=False, server_default='0'
+        ),
+        sa.Column(
+            'modified_timestamp',
+            sa.DateTime(timezone=True),
+            nullable=True,
+            server_default=sa.text('CURRENT_TIMESTAMP'),
+        ),
+        sa.PrimaryKeyConstraint('user_email'),
+    )
+    op.execute(
+        'INSERT INTO user_answer_count (user_email, answer_count) '
+        'SELECT user_email, count(*) FROM answer '
+        'WHERE user_email IS NOT NULL GROUP BY user_email'
+    )
+
+
+def downgrade():
+    op.drop_table('user_answer_count')
@@ -0,0 +1,39 @@
+"""add indexes for keyset pagination of the exports
+
+Revision ID: f2c6a9d4b8e1
+Revises: e8b3f5a1c6d7
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'f2c6a9d4b8e1'
+down_revision = 'e8b3f5a1c6d7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # one per export sort key, so a page after a cursor is an index range scan
+    op.create_index(
+        'ix_answer_user_email_id', 'answer', ['user_email', 'id']
+    )
+    op.create_index(
+        'ix_display_config_user_email_case_id_id',
+        'display_config',
+        ['user_email', 'case_id', 'id'],
+    )
+    op.create_index(
+        'ix_analytics_user_email_case_id_id',
+        'analytics',
+        ['user_email', 'case_id', 'id'],
+    )
+
+
+def downgrade():
+    op.drop_index('ix_analytics_user_email_case_id_id', table_name='analytics')
+    op.drop_index(
+        'ix_display_config_user_email_case_id_id', table_name='display_config'
+    )
+    op.drop_index('ix_answer_user_email_id', table_name='answer')
@@ -4,15 +4,22 @@ from src import db
 class DisplayConfig(db.Model):
     __tablename__ = "display_config"
     id = db.Column(db.String, primary_key=True)
-    user_email = db.Column(db.String)
+    user_email = db.Column(db.String, index=True)
     case_id = db.Column(db.Integer)
     path_config = db.Column(db.JSON, nullable=True)
     experiment_id = db.Column(db.String(100), nullable=True)
     rl_run_id = db.Column(db.Integer, nullable=True)
     arm = db.Column(db.String(100), nullable=True)
+    # path_config compiled by src.user.utils.path_trie.compile_path_config
+    path_trie = db.Column(db.JSON, nullable=True)
+
+    __table_args__ = (
+        # export sort key
+        db.Index("ix_display_config_user_email_case_id_id", "user_email", "case_id", "id"),
+    )
 
     def __init__(self, user_email, case_id, path_config=None, id=None,
-                 experiment_id=None, rl_run_id=None, arm=None):
+                 experiment_id=None, rl_run_id=None, arm=None, path_trie=None):
         self.user_email = user_email
         self.case_id = case_id
         self.path_config = path_config
@@ -20,6 +27,7 @@ class DisplayConfig(db.Model):
         self.experiment_id = experiment_id
         self.rl_run_id = rl_run_id
         self.arm = arm
+        self.path_trie = path_trie
 
     def to_dict(self):
         return {
@@ -1,7 +1,10 @@
 import json
 import uuid
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
+from sqlalchemy import select
+
+from src.answer.model.answer import Answer
 from src.user.model.display_config import DisplayConfig
 
 
@@ -32,11 +35,44 @@ class DisplayConfigRepository:
     def get_configuration_by_id(self, config_id) -> DisplayConfig:
         return self.session.get(DisplayConfig, config_id)
 
-    def get_case_configurations_by_user(self, user_email: str) -> List[Tuple[int, str]]:
-        configurations = (
-            self.session.query(DisplayConfig.case_id, DisplayConfig.id)
-            .filter(DisplayConfig.user_email == user_email)
-            .all()
+    def get_configurations_by_ids(self, config_ids) -> List[DisplayConfig]:
+        statement = select(DisplayConfig).where(DisplayConfig.id.in_(config_ids))
+        return self.session.execute(statement).scalars().all()
+
+    def get_next_unanswered_configuration(
+        self, user_email: str, config_id: Optional[str] = None
+    ) -> Optional[Tuple[int, str]]:
+        """
+        (case_id, config_id) of a config of the user that the user has not
+        answered yet, restricted to config_id when given.  One anti-join
+        against answer, served by ix_display_config_user_email and
+        ix_answer_user_email_task_id; ordered by id so repeated reads pick the
+        same config and the stored progress cursor stays put.
+        """
+        answered = select(Answer.id).where(
+            Answer.task_id == DisplayConfig.id, Answer.user_email == user_email
+        )
+        statement = select(DisplayConfig.case_id, DisplayConfig.id).where(
+            DisplayConfig.user_email == user_email, ~answered.exists()
         )
+        if config_id is not None:
+            statement = statement.where(DisplayConfig.id == config_id)
+        row = self.session.execute(
+            statement.order_by(DisplayConfig.id).limit(1)
+        ).first()
+        return None if row is None else (row.case_id, row.id)
 
-        return [(config.case_id, config.id) for config in configurations]
+    def get_unanswered_configurations(
+        self, user_email: str, limit: int
+    ) -> List[DisplayConfig]:
+        """Up to limit configs of the user not answered yet; same anti-join."""
+        answered = select(Answer.id).where(
+            Answer.task_id == DisplayConfig.id, Answer.user_email == user_email
+        )
+        statement = (
+            select(DisplayConfig)
+            .where(DisplayConfig.user_email == user_email, ~answered.exists())
+            .order_by(DisplayConfig.id)
+            .limit(limit)
+        )
+        return self.session.execute(statement).scalars().all()
@@ -5,6 +5,7 @@ from werkzeug.exceptions import InternalServerError
 from src.common.exception.BusinessException import BusinessException
 from src.user.repository.display_config_repository import DisplayConfigRepository
 from src.user.utils.csv_parser import parse_csv_stream_to_configurations
+from src.user.utils.path_trie import compile_path_config
 
 
 class ConfigurationService:
@@ -30,6 +31,7 @@ class ConfigurationService:
             user_case_key = f"{config.user_email}-{config.case_id}"
             result = {"user_case_key": user_case_key}
             try:
+                config.path_trie = compile_path_config(config.path_config)
                 self.repository.save_configuration(config)
                 result["status"] = "added"
             except Exception:
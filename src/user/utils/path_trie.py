@@ -0,0 +1,102 @@
+"""
+Compile a DisplayConfig.path_config into a prefix trie once, when the config
+is uploaded, so case reviews do not have to re-parse it on every request.
+
+The compiled form is plain JSON (it is stored in display_config.path_trie):
+
+    {
+      "version": 2,
+      "root": {"BACKGROUND": {"children": {"Family History": {
+                  "children": {}, "keep": ["..."], "style": {"top": 1}}}}},
+      "crc_score_leaves": ["Colorectal Cancer Score: 7"],
+      "crc_toggle": false,
+      "section_keep": {"PHYSICAL EXAMINATION": ["Abdominal"]}
+    }
+
+A node has "keep"/"style" only if some path ends directly below it, i.e. it
+was the parent of at least one configured leaf.  "section_keep" lists, per
+top-level section, every leaf configured two or more levels below it.
+"""
+
+PATH_TRIE_VERSION = 2
+
+CRC_SCORE_PREFIX = "RISK ASSESSMENT.Colorectal Cancer Score"
+CRC_TOGGLE_PATH = "RISK ASSESSMENT.CRC risk assessments"
+
+
+def merge_style(merged: dict, style: dict) -> dict:
+    # "collapse" is stored inverted: the CSV marks what starts expanded.
+    if "collapse" in style:
+        merged["collapse"] = not style["collapse"]
+    if "highlight" in style:
+        merged["highlight"] = style["highlight"]
+    if "top" in style:
+        merged["top"] = max(merged.get("top", -1), style["top"])
+    return merged
+
+
+def compile_path_config(path_config: list[dict] | None) -> dict:
+    root: dict = {}
+    crc_score_leaves: list[str] = []
+    crc_toggle = False
+    section_keep: dict[str, list[str]] = {}
+
+    for entry in path_config or []:
+        path_str = (entry.get("path") or "").strip()
+        style = entry.get("style") or {}
+        if not path_str:
+            continue
+
+        segments = path_str.split(".")
+        if len(segments) < 2:
+            continue
+        *parent_segments, leaf_text = segments
+
+        if path_str.startswith(CRC_SCORE_PREFIX):
+            crc_score_leaves.append(leaf_text)
+        if path_str == CRC_TOGGLE_PATH:
+            crc_toggle = True
+        if len(parent_segments) > 1:
+            section = section_keep.setdefault(parent_segments[0], [])
+            if leaf_text not in section:
+                section.append(leaf_text)
+
+        children = root
+        for segment in parent_segments:
+            node = children.setdefault(segment, {"children": {}})
+            children = node["children"]
+        keep = node.setdefault("keep", [])
+        if leaf_text not in keep:
+            keep.append(leaf_text)
+        merge_style(node.setdefault("style", {}), style)
+
+    return {
+        "version": PATH_TRIE_VERSION,
+        "root": root,
+        "crc_score_leaves": crc_score_leaves,
+        "crc_toggle": crc_toggle,
+        "section_keep": section_keep,
+    }
+
+
+def get_path_trie(configuration) -> dict:
+    """
+    The stored trie of a DisplayConfig, compiled on the fly for rows saved
+    before tries existed or by an older PATH_TRIE_VERSION.
+    """
+    path_trie = configuration.path_trie
+    if not path_trie or path_trie.get("version") != PATH_TRIE_VERSION:
+        path_trie = compile_path_config(configuration.path_config)
+    return path_trie
+
+
+def find_parent(path_trie: dict, segments: list[str]) -> dict | None:
+    """The node at segments, or None when no configured leaf sits below it."""
+    children = path_trie["root"]
+    node = None
+    for segment in segments:
+        node = children.get(segment)
+        if node is None:
+            return None
+        children = node["children"]
+    return node if node is not None and "keep" in node else None
@@ -7,6 +7,7 @@ from src.common.exception.BusinessException import (
     BusinessExceptionEnum,
 )
 from src.answer.model.answer import Answer
+from src.cases.service.case_prefetcher import CasePrefetcher
 
 
 @pytest.fixture(autouse=True)
@@ -82,3 +83,27 @@ def test_save_answer_fail_with_no_answer_config(client, mocker, fake_request_bod
             "message": "No answer config available. Please configure it first.",
         },
     } == response.json
+
+
+def test_drop_prefetched_review_on_answer(client, mocker, fake_request_body_data):
+    mocker.patch(
+        "src.answer.service.answer_service.AnswerService.add_answer_response",
+        return_value=Answer(id=1),
+    )
+    mocker.patch(
+        "src.user.utils.auth_utils.get_user_email_from_jwt",
+        return_value="user@example.com",
+    )
+    prefetcher = mocker.Mock(CasePrefetcher)
+    mocker.patch(
+        "src.answer.controller.answer_controller.case_prefetcher", prefetcher
+    )
+
+    response = client.post(
+        "/api/answer/d523b88ae897538795ccfdb7c978b38f",
+        data=json.dumps(fake_request_body_data),
+        content_type="application/json",
+    )
+
+    assert response.status_code == 200
+    prefetcher.drop.assert_called_once_with("user@example.com")
@@ -1,6 +1,10 @@
+import uuid
+
 import pytest
+from sqlalchemy import select
 
 from src.answer.model.answer import Answer
+from src.answer.model.user_answer_count import UserAnswerCount
 from src.answer.repository.answer_repository import AnswerRepository
 from src.user.model.display_config import DisplayConfig
 from src.user.repository.display_config_repository import DisplayConfigRepository
@@ -16,6 +20,11 @@ def configuration_repository(session):
     return DisplayConfigRepository(session)
 
 
+def answered_task_ids(session, user_email):
+    statement = select(Answer.task_id).where(Answer.user_email == user_email)
+    return session.execute(statement.order_by(Answer.id)).scalars().all()
+
+
 def test_add_diagnose(diagnose_repository, configuration_repository):
     config = DisplayConfig(
         user_email="user@test.com", case_id=1, path_config={"key": "value"}
@@ -36,7 +45,9 @@ def test_add_diagnose(diagnose_repository, configuration_repository):
     assert diagnose.id is not None
 
 
-def test_get_diagnosed_case_list_by_user(diagnose_repository, configuration_repository):
+def test_add_diagnose_keeps_answers_per_user(
+    diagnose_repository, configuration_repository, session
+):
     config1 = DisplayConfig(
         user_email="user1@test.com", case_id=1, path_config={"key": "value"}
     )
@@ -63,12 +74,8 @@ def test_get_diagnosed_case_list_by_user(diagnose_repository, configuration_repo
     )
     diagnose_repository.add_answer(diagnose2)
 
-    user1_task_ids = diagnose_repository.get_answered_case_list_by_user(
-        "user1@test.com"
-    )
-    user2_task_ids = diagnose_repository.get_answered_case_list_by_user(
-        "user2@test.com"
-    )
+    user1_task_ids = answered_task_ids(session, "user1@test.com")
+    user2_task_ids = answered_task_ids(session, "user2@test.com")
 
     assert user1_task_ids == [config1.id]
     assert user2_task_ids == [config2.id]
@@ -81,7 +88,54 @@ def test_get_diagnosed_case_list_by_user(diagnose_repository, configuration_repo
     )
     diagnose_repository.add_answer(diagnose3)
 
-    user1_task_ids = diagnose_repository.get_answered_case_list_by_user(
-        "user1@test.com"
-    )
+    user1_task_ids = answered_task_ids(session, "user1@test.com")
     assert user1_task_ids == [config1.id, config1.id]
+
+
+def test_add_diagnose_counts_answers_of_user(
+    diagnose_repository, configuration_repository
+):
+    user_email = f"{uuid.uuid4()}@test.com"
+    assert diagnose_repository.get_answer_count(user_email) == 0
+
+    for case_id in (1, 2, 3):
+        config = DisplayConfig(
+            user_email=user_email, case_id=case_id, path_config={"key": "value"}
+        )
+        configuration_repository.save_configuration(config)
+        diagnose_repository.add_answer(
+            Answer(
+                task_id=config.id,
+                case_id=case_id,
+                user_email=user_email,
+                display_configuration=[],
+            )
+        )
+
+    assert diagnose_repository.get_answer_count(user_email) == 3
+    assert (
+        diagnose_repository.session.get(UserAnswerCount, user_email).answer_count == 3
+    )
+
+
+def test_first_counted_answer_seeds_from_answer_table(
+    diagnose_repository, configuration_repository, session
+):
+    # Given answers inserted around the repository
+    user_email = f"{uuid.uuid4()}@test.com"
+    for case_id in (1, 2):
+        session.add(
+            Answer(task_id=str(case_id), case_id=case_id, user_email=user_email)
+        )
+    session.flush()
+    assert diagnose_repository.get_answer_count(user_email) == 2
+
+    # When
+    config = DisplayConfig(user_email=user_email, case_id=3, path_config=[])
+    configuration_repository.save_configuration(config)
+    diagnose_repository.add_answer(
+        Answer(task_id=config.id, case_id=3, user_email=user_email)
+    )
+
+    # Then
+    assert diagnose_repository.get_answer_count(user_email) == 3
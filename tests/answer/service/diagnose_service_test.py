@@ -10,8 +10,10 @@ from src.configration.model.answer_config import AnswerConfig
 from src.configration.repository.answer_config_repository import (
     AnswerConfigurationRepository,
 )
+from src.configration.service.answer_config_cache import AnswerConfigCache
 from src.answer.repository.answer_repository import AnswerRepository
 from src.answer.service.answer_service import AnswerService
+from src.cases.repository.case_progress_repository import CaseProgressRepository
 from src.user.model.display_config import DisplayConfig
 from src.user.repository.display_config_repository import DisplayConfigRepository
 
@@ -81,6 +83,36 @@ def test_add_diagnose_response(
     assert mock_diagnose_repo.add_answer.called
 
 
+def test_add_diagnose_response_reads_answer_config_once_with_cache(
+    task_id,
+    user_email,
+    dict_data,
+    mock_diagnose_repo,
+    mock_configuration_repo,
+    mock_answer_config_repo,
+):
+    mock_configuration_repo.get_configuration_by_id.return_value = DisplayConfig(
+        path_config=[], user_email=user_email, case_id=1
+    )
+    mock_answer_config_repo.get_answer_config.return_value = AnswerConfig(
+        id=dict_data["answerConfigId"],
+        config=[{"type": "Text", "title": "title"}],
+        created_timestamp=datetime.now(),
+    )
+    diagnose_service = AnswerService(
+        mock_diagnose_repo,
+        mock_configuration_repo,
+        mock_answer_config_repo,
+        answer_config_cache=AnswerConfigCache(),
+    )
+
+    diagnose_service.add_answer_response(task_id, dict_data)
+    diagnose_service.add_answer_response(task_id, dict_data)
+
+    assert mock_diagnose_repo.add_answer.call_count == 2
+    assert mock_answer_config_repo.get_answer_config.call_count == 1
+
+
 def test_add_diagnose_response_user_and_case_not_match(
     task_id,
     dict_data,
@@ -125,3 +157,54 @@ def test_add_diagnose_response_failed_with_no_answer_config(
         match=re.compile(BusinessExceptionEnum.NoAnswerConfigAvailable.name),
     ):
         diagnose_service.add_answer_response(task_id, dict_data)
+
+
+def test_add_diagnose_response_advances_case_progress(
+    mocker,
+    task_id,
+    user_email,
+    dict_data,
+    mock_diagnose_repo,
+    mock_configuration_repo,
+    mock_answer_config_repo,
+):
+    mock_configuration_repo.get_configuration_by_id.return_value = DisplayConfig(
+        path_config=[], user_email=user_email, case_id=1
+    )
+    mock_configuration_repo.get_next_unanswered_configuration.return_value = (2, "102")
+    mock_answer_config_repo.get_answer_config.return_value = AnswerConfig(
+        id=dict_data["answerConfigId"],
+        config=[{"type": "Text", "title": "title"}],
+        created_timestamp=datetime.now(),
+    )
+    case_progress_repo = mocker.Mock(CaseProgressRepository)
+    diagnose_service = AnswerService(
+        mock_diagnose_repo,
+        mock_configuration_repo,
+        mock_answer_config_repo,
+        case_progress_repository=case_progress_repo,
+    )
+
+    diagnose_service.add_answer_response(task_id, dict_data)
+
+    mock_configuration_repo.get_next_unanswered_configuration.assert_called_once_with(
+        user_email
+    )
+    case_progress_repo.save_progress.assert_called_once_with(user_email, "102")
+
+
+def test_advance_case_progress_when_all_answered(
+    mocker, user_email, mock_diagnose_repo, mock_configuration_repo, mock_answer_config_repo
+):
+    mock_configuration_repo.get_next_unanswered_configuration.return_value = None
+    case_progress_repo = mocker.Mock(CaseProgressRepository)
+    diagnose_service = AnswerService(
+        mock_diagnose_repo,
+        mock_configuration_repo,
+        mock_answer_config_repo,
+        case_progress_repository=case_progress_repo,
+    )
+
+    diagnose_service.advance_case_progress(user_email)
+
+    case_progress_repo.save_progress.assert_called_once_with(user_email, None)
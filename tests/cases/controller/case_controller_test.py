@@ -1,9 +1,26 @@
 import json
+import logging
 
+from sqlalchemy import event
+
+from src import db
 from src.cases.controller.response.case_summary import CaseSummary
+from src.cases.model.case import Case
+from src.cases.model.case_tree_cache import CaseTreeCache
+from src.cases.repository.measurement_repository import MeasurementRepository
+from src.cases.repository.observation_repository import ObservationRepository
+from src.cases.service.case_prefetcher import CasePrefetcher
+from src.cases.service.case_service import CaseService
+from src.common.cache.lru_cache import LruCache
 from src.common.model.system_config import SystemConfig
 from src.user.model.display_config import DisplayConfig
-from tests.cases.case_fixture import input_case
+from tests.cases.case_fixture import (
+    input_case,
+    measurement_fixture,
+    observation_fixture,
+    person_fixture,
+    visit_occurrence_fixture,
+)
 
 
 def test_get_case_review(client, session, mocker):
@@ -127,6 +144,67 @@ def test_get_case_review_with_physical_exam_filtering(client, session, mocker):
     assert "importantInfos" in data
 
 
+def test_get_case_review_runs_constant_number_of_statements(client, session, mocker):
+    input_case(session)
+
+    config = DisplayConfig(user_email="goodbye@sunwukong.com", case_id=1, id="3")
+    session.add(config)
+    session.add(
+        SystemConfig(
+            id="page_config",
+            json_config={
+                "BACKGROUND": {
+                    "Family History": [4167217],
+                    "Social History": {
+                        "Smoke": [4041306],
+                        "Alcohol": [4238768],
+                        "Drug use": [4038710],
+                        "Sexual behavior": [4283657, 4314454],
+                    },
+                },
+                "PATIENT COMPLAINT": {
+                    "Chief Complaint": [38000282],
+                    "Current Symptoms": [4034855],
+                },
+                "PHYSICAL EXAMINATION": {
+                    "Vital Signs": [4263222],
+                    "Abdominal": [4152368],
+                },
+            },
+        )
+    )
+    session.flush()
+
+    mocker.patch(
+        "src.user.utils.auth_utils.validate_jwt_and_refresh", return_value=None
+    )
+    mocker.patch(
+        "src.cases.service.case_service.get_user_email_from_jwt",
+        return_value="goodbye@sunwukong.com",
+    )
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", count_statement)
+    try:
+        response = client.get(f"/api/case-reviews/{config.id}")
+        built_statements = len(statements)
+        cached_response = client.get(f"/api/case-reviews/{config.id}")
+    finally:
+        event.remove(db.engine, "before_cursor_execute", count_statement)
+
+    assert response.status_code == 200
+    # display config, page config, tree cache lookup, visit, person,
+    # observations, measurements, concept names, the parent relationships of
+    # unmatched sections, then the tree cache delete and upsert
+    assert built_statements <= 11
+    # display config, page config and the tree cache lookup
+    assert len(statements) - built_statements <= 3
+    assert cached_response.get_json() == response.get_json()
+
+
 def expected_json():
     with open("tests/cases/controller/expected_response.json") as f:
         return json.load(f)
@@ -189,3 +267,441 @@ def test_get_case_summary(client, mocker, session):
     }
 
     assert data == expected_data
+
+
+def test_prefetch_case_handed_out_by_summary(client, mocker):
+    mocker.patch(
+        "src.user.utils.auth_utils.validate_jwt_and_refresh", return_value=None
+    )
+    mocker.patch(
+        "src.user.utils.auth_utils.get_user_email_from_jwt",
+        return_value="user@example.com",
+    )
+    mocker.patch(
+        "src.cases.service.case_service.CaseService.get_cases_by_user",
+        return_value=[
+            CaseSummary(
+                config_id="1",
+                case_id=1,
+                patient_chief_complaint="Headache",
+                age="36",
+                gender="Male",
+            )
+        ],
+    )
+    prefetcher = mocker.Mock(CasePrefetcher)
+    mocker.patch("src.cases.controller.case_controller.case_prefetcher", prefetcher)
+
+    response = client.get("/api/cases")
+
+    assert response.status_code == 200
+    prefetcher.submit.assert_called_once_with("user@example.com", "1")
+
+
+def test_log_concept_name_cache_stats_at_debug_level(app, client, mocker, caplog):
+    mocker.patch(
+        "src.user.utils.auth_utils.validate_jwt_and_refresh", return_value=None
+    )
+    mocker.patch(
+        "src.user.utils.auth_utils.get_user_email_from_jwt",
+        return_value="user@example.com",
+    )
+    mocker.patch(
+        "src.cases.service.case_service.CaseService.get_cases_by_user",
+        return_value=[],
+    )
+    caplog.set_level(logging.DEBUG, logger=app.logger.name)
+
+    response = client.get("/api/cases")
+
+    assert response.status_code == 200
+    assert any(
+        record.getMessage().startswith("concept name cache: {'size': ")
+        for record in caplog.records
+    )
+
+
+def test_serve_prefetched_case_review(client, mocker):
+    mocker.patch(
+        "src.user.utils.auth_utils.validate_jwt_and_refresh", return_value=None
+    )
+    mocker.patch(
+        "src.user.utils.auth_utils.get_user_email_from_jwt",
+        return_value="user@example.com",
+    )
+    get_case_review = mocker.patch(
+        "src.cases.service.case_service.CaseService.get_case_review"
+    )
+    mocker.patch(
+        "src.cases.service.case_service.CaseService.get_case_review_etag",
+        return_value="etag",
+    )
+    prefetcher = mocker.Mock(CasePrefetcher)
+    prefetcher.take.return_value = Case("sunwukong", "1", [], [])
+    mocker.patch("src.cases.controller.case_controller.case_prefetcher", prefetcher)
+
+    response = client.get("/api/case-reviews/1")
+
+    assert response.status_code == 200
+    assert response.get_json()["data"]["personName"] == "sunwukong"
+    prefetcher.take.assert_called_once_with("user@example.com", "1")
+    get_case_review.assert_not_called()
+
+
+def test_build_case_review_when_nothing_prefetched(client, mocker):
+    mocker.patch(
+        "src.user.utils.auth_utils.validate_jwt_and_refresh", return_value=None
+    )
+    mocker.patch(
+        "src.user.utils.auth_utils.get_user_email_from_jwt",
+        return_value="user@example.com",
+    )
+    get_case_review = mocker.patch(
+        "src.cases.service.case_service.CaseService.get_case_review",
+        return_value=Case("sunwukong", "1", [], []),
+    )
+    mocker.patch(
+        "src.cases.service.case_service.CaseService.get_case_review_etag",
+        return_value="etag",
+    )
+    prefetcher = mocker.Mock(CasePrefetcher)
+    prefetcher.take.return_value = None
+    mocker.patch("src.cases.controller.case_controller.case_prefetcher", prefetcher)
+
+    response = client.get("/api/case-reviews/1")
+
+    assert response.status_code == 200
+    get_case_review.assert_called_once_with("1")
+
+
+def input_batch_cases(session):
+    """Case 1 of input_case plus cases 2 and 3, one config each."""
+    input_case(session)
+    for case_id in (2, 3):
+        session.add(person_fixture(person_id=case_id))
+        session.add(visit_occurrence_fixture(case_id, case_id))
+        session.flush()
+        session.add(
+            observation_fixture(
+                concept_id=36,
+                value_as_string=f"complaint of case {case_id}",
+                observation_type_concept_id=38000282,
+                observation_id=100 + case_id,
+                person_id=case_id,
+                visit_id=case_id,
+            )
+        )
+        session.add(
+            measurement_fixture(
+                concept_id=4263222,
+                value_as_number=60 + case_id,
+                measurement_id=100 + case_id,
+                person_id=case_id,
+                visit_id=case_id,
+            )
+        )
+    for case_id in (1, 2, 3):
+        session.add(
+            DisplayConfig(
+                user_email="goodbye@sunwukong.com",
+                case_id=case_id,
+                id=f"batch-{case_id}",
+                path_config=[{"path": "BACKGROUND.Family History.family history"}],
+            )
+        )
+    session.add(
+        SystemConfig(
+            id="page_config",
+            json_config={
+                "BACKGROUND": {"Family History": [4167217]},
+                "PATIENT COMPLAINT": {"Chief Complaint": [38000282]},
+                "PHYSICAL EXAMINATION": {
+                    "Vital Signs": [4263222],
+                    "Abdominal": [4152368],
+                },
+            },
+        )
+    )
+    session.flush()
+
+
+def test_get_case_reviews_in_batch(client, session, mocker):
+    input_batch_cases(session)
+    mocker.patch(
+        "src.user.utils.auth_utils.validate_jwt_and_refresh", return_value=None
+    )
+    for module in ("src.user.utils.auth_utils", "src.cases.service.case_service"):
+        mocker.patch(
+            f"{module}.get_user_email_from_jwt",
+            return_value="goodbye@sunwukong.com",
+        )
+    mocker.patch(
+        "src.cases.controller.case_controller.case_tree_cache", LruCache(10)
+    )
+    config_ids = ["batch-3", "batch-1", "batch-2"]
+    expected = [
+        client.get(f"/api/case-reviews/{config_id}").get_json()["data"]
+        for config_id in config_ids
+    ]
+    # build every tree again, this time set-based
+    session.query(CaseTreeCache).delete()
+    mocker.patch(
+        "src.cases.controller.case_controller.case_tree_cache", LruCache(10)
+    )
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", count_statement)
+    try:
+        response = client.post(
+            "/api/case-reviews/batch", json={"configIds": config_ids}
+        )
+    finally:
+        event.remove(db.engine, "before_cursor_execute", count_statement)
+
+    assert response.status_code == 200
+    assert response.get_json()["data"] == [
+        {"configId": config_id, "review": review}
+        for config_id, review in zip(config_ids, expected)
+    ]
+    assert {review["personName"] for review in expected} == {"sunwukong"}
+    assert expected[0] != expected[1]
+    # configs, page config, tree lookup, visits, persons, observations,
+    # measurements, concept names, relationships, tree delete and upsert
+    assert len(statements) <= 11
+
+
+def test_get_next_case_reviews_in_batch(client, session, mocker):
+    input_batch_cases(session)
+    mocker.patch(
+        "src.user.utils.auth_utils.validate_jwt_and_refresh", return_value=None
+    )
+    mocker.patch(
+        "src.user.utils.auth_utils.get_user_email_from_jwt",
+        return_value="goodbye@sunwukong.com",
+    )
+
+    response = client.post("/api/case-reviews/batch", json={"next": 2})
+
+    assert response.status_code == 200
+    data = response.get_json()["data"]
+    assert len(data) == 2
+    assert {review["configId"] for review in data} < {
+        "batch-1",
+        "batch-2",
+        "batch-3",
+    }
+
+
+def test_get_case_reviews_in_batch_of_other_user(client, session, mocker):
+    input_batch_cases(session)
+    mocker.patch(
+        "src.user.utils.auth_utils.validate_jwt_and_refresh", return_value=None
+    )
+    mocker.patch(
+        "src.user.utils.auth_utils.get_user_email_from_jwt",
+        return_value="someone@else.com",
+    )
+
+    response = client.post(
+        "/api/case-reviews/batch", json={"configIds": ["batch-1", "batch-2"]}
+    )
+
+    assert response.status_code == 500
+    assert response.get_json()["error"]["code"] == "1010"
+
+
+def test_reject_invalid_case_review_batch(app, client, mocker):
+    mocker.patch(
+        "src.user.utils.auth_utils.validate_jwt_and_refresh", return_value=None
+    )
+    mocker.patch.dict(app.config, {"CASE_REVIEW_BATCH_LIMIT": 2})
+
+    for body in (
+        {},
+        {"configIds": []},
+        {"configIds": [1]},
+        {"configIds": ["a", "b", "c"]},
+        {"next": 0},
+        {"next": True},
+    ):
+        response = client.post("/api/case-reviews/batch", json=body)
+
+        assert response.status_code == 400, body
+
+
+def test_answer_unchanged_case_review_without_building(client, session, mocker):
+    input_batch_cases(session)
+    mocker.patch(
+        "src.user.utils.auth_utils.validate_jwt_and_refresh", return_value=None
+    )
+    mocker.patch(
+        "src.cases.service.case_service.get_user_email_from_jwt",
+        return_value="goodbye@sunwukong.com",
+    )
+    build_case_review = mocker.spy(CaseService, "build_case_review")
+    first = client.get("/api/case-reviews/batch-2")
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", count_statement)
+    try:
+        unchanged = client.get(
+            "/api/case-reviews/batch-2",
+            headers={"If-None-Match": first.headers["ETag"]},
+        )
+    finally:
+        event.remove(db.engine, "before_cursor_execute", count_statement)
+
+    assert first.status_code == 200
+    assert unchanged.status_code == 304
+    assert unchanged.data == b""
+    assert build_case_review.call_count == 1
+    # display config and page config are already in the session
+    assert len(statements) <= 2
+
+    # a new path_config is a new review
+    config = session.get(DisplayConfig, "batch-2")
+    config.path_config = [{"path": "BACKGROUND.Medical History.Asthma"}]
+    session.flush()
+    changed = client.get(
+        "/api/case-reviews/batch-2",
+        headers={"If-None-Match": first.headers["ETag"]},
+    )
+
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != first.headers["ETag"]
+
+
+def test_fetch_collapsed_sections_of_lazy_case_review(client, session, mocker):
+    input_batch_cases(session)
+    session.get(DisplayConfig, "batch-1").path_config = [
+        # the CSV marks what starts expanded: this child starts collapsed
+        {
+            "path": "BACKGROUND.Family History.family history",
+            "style": {"collapse": False},
+        }
+    ]
+    session.flush()
+    mocker.patch(
+        "src.user.utils.auth_utils.validate_jwt_and_refresh", return_value=None
+    )
+    mocker.patch(
+        "src.cases.service.case_service.get_user_email_from_jwt",
+        return_value="goodbye@sunwukong.com",
+    )
+
+    full = client.get("/api/case-reviews/batch-1")
+    lazy = client.get("/api/case-reviews/batch-1?lazy=true")
+    section = client.get(
+        "/api/case-reviews/batch-1/section?section=BACKGROUND&child=Family History"
+    )
+
+    assert lazy.status_code == 200
+    assert lazy.headers["ETag"] != full.headers["ETag"]
+    full_background = full.get_json()["data"]["details"][0]
+    lazy_background = lazy.get_json()["data"]["details"][0]
+    assert lazy_background["values"][0] == full_background["values"][0]
+    family_history = full_background["values"][1]
+    assert family_history["style"] == {"collapse": True}
+    assert family_history["values"]
+    assert lazy_background["values"][1] == {**family_history, "values": None}
+    assert lazy.get_json()["data"]["details"][1:] == full.get_json()["data"]["details"][1:]
+    assert section.status_code == 200
+    assert section.get_json()["data"] == family_history
+
+
+def test_build_lazy_case_review_without_rows_of_folded_children(
+    client, session, mocker
+):
+    input_batch_cases(session)
+    session.get(DisplayConfig, "batch-1").path_config = [
+        {
+            "path": "BACKGROUND.Family History.family history",
+            "style": {"collapse": False},
+        }
+    ]
+    session.flush()
+    mocker.patch(
+        "src.user.utils.auth_utils.validate_jwt_and_refresh", return_value=None
+    )
+    mocker.patch(
+        "src.cases.service.case_service.get_user_email_from_jwt",
+        return_value="goodbye@sunwukong.com",
+    )
+    mocker.patch(
+        "src.cases.controller.case_controller.case_tree_cache", LruCache(10)
+    )
+    load_rows = mocker.spy(ObservationRepository, "get_observations_of_concepts")
+    load_visit = mocker.spy(ObservationRepository, "get_observations_by_visit")
+
+    lazy = client.get("/api/case-reviews/batch-1?lazy=true")
+
+    assert lazy.status_code == 200
+    load_visit.assert_not_called()
+    _, case_id, concept_ids, type_ids = load_rows.call_args.args
+    assert (case_id, set(concept_ids), set(type_ids)) == (1, set(), {38000282})
+    full = client.get("/api/case-reviews/batch-1").get_json()["data"]
+    background = full["details"][0]
+    background["values"][1]["values"] = None
+    assert lazy.get_json()["data"] == full
+
+
+def test_build_case_review_section_from_its_rows_only(client, session, mocker):
+    input_batch_cases(session)
+    mocker.patch(
+        "src.user.utils.auth_utils.validate_jwt_and_refresh", return_value=None
+    )
+    mocker.patch(
+        "src.cases.service.case_service.get_user_email_from_jwt",
+        return_value="goodbye@sunwukong.com",
+    )
+    mocker.patch(
+        "src.cases.controller.case_controller.case_tree_cache", LruCache(10)
+    )
+    load_observations = mocker.spy(
+        ObservationRepository, "get_observations_of_concepts"
+    )
+    load_measurements = mocker.spy(
+        MeasurementRepository, "get_measurements_of_concepts"
+    )
+
+    family_history = client.get(
+        "/api/case-reviews/batch-1/section?section=BACKGROUND&child=Family History"
+    )
+    demographics = client.get(
+        "/api/case-reviews/batch-1/section"
+        "?section=BACKGROUND&child=Patient Demographics"
+    )
+
+    assert load_observations.call_count == 1
+    _, case_id, concept_ids, type_ids = load_observations.call_args.args
+    assert (case_id, set(concept_ids), set(type_ids)) == (1, {4167217}, set())
+    load_measurements.assert_not_called()
+    full = client.get("/api/case-reviews/batch-1").get_json()["data"]
+    background = full["details"][0]
+    assert family_history.get_json()["data"] == background["values"][1]
+    assert demographics.get_json()["data"] == background["values"][0]
+
+
+def test_reject_unknown_case_review_section(client, session, mocker):
+    input_batch_cases(session)
+    mocker.patch(
+        "src.user.utils.auth_utils.validate_jwt_and_refresh", return_value=None
+    )
+    mocker.patch(
+        "src.cases.service.case_service.get_user_email_from_jwt",
+        return_value="goodbye@sunwukong.com",
+    )
+
+    missing = client.get(
+        "/api/case-reviews/batch-1/section?section=BACKGROUND&child=Nothing"
+    )
+    incomplete = client.get("/api/case-reviews/batch-1/section?section=BACKGROUND")
+
+    assert missing.status_code == 404
+    assert incomplete.status_code == 400
@@ -0,0 +1,77 @@
+import pytest
+from flask import jsonify
+
+from src.cases.controller.response.case_json import (
+    case_json_response,
+    dumps_case_json,
+)
+from src.cases.controller.response.case_summary import CaseSummary
+from src.cases.model.case import Case, TreeNode, TreeNodeView
+from src.common.model.ApiResponse import ApiResponse
+from src.common.model.ErrorCode import ErrorCode
+
+
+def case_review():
+    frozen = TreeNode(
+        "Vital Signs",
+        [TreeNode("Pulse", "80 /min", {"collapse": True}), TreeNode("BP", None)],
+    ).freeze()
+    return Case(
+        "Sun Wukong",
+        "17",
+        [
+            TreeNode(
+                "BACKGROUND",
+                [
+                    TreeNode("Age", "58"),
+                    TreeNode("Medical History", ["Asthma", 'Says "ouch" \\ ü\n']),
+                ],
+                {"highlight": True, "top": 2},
+            ),
+            TreeNode("PHYSICAL EXAMINATION", [frozen, TreeNodeView(frozen, key="Vitals")]),
+        ],
+        [TreeNode("AI CRC Risk Score", ["Predicted: 12"]), TreeNode("Empty", [])],
+    )
+
+
+@pytest.mark.parametrize(
+    "data, as_before",
+    [
+        # the controllers used to jsonify the to_dict() of a review
+        (case_review(), case_review().to_dict()),
+        (
+            [{"configId": "c-1", "review": case_review()}],
+            [{"configId": "c-1", "review": case_review().to_dict()}],
+        ),
+        (
+            [CaseSummary("c-1", 17, "Cough, Fever", "58", "FEMALE")],
+            [CaseSummary("c-1", 17, "Cough, Fever", "58", "FEMALE")],
+        ),
+        ([], []),
+    ],
+)
+def test_write_same_bytes_as_jsonify(app, data, as_before):
+    with app.app_context():
+        expected = jsonify(ApiResponse.success(as_before)).get_data()
+
+    assert dumps_case_json(ApiResponse.success(data)) == expected
+
+
+def test_write_error_like_jsonify(app):
+    api_response = ApiResponse.fail(ErrorCode.BAD_REQUEST, "bad 'configIds'")
+    with app.app_context():
+        expected = jsonify(api_response).get_data()
+
+    assert dumps_case_json(api_response) == expected
+
+
+def test_serve_json_response():
+    response = case_json_response(ApiResponse.success(case_review()))
+
+    assert response.mimetype == "application/json"
+    assert response.get_json()["data"]["personName"] == "Sun Wukong"
+
+
+def test_reject_unknown_shapes():
+    with pytest.raises(TypeError):
+        dumps_case_json(ApiResponse.success(object()))
@@ -0,0 +1,123 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+from flask_jwt_extended import create_access_token
+from sqlalchemy import text
+
+from src.cases.model.clinical_data.person.observation import Observation
+from src.cases.model.clinical_data.person.person import Person
+from src.common.cache.lru_cache import LruCache
+from src.common.model.system_config import SystemConfig
+from src.user.model.display_config import DisplayConfig
+from tests.cases.case_fixture import concept_fixture, visit_occurrence_fixture
+
+CASES = 12
+THREADS = 16
+REQUESTS = 240
+# keeps committed ids clear of rows other tests use
+BASE = 2_000_000
+CHIEF_COMPLAINT = 38000282
+
+
+@pytest.fixture
+def committed_cases(app, session):
+    """
+    One case, config and reviewer per index.  The rows are committed because
+    every request thread gets its own app context and so its own connection.
+    """
+    session.execute(text("SET LOCAL session_replication_role = replica"))
+    session.add(concept_fixture(BASE, "gender"))
+    session.add(
+        SystemConfig(
+            id="page_config",
+            json_config={"PATIENT COMPLAINT": {"Chief Complaint": [CHIEF_COMPLAINT]}},
+        )
+    )
+    tokens = {}
+    for i in range(CASES):
+        case_id = BASE + i
+        session.add(
+            Person(
+                person_id=case_id,
+                gender_concept_id=BASE,
+                year_of_birth=1950 + i,
+                race_concept_id=BASE,
+                ethnicity_concept_id=BASE,
+                person_source_value=f"patient-{i}",
+            )
+        )
+        session.add(visit_occurrence_fixture(case_id, case_id))
+        session.add(
+            Observation(
+                observation_id=case_id,
+                person_id=case_id,
+                observation_concept_id=CHIEF_COMPLAINT,
+                observation_date=date(2024, 1, 1),
+                observation_type_concept_id=0,
+                value_as_string=f"complaint of patient-{i}",
+                visit_occurrence_id=case_id,
+            )
+        )
+        user_email = f"reviewer-{i}@concurrency.test"
+        session.add(
+            DisplayConfig(user_email=user_email, case_id=case_id, id=f"conc-{i}")
+        )
+        tokens[f"conc-{i}"] = create_access_token(identity=user_email)
+    session.commit()
+
+    yield tokens
+
+    session.rollback()
+    for table, column in (
+        ("display_config", "id LIKE 'conc-%'"),
+        ("observation", f"observation_id >= {BASE}"),
+        ("visit_occurrence", f"visit_occurrence_id >= {BASE}"),
+        ("person", f"person_id >= {BASE}"),
+        ("concept", f"concept_id = {BASE}"),
+        ("system_config", "id = 'page_config'"),
+        ("case_tree_cache", f"case_id >= {BASE}"),
+    ):
+        session.execute(text(f"DELETE FROM {table} WHERE {column}"))
+    session.commit()
+
+
+def test_parallel_case_reviews_do_not_mix_up_patients(
+    client, committed_cases, mocker
+):
+    mocker.patch(
+        "src.user.utils.auth_utils.validate_jwt_and_refresh", return_value=None
+    )
+    # every request builds its own tree instead of sharing a cached one
+    case_tree_cache = mocker.Mock(LruCache)
+    case_tree_cache.get.return_value = None
+    mocker.patch(
+        "src.cases.controller.case_controller.case_tree_cache", case_tree_cache
+    )
+
+    def review(config_id):
+        response = client.get(
+            f"/api/case-reviews/{config_id}",
+            headers={"Authorization": f"Bearer {committed_cases[config_id]}"},
+        )
+        assert response.status_code == 200, response.get_data(as_text=True)
+        return config_id, response.get_json()["data"]
+
+    # Given one review per case, fetched one at a time (off the main thread,
+    # whose session would otherwise hold the tree-cache rows it wrote)
+    with ThreadPoolExecutor(1) as pool:
+        expected = dict(pool.map(review, committed_cases))
+    assert {data["personName"] for data in expected.values()} == {
+        f"patient-{i}" for i in range(CASES)
+    }
+
+    # When the same reviews are fired from many threads at once
+    config_ids = list(committed_cases) * (REQUESTS // CASES)
+    random.Random(9).shuffle(config_ids)
+    with ThreadPoolExecutor(THREADS) as pool:
+        responses = list(pool.map(review, config_ids))
+
+    # Then every response is the one its reviewer got alone
+    for config_id, data in responses:
+        assert data == expected[config_id], config_id
@@ -0,0 +1,104 @@
+import pytest
+
+from src.cases.model.case import Case, FrozenTreeNode, TreeNode, TreeNodeView
+
+
+def frozen_tree():
+    return TreeNode(
+        "BACKGROUND",
+        [
+            TreeNode("Family History", ["a", "b"]),
+            TreeNode("Social History", [TreeNode("Smoke", "no")], {"top": 1}),
+        ],
+    ).freeze()
+
+
+class TestFreeze:
+    def test_freeze_converts_nested_nodes(self):
+        tree = frozen_tree()
+
+        assert isinstance(tree, FrozenTreeNode)
+        assert isinstance(tree.values, tuple)
+        assert isinstance(tree.values[1].values[0], FrozenTreeNode)
+        assert tree == TreeNode(
+            "BACKGROUND",
+            [
+                TreeNode("Family History", ["a", "b"]),
+                TreeNode("Social History", [TreeNode("Smoke", "no")], {"top": 1}),
+            ],
+        )
+
+    def test_frozen_node_cannot_be_changed(self):
+        tree = frozen_tree()
+
+        with pytest.raises(AttributeError):
+            tree.key = "changed"
+        with pytest.raises(TypeError):
+            tree.values[1].style["top"] = 2
+
+    def test_round_trip_through_dict(self):
+        tree = frozen_tree()
+
+        assert TreeNode.from_dict(tree.to_dict()).freeze() == tree
+
+
+class TestTreeNodeView:
+    def test_view_reads_through_to_base(self):
+        base = frozen_tree().values[0]
+
+        view = TreeNodeView(base)
+
+        assert view.key == "Family History"
+        assert view.values == ("a", "b")
+        assert view.style is None
+
+    def test_view_overrides_without_touching_base(self):
+        tree = frozen_tree()
+        family_history = tree.values[0]
+
+        view = TreeNodeView(
+            tree,
+            values=[
+                TreeNodeView(family_history, values=["a"], style={"collapse": False}),
+                TreeNodeView(tree.values[1], key="Social"),
+            ],
+        )
+
+        assert view.to_dict() == {
+            "key": "BACKGROUND",
+            "values": [
+                {
+                    "key": "Family History",
+                    "values": ["a"],
+                    "style": {"collapse": False},
+                },
+                {
+                    "key": "Social",
+                    "values": [{"key": "Smoke", "values": "no", "style": None}],
+                    "style": {"top": 1},
+                },
+            ],
+            "style": None,
+        }
+        assert tree == frozen_tree()
+
+    def test_view_can_override_with_none(self):
+        view = TreeNodeView(frozen_tree().values[1], style=None)
+
+        assert view.style is None
+
+
+def test_case_to_dict():
+    case = Case(
+        "sunwukong",
+        "1",
+        [TreeNodeView(frozen_tree().values[0], values=[])],
+        [TreeNode("Family History", ["a"])],
+    )
+
+    assert case.to_dict() == {
+        "personName": "sunwukong",
+        "caseNumber": "1",
+        "details": [{"key": "Family History", "values": [], "style": None}],
+        "importantInfos": [{"key": "Family History", "values": ["a"], "style": None}],
+    }
@@ -0,0 +1,24 @@
+import pytest
+
+from src.cases.repository.case_progress_repository import CaseProgressRepository
+
+
+@pytest.fixture(scope="session")
+def case_progress_repository(session):
+    return CaseProgressRepository(session)
+
+
+def test_get_progress_when_missing(case_progress_repository: CaseProgressRepository):
+    assert case_progress_repository.get_progress("nobody@example.com") is None
+
+
+def test_save_progress_upserts(
+    case_progress_repository: CaseProgressRepository, session
+):
+    case_progress_repository.save_progress("usera@example.com", "101")
+    case_progress_repository.save_progress("usera@example.com", None)
+    session.expire_all()
+
+    progress = case_progress_repository.get_progress("usera@example.com")
+    assert progress.next_config_id is None
+    assert progress.modified_timestamp is not None
@@ -0,0 +1,104 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from src import db
+from src.cases.model.case_tree_cache import CaseTreeCache
+from src.cases.repository.case_tree_cache_repository import CaseTreeCacheRepository
+
+
+@pytest.fixture(scope="session")
+def case_tree_repository(session):
+    return CaseTreeCacheRepository(session)
+
+
+def test_get_case_tree_when_missing(case_tree_repository: CaseTreeCacheRepository):
+    assert case_tree_repository.get_case_tree(1, "missing") is None
+
+
+def test_save_case_tree(case_tree_repository: CaseTreeCacheRepository, session):
+    tree = [{"key": "BACKGROUND", "values": [], "style": None}]
+
+    case_tree_repository.save_case_tree(1, "hash", "sunwukong", tree)
+    session.expire_all()
+
+    found = case_tree_repository.get_case_tree(1, "hash")
+    assert found.person_name == "sunwukong"
+    assert found.tree == tree
+
+
+def test_save_case_tree_overwrites_same_hash(
+    case_tree_repository: CaseTreeCacheRepository, session
+):
+    case_tree_repository.save_case_tree(1, "hash", "old", [])
+    case_tree_repository.save_case_tree(1, "hash", "new", [])
+    session.expire_all()
+
+    assert case_tree_repository.get_case_tree(1, "hash").person_name == "new"
+
+
+def test_save_case_tree_drops_other_page_configs(
+    case_tree_repository: CaseTreeCacheRepository, session
+):
+    case_tree_repository.save_case_tree(1, "old", "sunwukong", [])
+    case_tree_repository.save_case_tree(2, "old", "zhubajie", [])
+    case_tree_repository.save_case_tree(1, "new", "sunwukong", [])
+    session.expire_all()
+
+    assert session.query(CaseTreeCache).filter_by(case_id=1).count() == 1
+    assert case_tree_repository.get_case_tree(1, "new") is not None
+    assert case_tree_repository.get_case_tree(2, "old") is not None
+
+
+def test_get_case_trees(case_tree_repository: CaseTreeCacheRepository, session):
+    case_tree_repository.save_case_tree(1, "hash", "sunwukong", [])
+    case_tree_repository.save_case_tree(2, "other", "zhubajie", [])
+    case_tree_repository.save_case_tree(3, "hash", "shaseng", [])
+    session.expire_all()
+
+    found = case_tree_repository.get_case_trees([1, 2, 3], "hash")
+
+    assert sorted(tree.person_name for tree in found) == ["shaseng", "sunwukong"]
+
+
+def test_save_case_trees(case_tree_repository: CaseTreeCacheRepository, session):
+    tree = [{"key": "BACKGROUND", "values": [], "style": None}]
+    case_tree_repository.save_case_tree(1, "old", "sunwukong", [])
+    case_tree_repository.save_case_tree(2, "hash", "old", [])
+
+    case_tree_repository.save_case_trees(
+        "hash", {1: ("sunwukong", tree), 2: ("zhubajie", tree)}
+    )
+    session.expire_all()
+
+    assert case_tree_repository.get_case_tree(1, "old") is None
+    assert case_tree_repository.get_case_tree(1, "hash").tree == tree
+    assert case_tree_repository.get_case_tree(2, "hash").person_name == "zhubajie"
+
+
+def test_save_no_case_trees(case_tree_repository: CaseTreeCacheRepository, session):
+    case_tree_repository.save_case_trees("hash", {})
+
+    assert session.query(CaseTreeCache).count() == 0
+
+
+def test_lock_case_tree_until_transaction_ends(
+    case_tree_repository: CaseTreeCacheRepository, session
+):
+    other_session = Session(db.engine)
+    other_repository = CaseTreeCacheRepository(other_session)
+    try:
+        case_tree_repository.lock_case_tree(1, "hash")
+
+        other_session.execute(text("SET LOCAL lock_timeout = '50ms'"))
+        with pytest.raises(OperationalError):
+            other_repository.lock_case_tree(1, "hash")
+        other_session.rollback()
+        other_repository.lock_case_tree(2, "hash")
+        other_session.rollback()
+
+        session.rollback()
+        other_repository.lock_case_tree(1, "hash")
+    finally:
+        other_session.close()
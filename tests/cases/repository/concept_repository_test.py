@@ -16,3 +16,21 @@ def test_get_concept(concept_repository: ConceptRepository, session):
 
     assert found is not None
     assert found.concept_name == "M"
+
+
+def test_get_concept_names(concept_repository: ConceptRepository, session):
+    input_case(session)
+
+    names = concept_repository.get_concept_names([2, 3, 999999])
+
+    assert names == {2: "M", 3: "race"}
+
+
+def test_get_concept_relationships(concept_repository: ConceptRepository, session):
+    input_case(session)
+
+    relationships = concept_repository.get_concept_relationships(
+        [4263222], ["Subsumes", "Is characterized by"]
+    )
+
+    assert sorted(relationships) == [(4263222, 40), (4263222, 43)]
@@ -1,6 +1,11 @@
 import pytest
+from sqlalchemy import select
 
-from src.cases.repository.measurement_repository import MeasurementRepository
+from src.cases.model.clinical_data.person.measurement import Measurement
+from src.cases.repository.measurement_repository import (
+    MeasurementRepository,
+    MeasurementRow,
+)
 from tests.cases.case_fixture import input_case
 
 
@@ -9,20 +14,51 @@ def measurement_repository(session):
     return MeasurementRepository(session)
 
 
-def test_get_measurements(measurement_repository: MeasurementRepository, session):
+def test_get_measurements_by_visit(
+    measurement_repository: MeasurementRepository, session
+):
     input_case(session)
 
-    measurements = measurement_repository.get_measurements(1, [4152368])
+    measurements = measurement_repository.get_measurements_by_visit(1)
 
-    assert len(measurements) == 1
-    assert measurements[0].value_as_number == 10
+    assert measurements == measurement_rows_of_visit_1(session)
 
 
-def test_get_measurements_of_parents(
+def test_get_measurements_by_visits(
     measurement_repository: MeasurementRepository, session
 ):
     input_case(session)
 
-    measurements = measurement_repository.get_measurements_of_parents(1, [4263222])
+    measurements = measurement_repository.get_measurements_by_visits([1, 404])
+
+    assert measurements == measurement_rows_of_visit_1(session)
+
+
+def test_get_measurements_of_concepts(
+    measurement_repository: MeasurementRepository, session
+):
+    input_case(session)
+
+    measurements = measurement_repository.get_measurements_of_concepts(
+        1, [43, 4152368, 404]
+    )
+
+    assert measurements == [
+        row
+        for row in measurement_rows_of_visit_1(session)
+        if row.measurement_concept_id in (43, 4152368)
+    ]
+
 
-    assert len(measurements) == 2
+def measurement_rows_of_visit_1(session):
+    entities = session.scalars(
+        select(Measurement)
+        .where(Measurement.visit_occurrence_id == 1)
+        .order_by(Measurement.measurement_id)
+    )
+    rows = [
+        MeasurementRow(*(getattr(entity, field) for field in MeasurementRow._fields))
+        for entity in entities
+    ]
+    assert len(rows) == 3
+    return rows
@@ -1,7 +1,12 @@
 import pytest
+from sqlalchemy import select
 
-from src.cases.repository.observation_repository import ObservationRepository
-from tests.cases.case_fixture import input_case
+from src.cases.model.clinical_data.person.observation import Observation
+from src.cases.repository.observation_repository import (
+    ObservationRepository,
+    ObservationRow,
+)
+from tests.cases.case_fixture import input_case, observation_fixture
 
 
 @pytest.fixture(scope="session")
@@ -27,3 +32,74 @@ def test_get_observations_by_concept(
     measurements = observation_repository.get_observations_by_concept(1, [4167217])
 
     assert len(measurements) == 5
+
+
+def test_get_observations_by_visit(
+    observation_repository: ObservationRepository, session
+):
+    input_case(session)
+
+    observations = observation_repository.get_observations_by_visit(1)
+
+    assert observations == observation_rows_of_visit_1(session)
+
+
+def test_get_observations_of_concepts(
+    observation_repository: ObservationRepository, session
+):
+    input_case(session)
+
+    observations = observation_repository.get_observations_of_concepts(
+        1, [4041306], [38000282]
+    )
+    of_types = observation_repository.get_observations_of_concepts(1, [], [4034855])
+
+    assert observations == [
+        row
+        for row in observation_rows_of_visit_1(session)
+        if row.observation_concept_id == 4041306
+        or row.observation_type_concept_id == 38000282
+    ]
+    assert [row.observation_concept_id for row in of_types] == [34, 35]
+
+
+def test_get_valued_observation_concepts(
+    observation_repository: ObservationRepository, session
+):
+    input_case(session)
+    # rows that render to nothing do not count
+    session.add(observation_fixture(concept_id=998, observation_id=98))
+    session.add(
+        observation_fixture(concept_id=999, value_as_string="", observation_id=99)
+    )
+    session.flush()
+
+    valued = observation_repository.get_valued_observation_concepts(
+        1, [4167217, 4041306, 998, 999, 404]
+    )
+
+    assert valued == {4167217, 4041306}
+
+
+def test_get_observations_by_visits(
+    observation_repository: ObservationRepository, session
+):
+    input_case(session)
+
+    observations = observation_repository.get_observations_by_visits([1, 404])
+
+    assert observations == observation_rows_of_visit_1(session)
+
+
+def observation_rows_of_visit_1(session):
+    entities = session.scalars(
+        select(Observation)
+        .where(Observation.visit_occurrence_id == 1)
+        .order_by(Observation.observation_id)
+    )
+    rows = [
+        ObservationRow(*(getattr(entity, field) for field in ObservationRow._fields))
+        for entity in entities
+    ]
+    assert len(rows) == 9
+    return rows
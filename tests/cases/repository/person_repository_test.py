@@ -1,6 +1,6 @@
 import pytest
 
-from src.cases.repository.person_repository import PersonRepository
+from src.cases.repository.person_repository import PersonRepository, PersonRow
 from tests.cases.case_fixture import input_case
 
 
@@ -16,3 +16,19 @@ def test_get_concept(person_repository: PersonRepository, session):
 
     assert person is not None
     assert person.gender_concept_id == 2
+
+
+def test_get_persons(person_repository: PersonRepository, session):
+    input_case(session)
+
+    persons = person_repository.get_persons([1, 404])
+
+    person = person_repository.get_person(1)
+    assert persons == [
+        PersonRow(
+            1,
+            person.gender_concept_id,
+            person.year_of_birth,
+            person.person_source_value,
+        )
+    ]
@@ -1,6 +1,9 @@
 import pytest
 
-from src.cases.repository.visit_occurrence_repository import VisitOccurrenceRepository
+from src.cases.repository.visit_occurrence_repository import (
+    VisitOccurrenceRepository,
+    VisitRow,
+)
 from tests.cases.case_fixture import input_case
 
 
@@ -16,3 +19,14 @@ def test_get_concept(visit_occurrence_repository: VisitOccurrenceRepository, ses
 
     assert visit is not None
     assert visit.person_id == 1
+
+
+def test_get_visit_occurrences(
+    visit_occurrence_repository: VisitOccurrenceRepository, session
+):
+    input_case(session)
+
+    visits = visit_occurrence_repository.get_visit_occurrences([1, 404])
+
+    visit = visit_occurrence_repository.get_visit_occurrence(1)
+    assert visits == [VisitRow(1, visit.person_id, visit.visit_start_date)]
@@ -0,0 +1,118 @@
+import threading
+
+from src.cases.model.case import Case
+from src.cases.service.case_prefetcher import CasePrefetcher, PrefetchedReviews
+
+
+def case(name="sunwukong"):
+    return Case(name, "1", [], [])
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestPrefetchedReviews:
+    def test_hand_out_slot_once(self):
+        reviews = PrefetchedReviews(60)
+        prefetched = case()
+        reviews.put("a@b.com", "config-1", prefetched, reviews.generation("a@b.com"))
+
+        assert reviews.take("a@b.com", "config-1") is prefetched
+        assert reviews.take("a@b.com", "config-1") is None
+
+    def test_ignore_slot_of_other_config(self):
+        reviews = PrefetchedReviews(60)
+        reviews.put("a@b.com", "config-1", case(), 0)
+
+        assert reviews.take("a@b.com", "config-2") is None
+        assert reviews.take("b@b.com", "config-1") is None
+
+    def test_expire_slot_after_ttl(self):
+        clock = FakeClock()
+        reviews = PrefetchedReviews(60, clock)
+        reviews.put("a@b.com", "config-1", case(), 0)
+
+        clock.now = 60
+
+        assert reviews.take("a@b.com", "config-1") is None
+
+    def test_drop_discards_slot_and_builds_started_before(self):
+        reviews = PrefetchedReviews(60)
+        reviews.put("a@b.com", "config-1", case(), 0)
+        started = reviews.generation("a@b.com")
+
+        reviews.drop("a@b.com")
+
+        assert reviews.take("a@b.com", "config-1") is None
+        assert not reviews.put("a@b.com", "config-1", case(), started)
+        assert reviews.take("a@b.com", "config-1") is None
+
+
+class TestCasePrefetcher:
+    def test_build_in_app_context_and_fill_slot(self, app):
+        prefetched = case()
+        built = []
+
+        def build(user_email, config_id):
+            from flask import current_app
+
+            built.append((user_email, config_id, current_app.name))
+            return prefetched
+
+        prefetcher = CasePrefetcher(app, build)
+
+        prefetcher.submit("a@b.com", "config-1").result()
+
+        assert built == [("a@b.com", "config-1", app.name)]
+        assert prefetcher.take("a@b.com", "config-1") is prefetched
+
+    def test_skip_build_already_in_flight(self, app):
+        release = threading.Event()
+
+        def build(user_email, config_id):
+            release.wait(5)
+            return case()
+
+        prefetcher = CasePrefetcher(app, build)
+        first = prefetcher.submit("a@b.com", "config-1")
+
+        assert prefetcher.submit("a@b.com", "config-1") is None
+
+        release.set()
+        first.result()
+        assert prefetcher.submit("a@b.com", "config-1") is not None
+
+    def test_discard_build_dropped_while_running(self, app):
+        started = threading.Event()
+        release = threading.Event()
+
+        def build(user_email, config_id):
+            started.set()
+            release.wait(5)
+            return case()
+
+        prefetcher = CasePrefetcher(app, build)
+        future = prefetcher.submit("a@b.com", "config-1")
+        started.wait(5)
+
+        prefetcher.drop("a@b.com")
+        release.set()
+        future.result()
+
+        assert prefetcher.take("a@b.com", "config-1") is None
+
+    def test_leave_slot_empty_when_build_fails(self, app):
+        def build(user_email, config_id):
+            raise RuntimeError("database gone")
+
+        prefetcher = CasePrefetcher(app, build)
+
+        prefetcher.submit("a@b.com", "config-1").result()
+
+        assert prefetcher.take("a@b.com", "config-1") is None
+        assert prefetcher.submit("a@b.com", "config-1") is not None
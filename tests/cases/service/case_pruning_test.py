@@ -0,0 +1,167 @@
+from src.cases.model.case import Case, TreeNode
+from src.cases.service.case_pruning import (
+    SectionRule,
+    fold_collapsed,
+    folded_children,
+    prune_case_tree,
+)
+from src.user.utils.path_trie import compile_path_config
+
+
+def case_tree():
+    return tuple(
+        node.freeze()
+        for node in [
+            TreeNode(
+                "BACKGROUND",
+                [
+                    TreeNode("Patient Demographics", [TreeNode("Age", "36")]),
+                    TreeNode("Family History", ["Cancer", "Diabetes"]),
+                    TreeNode("Medical History", ["Asthma"]),
+                ],
+            ),
+            TreeNode("PATIENT COMPLAINT", [TreeNode("Chief Complaint", "Pain")]),
+            TreeNode(
+                "PHYSICAL EXAMINATION",
+                [
+                    TreeNode("Vital Signs", "1"),
+                    TreeNode("BMI (body mass index) centile", "Normal"),
+                ],
+            ),
+        ]
+    )
+
+
+class TestPruneCaseTree:
+    def test_prune_background_per_path_trie(self):
+        base = case_tree()
+        path_trie = compile_path_config(
+            [
+                {
+                    "path": "BACKGROUND.Family History.Cancer",
+                    "style": {"collapse": True, "top": 2},
+                }
+            ]
+        )
+
+        pruned, important_infos = prune_case_tree(base, path_trie)
+
+        assert pruned[0] == TreeNode(
+            "BACKGROUND",
+            [
+                TreeNode("Patient Demographics", [TreeNode("Age", "36")]),
+                TreeNode("Family History", ["Cancer"], {"collapse": False, "top": 2}),
+                TreeNode("Medical History", []),
+            ],
+        )
+        assert important_infos == [
+            {"key": "Family History", "values": ["Cancer"], "weight": 2}
+        ]
+        assert base[0].values[1].values == ("Cancer", "Diabetes")
+
+    def test_pass_through_sections_without_rule(self):
+        base = case_tree()
+
+        pruned, _ = prune_case_tree(base, compile_path_config([]))
+
+        assert pruned[1] is base[1]
+
+    def test_hide_bmi_without_physical_examination_config(self):
+        pruned, _ = prune_case_tree(case_tree(), compile_path_config([]))
+
+        assert pruned[2] == TreeNode(
+            "PHYSICAL EXAMINATION", [TreeNode("Vital Signs", "1")]
+        )
+
+    def test_keep_configured_children_and_rename_bmi(self):
+        path_trie = compile_path_config(
+            [{"path": "PHYSICAL EXAMINATION.Body measure.BMI (body mass index) centile"}]
+        )
+
+        pruned, _ = prune_case_tree(case_tree(), path_trie)
+
+        assert pruned[2] == TreeNode(
+            "PHYSICAL EXAMINATION",
+            [TreeNode("BMI (body mass index) range", "Normal")],
+        )
+
+    def test_drop_section_left_empty(self):
+        path_trie = compile_path_config(
+            [{"path": "PHYSICAL EXAMINATION.Abdominal.Tenderness"}]
+        )
+
+        pruned, _ = prune_case_tree(case_tree(), path_trie)
+
+        assert [section.key for section in pruned] == [
+            "BACKGROUND",
+            "PATIENT COMPLAINT",
+        ]
+
+    def test_custom_rule_table(self):
+        rules = {
+            "PATIENT COMPLAINT": SectionRule(
+                default_hidden=frozenset({"Chief Complaint"}), drop_if_empty=True
+            )
+        }
+
+        pruned, _ = prune_case_tree(case_tree(), compile_path_config([]), rules)
+
+        assert [section.key for section in pruned] == [
+            "BACKGROUND",
+            "PHYSICAL EXAMINATION",
+        ]
+        assert pruned[1] == case_tree()[2]
+
+
+class TestFoldCollapsed:
+    def test_leave_out_values_of_collapsed_children_only(self):
+        # Given
+        path_trie = compile_path_config(
+            [
+                {"path": "BACKGROUND.Family History.Cancer", "style": {"collapse": False}},
+                {"path": "BACKGROUND.Medical History.Asthma", "style": {"top": 1}},
+            ]
+        )
+        details, _ = prune_case_tree(case_tree(), path_trie)
+        important = [TreeNode("Medical History", ["Asthma"])]
+
+        # When
+        folded = fold_collapsed(Case("sunwukong", "1", details, important))
+
+        # Then
+        background = folded.details[0]
+        assert background.values[1].to_dict() == {
+            "key": "Family History",
+            "values": None,
+            "style": {"collapse": True},
+        }
+        assert background.values[2] is details[0].values[2]
+        assert folded.details[1:] == details[1:]
+        assert folded.importantInfos is important
+        # the shared tree is left alone
+        assert details[0].values[1].values == ["Cancer"]
+
+
+class TestFoldedChildren:
+    def test_fold_collapsed_children_without_top_weight(self):
+        # Given
+        path_trie = compile_path_config(
+            [
+                {"path": "BACKGROUND.Family History.Cancer", "style": {"collapse": False}},
+                {
+                    "path": "BACKGROUND.Medical History.Asthma",
+                    "style": {"collapse": False, "top": 1},
+                },
+                {"path": "BACKGROUND.Social History.Smoke", "style": {"collapse": True}},
+            ]
+        )
+
+        # When
+        folded = folded_children(
+            path_trie,
+            "BACKGROUND",
+            ["Family History", "Medical History", "Social History", "Surgery"],
+        )
+
+        # Then
+        assert folded == ["Family History"]
@@ -0,0 +1,42 @@
+from operator import attrgetter
+
+from src.cases.service.case_rows import RowIndex
+from tests.cases.case_fixture import observation_fixture
+
+
+def rows():
+    return [
+        observation_fixture(concept_id=1, observation_id=1),
+        observation_fixture(concept_id=2, observation_id=2),
+        observation_fixture(concept_id=1, observation_id=3),
+        observation_fixture(concept_id=3, observation_id=4),
+    ]
+
+
+def ids(selected):
+    return [row.observation_id for row in selected]
+
+
+def test_select_single_concept():
+    index = RowIndex(rows(), attrgetter("observation_concept_id"))
+
+    assert ids(index.select([1])) == [1, 3]
+
+
+def test_select_many_concepts_keeps_table_order():
+    index = RowIndex(rows(), attrgetter("observation_concept_id"))
+
+    assert ids(index.select([3, 1])) == [1, 3, 4]
+
+
+def test_select_ignores_duplicate_and_unknown_ids():
+    index = RowIndex(rows(), attrgetter("observation_concept_id"))
+
+    assert ids(index.select([2, 2, 99])) == [2]
+    assert index.select([99]) == []
+
+
+def test_select_accepts_single_id():
+    index = RowIndex(rows(), attrgetter("observation_concept_id"))
+
+    assert ids(index.select(2)) == [2]
@@ -1,25 +1,39 @@
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
 from src.cases.controller.response.case_summary import CaseSummary
 from src.cases.model.case import Case
 from src.cases.model.case import TreeNode
+from src.cases.model.case_progress import CaseProgress
+from src.cases.model.case_tree_cache import CaseTreeCache
+from src.cases.repository.case_progress_repository import CaseProgressRepository
+from src.cases.repository.case_tree_cache_repository import CaseTreeCacheRepository
 from src.cases.repository.concept_repository import ConceptRepository
 from src.cases.repository.drug_exposure_repository import DrugExposureRepository
 from src.cases.repository.measurement_repository import MeasurementRepository
 from src.cases.repository.observation_repository import ObservationRepository
 from src.cases.repository.person_repository import PersonRepository
 from src.cases.repository.visit_occurrence_repository import VisitOccurrenceRepository
+from src.cases.service.concept_hierarchy import ConceptHierarchy
+from src.cases.service.concept_name_cache import ConceptNameCache
+from src.cases.service.case_rows import RowIndex
+from src.cases.service import case_service as case_service_module
 from src.cases.service.case_service import (
     CaseService,
+    PageConfig,
     add_if_value_present,
     attach_style,
     get_age,
     get_value_of_rows,
     group_by,
     is_leaf_node,
+    page_config_hash,
+    select_children,
 )
+from src.common.cache.system_config_cache import SystemConfigCache
 from src.common.exception.BusinessException import (
     BusinessException,
     BusinessExceptionEnum,
@@ -105,6 +119,38 @@ class TestAddIfPresent:
         assert len(data) == 0
 
 
+class TestSelectChildren:
+    def test_repeat_rows_per_relationship(self):
+        measurements = RowIndex(
+            [
+                measurement_fixture(concept_id=5, measurement_id=1),
+                measurement_fixture(concept_id=6, measurement_id=2),
+                measurement_fixture(concept_id=7, measurement_id=3),
+            ],
+            lambda m: m.measurement_concept_id,
+        )
+        children_by_parent = {1: [5, 6], 2: [5], 3: [7]}
+
+        selected = select_children(measurements, children_by_parent, [1, 2])
+
+        assert [m.measurement_id for m in selected] == [1, 1, 2]
+
+    def test_no_children(self):
+        measurements = RowIndex([], lambda m: m.measurement_concept_id)
+
+        assert select_children(measurements, {}, [1]) == []
+
+
+class TestPageConfigHash:
+    def test_hash_ignores_key_order(self):
+        assert page_config_hash({"a": [1], "b": {"c": [2]}}) == page_config_hash(
+            {"b": {"c": [2]}, "a": [1]}
+        )
+
+    def test_hash_changes_with_config(self):
+        assert page_config_hash({"a": [1]}) != page_config_hash({"a": [2]})
+
+
 class TestAttachStyle:
     def test_attach_style_to_configuration_when_path_found_in_first_layer(self):
         case_details = [
@@ -180,6 +226,21 @@ class TestAttachStyle:
         assert important_infos == [{"key": "levelTree", "values": "text", "weight": 1}]
 
 
+def set_user_configurations(configuration_repository, pairs, answered=()):
+    """Serves the user's (case_id, config_id) pairs minus the answered ids."""
+
+    def next_unanswered_configuration(user_email, config_id=None):
+        # stands in for the anti-join against the user's answers
+        for pair in pairs:
+            if pair[1] not in answered and config_id in (None, pair[1]):
+                return pair
+        return None
+
+    configuration_repository.get_next_unanswered_configuration.side_effect = (
+        next_unanswered_configuration
+    )
+
+
 def mock_repos(mocker):
     visit_occurrence_repository = mocker.Mock(VisitOccurrenceRepository)
     measurement_repository = mocker.Mock(MeasurementRepository)
@@ -200,11 +261,13 @@ def mock_repos(mocker):
     )
     person_repository.get_person.return_value = person_fixture()
     concept_repository.get_concept.return_value = concept_fixture()
+    concept_repository.get_concept_names.return_value = {}
     observation_repository.get_observations_by_concept.return_value = []
     observation_repository.get_observations_by_type.return_value = []
-    measurement_repository.get_measurements.return_value = []
-    measurement_repository.get_measurements_of_parents.return_value = []
-    diagnosis_repository.get_answered_case_list_by_user.return_value = []
+    observation_repository.get_observations_by_visit.return_value = []
+    measurement_repository.get_measurements_by_visit.return_value = []
+    concept_repository.get_concept_relationships.return_value = []
+    set_user_configurations(configuration_repository, [])
     configuration_repository.get_configuration_by_id.return_value = DisplayConfig(
         path_config=[
             {
@@ -328,8 +391,13 @@ class TestGetCaseDetail:
             diagnosis_repository,
         ) = mock_repos(mocker)
 
-        observation_repository.get_observations_by_concept.return_value = [
-            observation_fixture(concept_id=1, value_as_string="value")
+        observation_repository.get_observations_by_visit.return_value = [
+            observation_fixture(
+                concept_id=concept_id, value_as_string="value", observation_id=index
+            )
+            for index, concept_id in enumerate(
+                [4167217, 4041306, 4238768, 4038710, 4314454]
+            )
         ]
 
         case_service = CaseService(
@@ -370,8 +438,19 @@ class TestGetCaseDetail:
             diagnosis_repository,
         ) = mock_repos(mocker)
 
-        observation_repository.get_observations_by_type.return_value = [
-            observation_fixture(concept_id=1, value_as_string="value")
+        observation_repository.get_observations_by_visit.return_value = [
+            observation_fixture(
+                concept_id=1,
+                value_as_string="value",
+                observation_type_concept_id=38000282,
+                observation_id=1,
+            ),
+            observation_fixture(
+                concept_id=1,
+                value_as_string="value",
+                observation_type_concept_id=4034855,
+                observation_id=2,
+            ),
         ]
 
         case_service = CaseService(
@@ -410,8 +489,13 @@ class TestGetCaseDetail:
         ) = mock_repos(mocker)
 
         concept_repository.get_concept.side_effect = mock_concept_func
-        measurement_repository.get_measurements.return_value = [
-            measurement_fixture(concept_id=1, value_as_number=1)
+        measurement_repository.get_measurements_by_visit.return_value = [
+            measurement_fixture(
+                concept_id=concept_id, value_as_number=1, measurement_id=index
+            )
+            for index, concept_id in enumerate(
+                [4086988, 4263222, 36717771, 4080843, 4090320, 4152368, 4154954]
+            )
         ]
 
         case_service = CaseService(
@@ -462,7 +546,12 @@ class TestGetCaseDetail:
         ) = mock_repos(mocker)
 
         concept_repository.get_concept.side_effect = mock_concept_func
-        measurement_repository.get_measurements_of_parents.return_value = [
+        concept_repository.get_concept_relationships.side_effect = (
+            lambda parent_ids, relationship_ids: [
+                (parent_id, 1) for parent_id in parent_ids
+            ]
+        )
+        measurement_repository.get_measurements_by_visit.return_value = [
             measurement_fixture(concept_id=1, value_as_number=1)
         ]
 
@@ -499,6 +588,113 @@ class TestGetCaseDetail:
         assert physical_examination.values[6].key == "Neurological"
         assert physical_examination.values[6].values == [TreeNode("test", "1")]
 
+    def test_get_case_detail_prefetches_concept_names(self, mocker):
+        # Given
+        (
+            concept_repository,
+            configuration_repository,
+            drug_exposure_repository,
+            measurement_repository,
+            observation_repository,
+            person_repository,
+            visit_occurrence_repository,
+            system_config_repository,
+            diagnosis_repository,
+        ) = mock_repos(mocker)
+
+        concept_repository.get_concept_names.side_effect = lambda ids: {
+            concept_id: f"name {concept_id}" for concept_id in ids
+        }
+        measurement_repository.get_measurements_by_visit.return_value = [
+            measurement_fixture(
+                concept_id=4086988, value_as_number=1, unit_concept_id=5
+            )
+        ]
+        concept_name_cache = ConceptNameCache(100)
+
+        case_service = CaseService(
+            visit_occurrence_repository=visit_occurrence_repository,
+            concept_repository=concept_repository,
+            measurement_repository=measurement_repository,
+            observation_repository=observation_repository,
+            person_repository=person_repository,
+            drug_exposure_repository=drug_exposure_repository,
+            configuration_repository=configuration_repository,
+            system_config_repository=system_config_repository,
+            diagnose_repository=diagnosis_repository,
+            concept_name_cache=concept_name_cache,
+        )
+
+        # When
+        detail = case_service.get_case_detail(1)
+        case_service.get_case_detail(1)
+
+        # Then
+        physical_examination = detail[1]
+        assert physical_examination.values[0] == TreeNode(
+            "name 4086988", "1 name 5"
+        )
+        concept_repository.get_concept.assert_not_called()
+        assert concept_name_cache.stats()["hits"] > 0
+
+    def test_get_case_detail_loads_relationships_once_per_page_config(self, mocker):
+        # Given
+        (
+            concept_repository,
+            configuration_repository,
+            drug_exposure_repository,
+            measurement_repository,
+            observation_repository,
+            person_repository,
+            visit_occurrence_repository,
+            system_config_repository,
+            diagnosis_repository,
+        ) = mock_repos(mocker)
+
+        system_config_repository.get_config_by_id.return_value = SystemConfig(
+            id="page_config",
+            json_config={"PHYSICAL EXAMINATION": {"Abdominal": [4152368]}},
+        )
+        measurement_repository.get_measurements_by_visit.return_value = [
+            measurement_fixture(concept_id=4152368, value_as_number=1)
+        ]
+
+        concept_hierarchy = ConceptHierarchy()
+        case_service = CaseService(
+            visit_occurrence_repository=visit_occurrence_repository,
+            concept_repository=concept_repository,
+            measurement_repository=measurement_repository,
+            observation_repository=observation_repository,
+            person_repository=person_repository,
+            drug_exposure_repository=drug_exposure_repository,
+            configuration_repository=configuration_repository,
+            system_config_repository=system_config_repository,
+            diagnose_repository=diagnosis_repository,
+            concept_hierarchy=concept_hierarchy,
+        )
+
+        # When
+        detail = case_service.get_case_detail(1)
+        case_service.get_case_detail(1)
+
+        # Then
+        assert detail == [
+            TreeNode("PHYSICAL EXAMINATION", [TreeNode("test", "1")])
+        ]
+        concept_repository.get_concept_relationships.assert_called_once_with(
+            {4152368}, ["Subsumes", "Is characterized by"]
+        )
+        assert observation_repository.get_observations_by_visit.call_count == 2
+        assert measurement_repository.get_measurements_by_visit.call_count == 2
+
+        # a changed page_config gets its own hierarchy
+        system_config_repository.get_config_by_id.return_value = SystemConfig(
+            id="page_config",
+            json_config={"PHYSICAL EXAMINATION": {"Abdominal": [4152369]}},
+        )
+        case_service.get_case_detail(1)
+        assert concept_repository.get_concept_relationships.call_count == 2
+
 
 class TestGetValue:
     def test_get_value_of_observation_with_string(self, mocker):
@@ -1234,6 +1430,459 @@ class TestGetCaseReview:
             importantInfos=[],
         )
 
+    def test_get_case_review_saves_built_tree_on_cache_miss(self, mocker):
+        # Given
+        (
+            concept_repository,
+            configuration_repository,
+            drug_exposure_repository,
+            measurement_repository,
+            observation_repository,
+            person_repository,
+            visit_occurrence_repository,
+            system_config_repository,
+            diagnosis_repository,
+        ) = mock_repos(mocker)
+        case_tree_repository = mocker.Mock(CaseTreeCacheRepository)
+        case_tree_repository.get_case_tree.return_value = None
+
+        case_service = CaseService(
+            visit_occurrence_repository=visit_occurrence_repository,
+            concept_repository=concept_repository,
+            measurement_repository=measurement_repository,
+            observation_repository=observation_repository,
+            person_repository=person_repository,
+            drug_exposure_repository=drug_exposure_repository,
+            configuration_repository=configuration_repository,
+            system_config_repository=system_config_repository,
+            diagnose_repository=diagnosis_repository,
+            case_tree_repository=case_tree_repository,
+        )
+
+        # When
+        case_review = case_service.get_case_review(1)
+
+        # Then
+        config_hash = page_config_hash(
+            system_config_repository.get_config_by_id.return_value.json_config
+        )
+        case_tree_repository.get_case_tree.assert_called_once_with(1, config_hash)
+        case_tree_repository.save_case_tree.assert_called_once_with(
+            1,
+            config_hash,
+            "sunwukong",
+            [
+                {
+                    "key": "BACKGROUND",
+                    "values": [
+                        {
+                            "key": "Patient Demographics",
+                            "values": [
+                                {"key": "Age", "values": "36", "style": None},
+                                {"key": "Gender", "values": "test", "style": None},
+                            ],
+                            "style": None,
+                        }
+                    ],
+                    "style": None,
+                }
+            ],
+        )
+        assert case_review.personName == "sunwukong"
+
+    def test_get_case_review_serves_cached_tree(self, mocker):
+        # Given
+        (
+            concept_repository,
+            configuration_repository,
+            drug_exposure_repository,
+            measurement_repository,
+            observation_repository,
+            person_repository,
+            visit_occurrence_repository,
+            system_config_repository,
+            diagnosis_repository,
+        ) = mock_repos(mocker)
+        case_tree_repository = mocker.Mock(CaseTreeCacheRepository)
+        case_tree_repository.get_case_tree.return_value = CaseTreeCache(
+            case_id=1,
+            person_name="cached",
+            tree=[
+                TreeNode(
+                    "BACKGROUND",
+                    [TreeNode("Patient Demographics", [TreeNode("Age", "36")])],
+                ).to_dict()
+            ],
+        )
+
+        case_service = CaseService(
+            visit_occurrence_repository=visit_occurrence_repository,
+            concept_repository=concept_repository,
+            measurement_repository=measurement_repository,
+            observation_repository=observation_repository,
+            person_repository=person_repository,
+            drug_exposure_repository=drug_exposure_repository,
+            configuration_repository=configuration_repository,
+            system_config_repository=system_config_repository,
+            diagnose_repository=diagnosis_repository,
+            case_tree_repository=case_tree_repository,
+        )
+
+        # When
+        case_review = case_service.get_case_review(1)
+
+        # Then
+        assert case_review == Case(
+            personName="cached",
+            caseNumber="1",
+            details=[
+                TreeNode(
+                    "BACKGROUND",
+                    [
+                        TreeNode("Patient Demographics", [TreeNode("Age", "36")])
+                    ],
+                )
+            ],
+            importantInfos=[],
+        )
+        visit_occurrence_repository.get_visit_occurrence.assert_not_called()
+        person_repository.get_person.assert_not_called()
+        case_tree_repository.save_case_tree.assert_not_called()
+
+    def test_get_case_review_shares_base_tree_between_configs(self, mocker):
+        # Given
+        (
+            concept_repository,
+            configuration_repository,
+            drug_exposure_repository,
+            measurement_repository,
+            observation_repository,
+            person_repository,
+            visit_occurrence_repository,
+            system_config_repository,
+            diagnosis_repository,
+        ) = mock_repos(mocker)
+        observation_repository.get_observations_by_visit.return_value = [
+            observation_fixture(4167217, value_as_string="a"),
+            observation_fixture(4167217, value_as_string="b"),
+        ]
+        configuration_repository.get_configuration_by_id.side_effect = [
+            DisplayConfig(
+                path_config=[
+                    {"path": "BACKGROUND.Family History.a", "style": {"top": 1}}
+                ],
+                user_email="goodbye@sunwukong.com",
+                case_id=1,
+            ),
+            DisplayConfig(user_email="goodbye@sunwukong.com", case_id=1),
+        ]
+
+        case_service = CaseService(
+            visit_occurrence_repository=visit_occurrence_repository,
+            concept_repository=concept_repository,
+            measurement_repository=measurement_repository,
+            observation_repository=observation_repository,
+            person_repository=person_repository,
+            drug_exposure_repository=drug_exposure_repository,
+            configuration_repository=configuration_repository,
+            system_config_repository=system_config_repository,
+            diagnose_repository=diagnosis_repository,
+        )
+
+        # When
+        first_review = case_service.get_case_review(1)
+        second_review = case_service.get_case_review(2)
+
+        # Then
+        family_history = first_review.details[0].values[1]
+        assert family_history == TreeNode("Family History", ["a"], {"top": 1})
+        assert first_review.importantInfos == [TreeNode("Family History", ["a"])]
+        assert second_review.details[0].values[1] == TreeNode("Family History", [])
+        _, base_tree = case_service.get_case_tree(1)
+        assert base_tree[0].values[1] == TreeNode("Family History", ["a", "b"])
+        visit_occurrence_repository.get_visit_occurrence.assert_called_once_with(1)
+
+    def test_get_case_review_applies_cached_overlay_of_config(self, mocker):
+        # Given
+        (
+            concept_repository,
+            configuration_repository,
+            drug_exposure_repository,
+            measurement_repository,
+            observation_repository,
+            person_repository,
+            visit_occurrence_repository,
+            system_config_repository,
+            diagnosis_repository,
+        ) = mock_repos(mocker)
+        observation_repository.get_observations_by_visit.return_value = [
+            observation_fixture(4167217, value_as_string="a"),
+            observation_fixture(4167217, value_as_string="b"),
+        ]
+        configuration_repository.get_configuration_by_id.return_value = DisplayConfig(
+            id="config-1",
+            path_config=[{"path": "BACKGROUND.Family History.b", "style": {"top": 1}}],
+            user_email="goodbye@sunwukong.com",
+            case_id=1,
+        )
+        case_service = CaseService(
+            visit_occurrence_repository=visit_occurrence_repository,
+            concept_repository=concept_repository,
+            measurement_repository=measurement_repository,
+            observation_repository=observation_repository,
+            person_repository=person_repository,
+            drug_exposure_repository=drug_exposure_repository,
+            configuration_repository=configuration_repository,
+            system_config_repository=system_config_repository,
+            diagnose_repository=diagnosis_repository,
+        )
+        review_case = mocker.spy(case_service, "review_case")
+
+        # When
+        first_review = case_service.get_case_review("config-1")
+        second_review = case_service.get_case_review("config-1")
+
+        # Then
+        assert second_review == first_review
+        assert second_review.details[0].values[1] == TreeNode(
+            "Family History", ["b"], {"top": 1}
+        )
+        review_case.assert_called_once()
+        assert len(case_service.review_overlays) == 1
+
+    def test_get_case_review_with_cached_page_config(self, mocker):
+        # Given
+        (
+            concept_repository,
+            configuration_repository,
+            drug_exposure_repository,
+            measurement_repository,
+            observation_repository,
+            person_repository,
+            visit_occurrence_repository,
+            system_config_repository,
+            diagnosis_repository,
+        ) = mock_repos(mocker)
+        page_config = system_config_repository.get_config_by_id(
+            "page_config"
+        ).json_config
+        system_config_repository.get_config_with_stamp.return_value = (
+            page_config,
+            "stamp",
+        )
+        system_config_repository.get_config_by_id.reset_mock()
+        case_service = CaseService(
+            visit_occurrence_repository=visit_occurrence_repository,
+            concept_repository=concept_repository,
+            measurement_repository=measurement_repository,
+            observation_repository=observation_repository,
+            person_repository=person_repository,
+            drug_exposure_repository=drug_exposure_repository,
+            configuration_repository=configuration_repository,
+            system_config_repository=system_config_repository,
+            diagnose_repository=diagnosis_repository,
+            page_config_cache=SystemConfigCache(
+                "page_config", PageConfig.of, check_interval=60
+            ),
+        )
+        expected = PageConfig.of(page_config)
+        collect = mocker.spy(case_service_module, "collect_concept_ids")
+
+        # When
+        case_service.get_case_review(1)
+        etag = case_service.get_case_review_etag(1)
+
+        # Then
+        assert case_service.get_page_config() == expected
+        assert etag == case_service.get_case_review_etag(1)
+        system_config_repository.get_config_with_stamp.assert_called_once_with(
+            "page_config"
+        )
+        system_config_repository.get_config_stamp.assert_not_called()
+        system_config_repository.get_config_by_id.assert_not_called()
+        # parsed once, when loaded
+        collect.assert_called_once()
+
+    def test_build_tree_once_for_concurrent_misses(self, mocker):
+        # Given
+        (
+            concept_repository,
+            configuration_repository,
+            drug_exposure_repository,
+            measurement_repository,
+            observation_repository,
+            person_repository,
+            visit_occurrence_repository,
+            system_config_repository,
+            diagnosis_repository,
+        ) = mock_repos(mocker)
+        case_service = CaseService(
+            visit_occurrence_repository=visit_occurrence_repository,
+            concept_repository=concept_repository,
+            measurement_repository=measurement_repository,
+            observation_repository=observation_repository,
+            person_repository=person_repository,
+            drug_exposure_repository=drug_exposure_repository,
+            configuration_repository=configuration_repository,
+            system_config_repository=system_config_repository,
+            diagnose_repository=diagnosis_repository,
+        )
+        threads = 4
+
+        def slow_visit(case_id):
+            # hold the first load until every other thread waits for it
+            deadline = time.monotonic() + 5
+            while case_service.case_tree_loads.coalesced < threads - 1:
+                assert time.monotonic() < deadline, "threads did not coalesce"
+                time.sleep(0.001)
+            return visit_occurrence_fixture()
+
+        visit_occurrence_repository.get_visit_occurrence.side_effect = slow_visit
+
+        # When
+        with ThreadPoolExecutor(threads) as pool:
+            case_trees = list(pool.map(case_service.get_case_tree, [1] * threads))
+
+        # Then
+        assert all(case_tree is case_trees[0] for case_tree in case_trees)
+        visit_occurrence_repository.get_visit_occurrence.assert_called_once_with(1)
+
+    def test_read_tree_stored_while_waiting_for_build_lock(self, mocker):
+        # Given
+        (
+            concept_repository,
+            configuration_repository,
+            drug_exposure_repository,
+            measurement_repository,
+            observation_repository,
+            person_repository,
+            visit_occurrence_repository,
+            system_config_repository,
+            diagnosis_repository,
+        ) = mock_repos(mocker)
+        case_tree_repository = mocker.Mock(CaseTreeCacheRepository)
+        case_tree_repository.get_case_tree.side_effect = [
+            None,
+            CaseTreeCache(case_id=1, person_name="built elsewhere", tree=[]),
+        ]
+        case_service = CaseService(
+            visit_occurrence_repository=visit_occurrence_repository,
+            concept_repository=concept_repository,
+            measurement_repository=measurement_repository,
+            observation_repository=observation_repository,
+            person_repository=person_repository,
+            drug_exposure_repository=drug_exposure_repository,
+            configuration_repository=configuration_repository,
+            system_config_repository=system_config_repository,
+            diagnose_repository=diagnosis_repository,
+            case_tree_repository=case_tree_repository,
+            lock_case_tree_builds=True,
+        )
+
+        # When
+        case_tree = case_service.get_case_tree(1)
+
+        # Then
+        assert case_tree == ("built elsewhere", ())
+        config_hash = page_config_hash(case_service.get_page_configuration())
+        case_tree_repository.lock_case_tree.assert_called_once_with(1, config_hash)
+        visit_occurrence_repository.get_visit_occurrence.assert_not_called()
+        case_tree_repository.save_case_tree.assert_not_called()
+
+
+class TestGetCaseReviews:
+    def case_service(self, mocker, case_tree_repository):
+        (
+            concept_repository,
+            configuration_repository,
+            drug_exposure_repository,
+            measurement_repository,
+            observation_repository,
+            person_repository,
+            visit_occurrence_repository,
+            system_config_repository,
+            diagnosis_repository,
+        ) = mock_repos(mocker)
+        return CaseService(
+            visit_occurrence_repository=visit_occurrence_repository,
+            concept_repository=concept_repository,
+            measurement_repository=measurement_repository,
+            observation_repository=observation_repository,
+            person_repository=person_repository,
+            drug_exposure_repository=drug_exposure_repository,
+            configuration_repository=configuration_repository,
+            system_config_repository=system_config_repository,
+            diagnose_repository=diagnosis_repository,
+            case_tree_repository=case_tree_repository,
+        )
+
+    def test_get_case_trees_from_cache_store_and_batch_build(self, mocker):
+        # Given case 1 in memory, case 2 stored, case 3 unbuilt, case 4 unknown
+        case_tree_repository = mocker.Mock(CaseTreeCacheRepository)
+        case_tree_repository.get_case_trees.return_value = [
+            CaseTreeCache(case_id=2, person_name="stored", tree=[])
+        ]
+        case_service = self.case_service(mocker, case_tree_repository)
+        config_hash = page_config_hash(case_service.get_page_configuration())
+        case_service.case_tree_cache.put((1, config_hash), ("in memory", ()))
+        case_service.visit_occurrence_repository.get_visit_occurrences.return_value = [
+            visit_occurrence_fixture(visit_occurrence_id=3, person_id=3)
+        ]
+        case_service.person_repository.get_persons.return_value = [
+            person_fixture(person_id=3)
+        ]
+        case_service.observation_repository.get_observations_by_visits.return_value = []
+        case_service.measurement_repository.get_measurements_by_visits.return_value = []
+
+        # When
+        case_trees = case_service.get_case_trees([1, 2, 3, 4, 3])
+
+        # Then
+        assert set(case_trees) == {1, 2, 3}
+        assert case_trees[1] == ("in memory", ())
+        assert case_trees[2] == ("stored", ())
+        assert case_trees[3][0] == "sunwukong"
+        case_tree_repository.get_case_trees.assert_called_once_with(
+            [2, 3, 4], config_hash
+        )
+        case_service.visit_occurrence_repository.get_visit_occurrences.assert_called_once_with(
+            [3, 4]
+        )
+        saved_hash, saved = case_tree_repository.save_case_trees.call_args.args
+        assert saved_hash == config_hash
+        assert set(saved) == {3}
+        assert case_service.case_tree_cache.get((2, config_hash)) == ("stored", ())
+
+    def test_reject_batch_with_config_of_other_user(self, mocker):
+        # Given
+        case_service = self.case_service(mocker, None)
+        case_service.configuration_repository.get_configurations_by_ids.return_value = [
+            DisplayConfig(id="1", user_email="goodbye@sunwukong.com", case_id=1),
+            DisplayConfig(id="2", user_email="someone@else.com", case_id=2),
+        ]
+
+        # When
+        with pytest.raises(BusinessException) as exc_info:
+            case_service.get_case_reviews(["1", "2"], "goodbye@sunwukong.com")
+
+        # Then
+        assert exc_info.value.error == BusinessExceptionEnum.NoAccessToCaseReview
+
+    def test_reject_batch_with_config_of_unknown_case(self, mocker):
+        # Given
+        case_service = self.case_service(mocker, None)
+        case_service.configuration_repository.get_unanswered_configurations.return_value = [
+            DisplayConfig(id="1", user_email="goodbye@sunwukong.com", case_id=404)
+        ]
+        case_service.visit_occurrence_repository.get_visit_occurrences.return_value = []
+
+        # When
+        with pytest.raises(BusinessException) as exc_info:
+            case_service.get_next_case_reviews(5, "goodbye@sunwukong.com")
+
+        # Then
+        assert exc_info.value.error == BusinessExceptionEnum.InvalidCaseId
+
 
 class TestGetCaseSummary:
     def create_side_effect(self, concept_mapping):
@@ -1269,7 +1918,7 @@ class TestGetCaseSummary:
             system_config_repository,
             diagnosis_repository,
         ) = mock_repos(mocker)
-        configuration_repository.get_case_configurations_by_user.return_value = []
+        set_user_configurations(configuration_repository, [])
         visit_occurrence_repository.get_visit_occurrence.return_value = None
         person_repository.get_person.return_value = None
         observation_repository.get_observations_by_type.return_value = []
@@ -1305,9 +1954,10 @@ class TestGetCaseSummary:
             concept_mapping
         )
 
-        configuration_repository.get_case_configurations_by_user.return_value = [
-            (1, 101)
-        ]
+        set_user_configurations(
+            configuration_repository,
+            [(1, 101)],
+        )
         visit_occurrence_repository.get_visit_occurrence.return_value = mocker.Mock(
             person_id=1
         )
@@ -1380,10 +2030,13 @@ class TestGetCaseSummary:
         )
 
         # Prepare data and mocks for multiple cases
-        configuration_repository.get_case_configurations_by_user.return_value = [
-            (1, 101),
-            (2, 102),
-        ]
+        set_user_configurations(
+            configuration_repository,
+            [
+                (1, 101),
+                (2, 102),
+            ],
+        )
         visit_occurrence_repository.get_visit_occurrence.side_effect = [
             mocker.Mock(person_id=1),
             mocker.Mock(person_id=2),
@@ -1456,11 +2109,15 @@ class TestGetCaseSummary:
         )
 
         # Prepare data and mocks for multiple cases
-        configuration_repository.get_case_configurations_by_user.return_value = [
-            (1, "101"),
-            (2, "102"),
-            (3, "103"),
-        ]
+        set_user_configurations(
+            configuration_repository,
+            [
+                (1, "101"),
+                (2, "102"),
+                (3, "103"),
+            ],
+            answered=["101"],
+        )
         visit_occurrence_repository.get_visit_occurrence.side_effect = [
             mocker.Mock(person_id=1),
             mocker.Mock(person_id=2),
@@ -1500,7 +2157,6 @@ class TestGetCaseSummary:
         observation_repository.get_observations_by_type.side_effect = (
             self.create_observation_side_effect(observation_mapping)
         )
-        diagnosis_repository.get_answered_case_list_by_user.return_value = ["101"]
         mocker.patch("src.cases.service.case_service.get_age", side_effect=["36"])
 
         results = case_service.get_cases_by_user("user@example.com")
@@ -1556,9 +2212,10 @@ class TestGetCaseSummary:
         observation_repository.get_observations_by_type.side_effect = (
             self.create_observation_side_effect(observation_mapping)
         )
-        case_service.configuration_repository.get_case_configurations_by_user.return_value = [
-            (1, 101)
-        ]
+        set_user_configurations(
+            case_service.configuration_repository,
+            [(1, 101)],
+        )
         case_service.visit_occurrence_repository.get_visit_occurrence.return_value = (
             mocker.Mock(person_id=1)
         )
@@ -1577,3 +2234,123 @@ class TestGetCaseSummary:
 
         assert len(result) == 1
         assert result[0].patient_chief_complaint == expected_patient_complaint
+
+
+class TestCaseProgress:
+    def case_service(self, mocker, progress):
+        (
+            concept_repository,
+            configuration_repository,
+            drug_exposure_repository,
+            measurement_repository,
+            observation_repository,
+            person_repository,
+            visit_occurrence_repository,
+            system_config_repository,
+            diagnosis_repository,
+        ) = mock_repos(mocker)
+        set_user_configurations(
+            configuration_repository,
+            [
+                (1, "101"),
+                (2, "102"),
+            ],
+        )
+        case_progress_repository = mocker.Mock(CaseProgressRepository)
+        case_progress_repository.get_progress.return_value = progress
+        mocker.patch("src.cases.service.case_service.get_age", return_value="36")
+        return CaseService(
+            visit_occurrence_repository=visit_occurrence_repository,
+            concept_repository=concept_repository,
+            measurement_repository=measurement_repository,
+            observation_repository=observation_repository,
+            person_repository=person_repository,
+            drug_exposure_repository=drug_exposure_repository,
+            configuration_repository=configuration_repository,
+            system_config_repository=system_config_repository,
+            diagnose_repository=diagnosis_repository,
+            case_progress_repository=case_progress_repository,
+        )
+
+    def test_use_stored_cursor(self, mocker):
+        # Given
+        case_service = self.case_service(
+            mocker, CaseProgress(user_email="user@example.com", next_config_id="102")
+        )
+
+        # When
+        result = case_service.get_cases_by_user("user@example.com")
+
+        # Then
+        assert result[0].config_id == "102"
+        case_service.configuration_repository.get_next_unanswered_configuration.assert_called_once_with(
+            "user@example.com", "102"
+        )
+        case_service.case_progress_repository.save_progress.assert_not_called()
+
+    def test_save_cursor_when_missing(self, mocker):
+        # Given
+        case_service = self.case_service(mocker, None)
+
+        # When
+        result = case_service.get_cases_by_user("user@example.com")
+
+        # Then
+        assert result[0].config_id == "101"
+        case_service.case_progress_repository.save_progress.assert_called_once_with(
+            "user@example.com", "101"
+        )
+
+    def test_replace_stale_cursor(self, mocker):
+        # Given
+        case_service = self.case_service(
+            mocker, CaseProgress(user_email="user@example.com", next_config_id="999")
+        )
+
+        # When
+        result = case_service.get_cases_by_user("user@example.com")
+
+        # Then
+        assert result[0].config_id == "101"
+        case_service.case_progress_repository.save_progress.assert_called_once_with(
+            "user@example.com", "101"
+        )
+
+    def test_keep_finished_cursor(self, mocker):
+        # Given
+        case_service = self.case_service(
+            mocker, CaseProgress(user_email="user@example.com", next_config_id=None)
+        )
+        set_user_configurations(
+            case_service.configuration_repository,
+            [(1, "101"), (2, "102")],
+            answered=["101", "102"],
+        )
+
+        # When
+        result = case_service.get_cases_by_user("user@example.com")
+
+        # Then
+        assert result == []
+        case_service.case_progress_repository.save_progress.assert_not_called()
+
+    def test_write_cursor_only_when_it_changes(self, mocker):
+        # Given
+        case_service = self.case_service(mocker, None)
+        progress_repository = case_service.case_progress_repository
+
+        def save_progress(user_email, next_config_id):
+            progress_repository.get_progress.return_value = CaseProgress(
+                user_email=user_email, next_config_id=next_config_id
+            )
+
+        progress_repository.save_progress.side_effect = save_progress
+
+        # When
+        results = [case_service.get_cases_by_user("user@example.com") for _ in range(3)]
+
+        # Then
+        assert [result[0].config_id for result in results] == ["101"] * 3
+        progress_repository.save_progress.assert_called_once_with(
+            "user@example.com", "101"
+        )
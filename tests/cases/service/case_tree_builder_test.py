@@ -0,0 +1,141 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import text
+
+from src.answer.repository.answer_repository import AnswerRepository
+from src.cases.model.clinical_data.person.measurement import Measurement
+from src.cases.model.clinical_data.person.observation import Observation
+from src.cases.repository.concept_repository import ConceptRepository
+from src.cases.repository.drug_exposure_repository import DrugExposureRepository
+from src.cases.repository.measurement_repository import MeasurementRepository
+from src.cases.repository.observation_repository import ObservationRepository
+from src.cases.repository.person_repository import PersonRepository
+from src.cases.repository.visit_occurrence_repository import VisitOccurrenceRepository
+from src.cases.service.case_service import CaseService
+from src.cases.service.case_tree_builder import (
+    build_case_trees,
+    build_case_trees_in_processes,
+    chunked,
+)
+from src.common.model.system_config import SystemConfig
+from src.common.repository.system_config_repository import SystemConfigRepository
+from src.user.repository.display_config_repository import DisplayConfigRepository
+from tests.cases.case_fixture import (
+    concept_fixture,
+    person_fixture,
+    visit_occurrence_fixture,
+)
+
+CASES = 7
+# keeps committed ids clear of rows other tests use
+BASE = 2_100_000
+PAGE_CONFIG = {
+    "BACKGROUND": {"Family History": [BASE + 1]},
+    "PATIENT COMPLAINT": {"Chief Complaint": [38000282]},
+    "PHYSICAL EXAMINATION": {"Vital Signs": [BASE + 2]},
+}
+
+
+def case_service_of(session):
+    return CaseService(
+        visit_occurrence_repository=VisitOccurrenceRepository(session),
+        concept_repository=ConceptRepository(session),
+        measurement_repository=MeasurementRepository(session),
+        observation_repository=ObservationRepository(session),
+        person_repository=PersonRepository(session),
+        drug_exposure_repository=DrugExposureRepository(session),
+        configuration_repository=DisplayConfigRepository(session),
+        system_config_repository=SystemConfigRepository(session),
+        diagnose_repository=AnswerRepository(session),
+    )
+
+
+@pytest.fixture
+def committed_cohort(session):
+    """
+    CASES cases with a few rows each, committed so worker processes (with
+    connections of their own) see them.
+    """
+    session.execute(text("SET LOCAL session_replication_role = replica"))
+    session.add(SystemConfig(id="page_config", json_config=PAGE_CONFIG))
+    session.add(concept_fixture(BASE, "gender"))
+    session.add(concept_fixture(BASE + 1, "family history"))
+    session.add(concept_fixture(BASE + 2, "pulse"))
+    for i in range(CASES):
+        case_id = BASE + 10 + i
+        session.add(person_fixture(person_id=case_id, gender_concept_id=BASE))
+        session.add(visit_occurrence_fixture(case_id, case_id))
+        for j in range(i % 3 + 1):
+            session.add(
+                Observation(
+                    observation_id=case_id * 10 + j,
+                    person_id=case_id,
+                    observation_concept_id=BASE + 1,
+                    observation_date=date(2024, 1, 1),
+                    observation_type_concept_id=38000282,
+                    value_as_string=f"case {i} note {j}",
+                    visit_occurrence_id=case_id,
+                )
+            )
+        session.add(
+            Measurement(
+                measurement_id=case_id,
+                person_id=case_id,
+                measurement_concept_id=BASE + 2,
+                measurement_date=date(2024, 1, 1),
+                measurement_type_concept_id=0,
+                value_as_number=60 + i,
+                visit_occurrence_id=case_id,
+            )
+        )
+    session.commit()
+
+    yield [BASE + 10 + i for i in range(CASES)]
+
+    session.rollback()
+    for table, column in (
+        ("observation", "observation_id"),
+        ("measurement", "measurement_id"),
+        ("visit_occurrence", "visit_occurrence_id"),
+        ("person", "person_id"),
+        ("concept", "concept_id"),
+    ):
+        session.execute(text(f"DELETE FROM {table} WHERE {column} >= {BASE}"))
+    session.execute(text("DELETE FROM system_config WHERE id = 'page_config'"))
+    session.commit()
+
+
+def test_cut_ids_into_chunks():
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(chunked([], 2)) == []
+
+
+def test_build_one_tree_per_case_in_chunks(committed_cohort, session, mocker):
+    # Given
+    case_service = case_service_of(session)
+    load = mocker.spy(case_service, "load_case_rows_batch")
+    case_ids = [*reversed(committed_cohort), 404, committed_cohort[0]]
+
+    # When
+    built = list(build_case_trees(case_service, case_ids, chunk_size=3))
+
+    # Then
+    assert [case_id for case_id, _, _ in built] == list(reversed(committed_cohort))
+    for case_id, person_name, tree in built:
+        assert person_name == "sunwukong"
+        assert tree == [
+            node.to_dict() for node in case_service.get_case_detail(case_id)
+        ]
+    assert load.call_count == 3
+
+
+def test_build_trees_in_worker_processes(app, committed_cohort, session):
+    expected = list(build_case_trees(case_service_of(session), committed_cohort))
+    session.rollback()
+
+    built = list(
+        build_case_trees_in_processes(app, committed_cohort, workers=2, chunk_size=3)
+    )
+
+    assert built == expected
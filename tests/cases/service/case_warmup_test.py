@@ -0,0 +1,100 @@
+import pytest
+from sqlalchemy import text
+
+from src.cases.repository.case_tree_cache_repository import CaseTreeCacheRepository
+from src.cases.service.case_service import page_config_hash
+from src.cases.service.case_warmup import warm_case_caches
+from src.user.model.display_config import DisplayConfig
+from src.user.utils.path_trie import PATH_TRIE_VERSION
+from tests.cases.service.case_tree_builder_test import (  # noqa: F401
+    PAGE_CONFIG,
+    case_service_of,
+    committed_cohort,
+)
+
+PATH_CONFIG = [{"path": "BACKGROUND.Family History"}]
+
+
+@pytest.fixture
+def assigned_cohort(committed_cohort, session):  # noqa: F811
+    """Two configs per committed case plus one for a case without a visit."""
+    session.query(DisplayConfig).delete()
+    for case_id in committed_cohort:
+        for user in ("a", "b"):
+            session.add(
+                DisplayConfig(
+                    f"{user}@warmup.test", case_id, PATH_CONFIG, id=f"warm-{user}-{case_id}"
+                )
+            )
+    session.add(DisplayConfig("a@warmup.test", 404, PATH_CONFIG, id="warm-a-404"))
+    session.commit()
+
+    yield committed_cohort
+
+    session.rollback()
+    session.query(DisplayConfig).delete()
+    session.execute(text("DELETE FROM case_tree_cache"))
+    session.commit()
+
+
+def test_warm_stores_every_tree_and_checks_every_review(app, assigned_cohort, session):
+    # Given
+    case_service = case_service_of(session)
+    repository = CaseTreeCacheRepository(session)
+    phases = []
+
+    # When
+    progress = warm_case_caches(
+        app,
+        case_service,
+        repository,
+        session,
+        chunk_size=3,
+        report=lambda phase, _: phases.append(phase),
+    )
+
+    # Then
+    config_hash = page_config_hash(PAGE_CONFIG)
+    assert repository.get_cached_case_ids(assigned_cohort, config_hash) == set(
+        assigned_cohort
+    )
+    assert progress.cases == len(assigned_cohort) + 1
+    assert progress.configurations == 2 * len(assigned_cohort) + 1
+    assert progress.trees_built == len(assigned_cohort)
+    assert progress.reviews_checked == 2 * len(assigned_cohort)
+    assert progress.failed_configurations == ["warm-a-404"]
+    assert phases == ["trees"] * 3 + ["checks"] * 3
+    stored = session.get(DisplayConfig, f"warm-a-{assigned_cohort[0]}")
+    assert stored.path_trie["version"] == PATH_TRIE_VERSION
+
+
+def test_warm_skips_stored_trees_unless_forced(app, assigned_cohort, session, mocker):
+    # Given
+    repository = CaseTreeCacheRepository(session)
+    warm_case_caches(app, case_service_of(session), repository, session)
+    case_service = case_service_of(session)
+    load = mocker.spy(case_service, "load_case_rows_batch")
+
+    # When
+    again = warm_case_caches(app, case_service, repository, session)
+    forced = warm_case_caches(app, case_service, repository, session, force=True)
+
+    # Then
+    assert again.trees_cached == len(assigned_cohort)
+    assert again.trees_built == 0
+    assert forced.trees_built == len(assigned_cohort)
+    # per run: one build chunk (only the case without a visit when not forced)
+    # and one more attempt at that case while reviewing
+    assert load.call_count == 4
+
+
+def test_warm_command_reports_progress(app, assigned_cohort):
+    result = app.test_cli_runner().invoke(
+        args=["cases", "warm", "--workers", "0", "--chunk-size", "4"]
+    )
+
+    assert result.exit_code == 1
+    assert "trees 4/8" in result.output
+    assert "reviews checked 15/15" in result.output
+    assert f"8 cases: {len(assigned_cohort)} trees built" in result.output
+    assert "1 reviews failed: warm-a-404" in result.output
@@ -0,0 +1,55 @@
+from src.cases.repository.concept_repository import ConceptRepository
+from src.cases.service.concept_hierarchy import ConceptHierarchy, load_child_concepts
+
+PAGE_CONFIG = {
+    "BACKGROUND": {"Family History": [4167217]},
+    "PHYSICAL EXAMINATION": {"Vital Signs": [1, 2], "Abdominal": [3]},
+}
+
+
+def test_load_child_concepts_keeps_duplicate_relationships(mocker):
+    repository = mocker.Mock(ConceptRepository)
+    repository.get_concept_relationships.return_value = [(1, 10), (1, 10), (2, 20)]
+
+    children = load_child_concepts([1, 2, 1], repository)
+
+    assert children == {1: [10, 10], 2: [20]}
+    repository.get_concept_relationships.assert_called_once_with(
+        {1, 2}, ["Subsumes", "Is characterized by"]
+    )
+
+
+def test_load_child_concepts_skips_query_without_parents(mocker):
+    repository = mocker.Mock(ConceptRepository)
+
+    assert load_child_concepts([], repository) == {}
+    repository.get_concept_relationships.assert_not_called()
+
+
+def test_get_children_of_measurement_sections_once_per_config(mocker):
+    repository = mocker.Mock(ConceptRepository)
+    repository.get_concept_relationships.return_value = [(1, 10), (3, 30)]
+    hierarchy = ConceptHierarchy()
+
+    first = hierarchy.get_children("hash", PAGE_CONFIG, repository)
+    second = hierarchy.get_children("hash", PAGE_CONFIG, repository)
+
+    assert first == {1: [10], 3: [30]}
+    assert second is first
+    repository.get_concept_relationships.assert_called_once_with(
+        {1, 2, 3}, ["Subsumes", "Is characterized by"]
+    )
+
+
+def test_get_children_rebuilds_for_new_config(mocker):
+    repository = mocker.Mock(ConceptRepository)
+    repository.get_concept_relationships.side_effect = [[(1, 10)], [(4, 40)]]
+    hierarchy = ConceptHierarchy()
+    hierarchy.get_children("old", PAGE_CONFIG, repository)
+
+    children = hierarchy.get_children(
+        "new", {"PHYSICAL EXAMINATION": {"Abdominal": [4]}}, repository
+    )
+
+    assert children == {4: [40]}
+    assert repository.get_concept_relationships.call_count == 2
@@ -0,0 +1,67 @@
+from src.cases.repository.concept_repository import ConceptRepository
+from src.cases.service.concept_name_cache import (
+    ConceptNameCache,
+    collect_concept_ids,
+    concept_ids_of_rows,
+)
+from tests.cases.case_fixture import concept_fixture, observation_fixture
+
+
+def test_collect_concept_ids_from_nested_page_config():
+    page_config = {
+        "BACKGROUND": {
+            "Family History": [4167217],
+            "Social History": {"Smoke": [4041306], "Sexual behavior": [1, 2]},
+            "Single": 3,
+        },
+        "PHYSICAL EXAMINATION": {"Abdominal": [4152368]},
+    }
+
+    assert collect_concept_ids(page_config) == {4167217, 4041306, 1, 2, 3, 4152368}
+
+
+def test_concept_ids_of_rows_skips_empty_fields():
+    rows = [
+        observation_fixture(concept_id=10, unit_concept_id=11),
+        observation_fixture(concept_id=12),
+    ]
+
+    ids = concept_ids_of_rows(rows, "observation_concept_id", "unit_concept_id")
+
+    assert ids == {10, 11, 12}
+
+
+def test_get_name_loads_once(mocker):
+    repository = mocker.Mock(ConceptRepository)
+    repository.get_concept.return_value = concept_fixture(1, "Gender")
+    cache = ConceptNameCache(10)
+
+    assert cache.get_name(1, repository) == "Gender"
+    assert cache.get_name(1, repository) == "Gender"
+
+    repository.get_concept.assert_called_once_with(1)
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_prefetch_only_queries_missing_ids(mocker):
+    repository = mocker.Mock(ConceptRepository)
+    repository.get_concept_names.return_value = {2: "two", 3: "three"}
+    cache = ConceptNameCache(10)
+    cache.put(1, "one")
+
+    cache.prefetch([1, 2, 3, None, 0], repository)
+
+    repository.get_concept_names.assert_called_once_with({2, 3})
+    assert cache.get_name(3, repository) == "three"
+    repository.get_concept.assert_not_called()
+
+
+def test_prefetch_skips_query_when_all_cached(mocker):
+    repository = mocker.Mock(ConceptRepository)
+    cache = ConceptNameCache(10)
+    cache.put(1, "one")
+
+    cache.prefetch([1], repository)
+
+    repository.get_concept_names.assert_not_called()
@@ -0,0 +1,97 @@
+import pytest
+
+from src.cases.controller.response.case_json import dumps_case_json
+from src.cases.model.case import Case, FrozenTreeNode, TreeNode, TreeNodeView
+from src.cases.service.case_pruning import prune_case_tree
+from src.cases.service.review_overlay import (
+    NodeOverlay,
+    apply_overlay,
+    overlay_of,
+)
+from src.user.utils.path_trie import compile_path_config
+from tests.cases.service.case_pruning_test import case_tree
+
+
+def review_of(base, path_config) -> Case:
+    details, important_infos = prune_case_tree(base, compile_path_config(path_config))
+    return Case(
+        "patient",
+        "7",
+        details,
+        [TreeNode(info["key"], info["values"]) for info in important_infos]
+        + [TreeNode("AI CRC Risk Score", ["Predicted Colorectal Cancer Score: 3"])],
+    )
+
+
+def base_nodes_of(value):
+    if isinstance(value, FrozenTreeNode):
+        yield value
+    elif isinstance(value, NodeOverlay):
+        yield from base_nodes_of(value.values)
+    elif isinstance(value, tuple):
+        for item in value:
+            yield from base_nodes_of(item)
+
+
+class TestReviewOverlay:
+    @pytest.mark.parametrize(
+        "path_config",
+        [
+            None,
+            [{"path": "BACKGROUND.Family History.Diabetes", "style": {"top": 1}}],
+            [
+                {"path": "BACKGROUND.Family History.Cancer", "style": {"collapse": True}},
+                {"path": "PHYSICAL EXAMINATION.BMI (body mass index) centile"},
+            ],
+        ],
+    )
+    def test_apply_overlay_rebuilds_the_review(self, path_config):
+        # Given
+        base = case_tree()
+        review = review_of(base, path_config)
+
+        # When
+        overlay = overlay_of(review, base)
+        applied = apply_overlay(overlay, "patient", 7, base)
+
+        # Then
+        assert applied == review
+        assert dumps_case_json(applied) == dumps_case_json(review)
+
+    def test_overlay_refers_to_the_base_tree_by_position_only(self):
+        # Given
+        base = case_tree()
+        review = review_of(
+            base, [{"path": "BACKGROUND.Family History.Diabetes", "style": {"top": 1}}]
+        )
+
+        # When
+        overlay = overlay_of(review, base)
+
+        # Then
+        background, complaint, examination = overlay.details
+        assert complaint == 1
+        assert background.values == (
+            0,
+            # leaves kept as built: a bit mask of their positions
+            NodeOverlay(1, "Family History", {"top": 1}, 0b10),
+            NodeOverlay(2, "Medical History", None, 0),
+        )
+        assert list(base_nodes_of(overlay.details)) == []
+        assert overlay.important_infos[0] == TreeNode("Family History", ["Diabetes"])
+
+    def test_apply_overlay_shares_kept_base_nodes(self):
+        base = case_tree()
+        review = review_of(base, None)
+
+        applied = apply_overlay(overlay_of(review, base), "patient", 7, base)
+
+        assert applied.details[1] is base[1]
+        assert isinstance(applied.details[0], TreeNodeView)
+        assert applied.details[0].values[0] is base[0].values[0]
+
+    def test_reject_review_of_another_tree(self):
+        review = review_of(case_tree(), None)
+
+        with pytest.raises(ValueError):
+            overlay_of(review, case_tree())
@@ -0,0 +1,61 @@
+import pytest
+
+from src.common.cache.lru_cache import LruCache
+
+
+def test_get_returns_default_and_counts_miss():
+    cache = LruCache(2)
+
+    assert cache.get("a") is None
+    assert cache.get("a", "default") == "default"
+    assert cache.stats()["misses"] == 2
+
+
+def test_get_counts_hit():
+    cache = LruCache(2)
+    cache.put("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["hit_ratio"] == 1.0
+
+
+def test_evicts_least_recently_used():
+    cache = LruCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+
+    cache.put("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert len(cache) == 2
+    assert cache.stats()["evictions"] == 1
+
+
+def test_put_many_respects_bound():
+    cache = LruCache(2)
+
+    cache.put_many({"a": 1, "b": 2, "c": 3})
+
+    assert len(cache) == 2
+    assert cache.missing(["a", "b", "c"]) == {"a"}
+
+
+def test_pop_and_clear():
+    cache = LruCache(2)
+    cache.put_many({"a": 1, "b": 2})
+
+    assert cache.pop("a") == 1
+    assert cache.pop("a") is None
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.stats()["hit_ratio"] == 0.0
+
+
+def test_rejects_non_positive_size():
+    with pytest.raises(ValueError):
+        LruCache(0)
@@ -0,0 +1,65 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.common.cache.singleflight import Singleflight
+
+CALLERS = 8
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def test_concurrent_calls_share_one_run():
+    flight = Singleflight()
+    release = threading.Event()
+    runs = []
+
+    def build():
+        runs.append(1)
+        release.wait()
+        return object()
+
+    with ThreadPoolExecutor(CALLERS) as pool:
+        futures = [pool.submit(flight.do, "key", build) for _ in range(CALLERS)]
+        wait_until(lambda: flight.coalesced == CALLERS - 1)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(runs) == 1
+    assert all(result is results[0] for result in results)
+    assert flight.in_flight() == 0
+
+
+def test_waiters_get_the_exception():
+    flight = Singleflight()
+    release = threading.Event()
+
+    def fail():
+        release.wait()
+        raise ValueError("build failed")
+
+    with ThreadPoolExecutor(2) as pool:
+        futures = [pool.submit(flight.do, "key", fail) for _ in range(2)]
+        wait_until(lambda: flight.coalesced == 1)
+        release.set()
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result()
+
+    assert flight.in_flight() == 0
+
+
+def test_run_again_once_finished_and_per_key():
+    flight = Singleflight()
+
+    assert flight.do("a", lambda: 1) == 1
+    assert flight.do("a", lambda: 2) == 2
+    assert flight.do("b", lambda: 3) == 3
+    assert flight.coalesced == 0
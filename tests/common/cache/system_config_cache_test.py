@@ -0,0 +1,72 @@
+import pytest
+
+from src.common.cache.system_config_cache import SystemConfigCache
+from src.common.model.system_config import SystemConfig
+from src.common.repository.system_config_repository import SystemConfigRepository
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def page_config(session):
+    config = SystemConfig(id="page_config", json_config={"BACKGROUND": {"Age": [1]}})
+    session.add(config)
+    session.flush()
+    return config
+
+
+def test_serve_parsed_config_between_checks(session, page_config, mocker):
+    # Given
+    repository = SystemConfigRepository(session)
+    clock = FakeClock()
+    cache = SystemConfigCache("page_config", dict, check_interval=30, clock=clock)
+    get_stamp = mocker.spy(repository, "get_config_stamp")
+
+    # When
+    first = cache.get(repository)
+    clock.now = 29
+    second = cache.get(repository)
+
+    # Then
+    assert first == {"BACKGROUND": {"Age": [1]}}
+    assert second is first
+    assert cache.peek() is first
+    assert cache.loads == 1
+    get_stamp.assert_not_called()
+
+
+def test_reload_only_when_stamp_changed(session, page_config):
+    # Given
+    repository = SystemConfigRepository(session)
+    clock = FakeClock()
+    cache = SystemConfigCache("page_config", dict, check_interval=30, clock=clock)
+    first = cache.get(repository)
+
+    # When
+    clock.now = 30
+    unchanged = cache.get(repository)
+    page_config.json_config = {"BACKGROUND": {"Age": [2]}}
+    session.flush()
+    clock.now = 45
+    before_next_check = cache.get(repository)
+    clock.now = 60
+    changed = cache.get(repository)
+
+    # Then
+    assert unchanged is first
+    assert before_next_check is first
+    assert changed == {"BACKGROUND": {"Age": [2]}}
+    assert cache.loads == 2
+
+
+def test_missing_config(session):
+    cache = SystemConfigCache("missing", dict)
+
+    with pytest.raises(LookupError):
+        cache.get(SystemConfigRepository(session))
@@ -17,3 +17,16 @@ def test_clean_configurations(session, system_config_repository):
     found = system_config_repository.get_config_by_id(config.id)
 
     assert found == config
+
+
+def test_get_config_with_stamp(session, system_config_repository):
+    session.add(SystemConfig(id="page_config", json_config={"a": [1]}))
+    session.flush()
+
+    json_config, stamp = system_config_repository.get_config_with_stamp("page_config")
+
+    assert json_config == {"a": [1]}
+    assert len(stamp) == 32
+    assert system_config_repository.get_config_stamp("page_config") == stamp
+    assert system_config_repository.get_config_with_stamp("missing") is None
+    assert system_config_repository.get_config_stamp("missing") is None
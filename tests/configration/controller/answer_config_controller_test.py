@@ -98,3 +98,43 @@ def test_get_latest_answer_config_failed_by_no_answer_config(
             "message": "No answer config available. Please configure it first.",
         },
     } == response.json
+
+
+def test_answer_unchanged_answer_config_with_not_modified(client, mocker, test_config):
+    answer_config = AnswerConfig(
+        id=uuid.uuid4(), config=test_config, created_timestamp=datetime(2024, 1, 1)
+    )
+    mocker.patch(
+        "src.configration.service.answer_config_service.AnswerConfigurationService.get_latest_answer_config",
+        return_value=answer_config,
+    )
+
+    first = client.get("/api/config/answer")
+    by_etag = client.get(
+        "/api/config/answer", headers={"If-None-Match": first.headers["ETag"]}
+    )
+    by_date = client.get(
+        "/api/config/answer",
+        headers={"If-Modified-Since": first.headers["Last-Modified"]},
+    )
+
+    assert first.status_code == 200
+    assert "no-cache" in first.headers["Cache-Control"]
+    assert by_etag.status_code == 304
+    assert by_etag.data == b""
+    assert by_etag.headers["ETag"] == first.headers["ETag"]
+    assert by_date.status_code == 304
+
+
+def test_send_new_answer_config_when_etag_is_stale(client, mocker, test_config):
+    mocker.patch(
+        "src.configration.service.answer_config_service.AnswerConfigurationService.get_latest_answer_config",
+        return_value=AnswerConfig(
+            id=uuid.uuid4(), config=test_config, created_timestamp=datetime.now()
+        ),
+    )
+
+    response = client.get("/api/config/answer", headers={"If-None-Match": '"stale"'})
+
+    assert response.status_code == 200
+    assert response.json["data"]["config"] == test_config
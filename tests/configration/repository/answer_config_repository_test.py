@@ -1,5 +1,6 @@
 import uuid
 import pytest
+from sqlalchemy import select
 
 from src.configration.model.answer_config import AnswerConfig
 from src.configration.repository.answer_config_repository import (
@@ -53,3 +54,31 @@ def test_get_answer_config(answer_config_repository):
     )
     answer_config_repository.add_answer_config(config)
     assert answer_config_repository.get_answer_config(config.id) is not None
+
+
+def test_after_commit(answer_config_repository, session, mocker):
+    callback = mocker.Mock()
+    answer_config_repository.after_commit(callback)
+
+    session.execute(select(1))
+    session.flush()
+    callback.assert_not_called()
+
+    session.commit()
+    callback.assert_called_once_with()
+    session.execute(select(1))
+    session.commit()
+    callback.assert_called_once_with()
+
+
+def test_query_latest_answer_config_id(answer_config_repository):
+    assert answer_config_repository.query_latest_answer_config_id() is None
+
+    answer_config_repository.add_answer_config(
+        AnswerConfig(config={"type": "Text", "title": "first add"})
+    )
+    latest = answer_config_repository.add_answer_config(
+        AnswerConfig(config={"type": "Paragraph", "title": "second add"})
+    )
+
+    assert answer_config_repository.query_latest_answer_config_id() == latest.id
@@ -0,0 +1,94 @@
+import pytest
+
+from src.configration.model.answer_config import AnswerConfig
+from src.configration.repository.answer_config_repository import (
+    AnswerConfigurationRepository,
+)
+from src.configration.service.answer_config_cache import (
+    AnswerConfigCache,
+    CachedAnswerConfig,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def answer_config_repository(session):
+    return AnswerConfigurationRepository(session)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def add_config(repository, title):
+    return repository.add_answer_config(
+        AnswerConfig(config=[{"type": "Text", "title": title}])
+    )
+
+
+def test_get_reads_each_row_once(answer_config_repository, mocker):
+    # Given
+    answer_config = add_config(answer_config_repository, "first")
+    cache = AnswerConfigCache()
+    spy = mocker.spy(answer_config_repository, "get_answer_config")
+
+    # When
+    first = cache.get(answer_config.id, answer_config_repository)
+    second = cache.get(str(answer_config.id), answer_config_repository)
+
+    # Then
+    assert first == CachedAnswerConfig.of(answer_config)
+    assert second is first
+    assert first.to_dict() == answer_config.to_dict()
+    assert spy.call_count == 1
+
+
+def test_get_missing_config_is_not_cached(answer_config_repository):
+    cache = AnswerConfigCache()
+    missing_id = "00000000-0000-0000-0000-000000000000"
+
+    assert cache.get(missing_id, answer_config_repository) is None
+    assert len(cache.rows) == 0
+
+
+def test_get_latest_checks_at_most_every_interval(
+    answer_config_repository, clock, mocker
+):
+    # Given
+    first = add_config(answer_config_repository, "first")
+    cache = AnswerConfigCache(check_interval=10, clock=clock)
+    spy = mocker.spy(answer_config_repository, "query_latest_answer_config_id")
+    assert cache.get_latest(answer_config_repository).id == first.id
+
+    # When
+    second = add_config(answer_config_repository, "second")
+    clock.now = 9.0
+    before_check = cache.get_latest(answer_config_repository)
+    clock.now = 10.0
+    after_check = cache.get_latest(answer_config_repository)
+
+    # Then
+    assert before_check.id == first.id
+    assert after_check.id == second.id
+    assert spy.call_count == 2
+
+
+def test_invalidate_latest_rechecks_on_next_lookup(answer_config_repository, clock):
+    # Given
+    cache = AnswerConfigCache(check_interval=10, clock=clock)
+    assert cache.get_latest(answer_config_repository) is None
+
+    # When
+    answer_config = add_config(answer_config_repository, "first")
+    cache.invalidate_latest()
+
+    # Then
+    assert cache.get_latest(answer_config_repository).id == answer_config.id
@@ -2,10 +2,15 @@ from datetime import datetime
 import uuid
 import pytest
 
+from src.common.exception.BusinessException import BusinessException
 from src.configration.model.answer_config import AnswerConfig
 from src.configration.repository.answer_config_repository import (
     AnswerConfigurationRepository,
 )
+from src.configration.service.answer_config_cache import (
+    AnswerConfigCache,
+    CachedAnswerConfig,
+)
 from src.configration.service.answer_config_service import AnswerConfigurationService
 
 
@@ -51,3 +56,34 @@ def test_get_latest_answer_config_success(
     ret = answer_configuration_service.get_latest_answer_config()
 
     assert ret == fake_answer_config
+
+
+def test_add_new_answer_config_invalidates_cached_latest_after_commit(
+    mock_answer_config_repo, fake_answer_config, test_config
+):
+    # Given
+    cache = AnswerConfigCache(check_interval=60, clock=lambda: 0.0)
+    mock_answer_config_repo.query_latest_answer_config_id.return_value = None
+    answer_configuration_service = AnswerConfigurationService(
+        mock_answer_config_repo, cache
+    )
+    with pytest.raises(BusinessException):
+        answer_configuration_service.get_latest_answer_config()
+
+    # When
+    mock_answer_config_repo.add_answer_config.return_value = fake_answer_config
+    mock_answer_config_repo.query_latest_answer_config_id.return_value = (
+        fake_answer_config.id
+    )
+    mock_answer_config_repo.get_answer_config.return_value = fake_answer_config
+    answer_configuration_service.add_new_answer_config(test_config)
+
+    # Then
+    # uncommitted, the new config is not the latest one yet
+    with pytest.raises(BusinessException):
+        answer_configuration_service.get_latest_answer_config()
+    (on_commit,) = mock_answer_config_repo.after_commit.call_args.args
+    on_commit()
+    ret = answer_configuration_service.get_latest_answer_config()
+    assert ret == CachedAnswerConfig.of(fake_answer_config)
+    mock_answer_config_repo.query_latest_answer_config.assert_not_called()
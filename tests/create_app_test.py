@@ -0,0 +1,96 @@
+import pytest
+from sqlalchemy import text
+
+from src import config, create_app, db
+
+CASE_ID = 990_001
+CONFIG_ID = "entrypoint-1"
+USER_EMAIL = "entrypoint@test.com"
+
+COMMITTED_ROWS = [
+    f"DELETE FROM case_tree_cache WHERE case_id = {CASE_ID}",
+    f"DELETE FROM display_config WHERE id = '{CONFIG_ID}'",
+    "DELETE FROM system_config WHERE id = 'page_config'",
+    f"DELETE FROM visit_occurrence WHERE visit_occurrence_id = {CASE_ID}",
+    f"DELETE FROM person WHERE person_id = {CASE_ID}",
+    f"DELETE FROM concept WHERE concept_id = {CASE_ID}",
+]
+
+
+@pytest.fixture
+def served_app(app, monkeypatch):
+    # as entrypoint.sh starts gunicorn: "src:create_app()" with src.config.Config
+    monkeypatch.setattr(
+        config.Config, "SQLALCHEMY_DATABASE_URI", app.config["SQLALCHEMY_DATABASE_URI"]
+    )
+    monkeypatch.setattr(config.Config, "JWT_SECRET_KEY", "super-secret-key")
+    served_app = create_app()
+
+    with served_app.app_context():
+        db.session.execute(text("SET LOCAL session_replication_role = replica"))
+        db.session.execute(
+            text(
+                f"""INSERT INTO person (person_id, gender_concept_id, year_of_birth,
+                       race_concept_id, ethnicity_concept_id)
+                   VALUES ({CASE_ID}, {CASE_ID}, 1980, {CASE_ID}, 4)"""
+            )
+        )
+        db.session.execute(
+            text(
+                f"""INSERT INTO concept (concept_id, concept_name, domain_id,
+                       vocabulary_id, concept_class_id, concept_code,
+                       valid_start_date, valid_end_date)
+                   VALUES ({CASE_ID}, 'entrypoint', '1', '1', '1', 'code',
+                       DATE '2024-01-01', DATE '2099-01-01')"""
+            )
+        )
+        db.session.execute(
+            text(
+                f"""INSERT INTO visit_occurrence (visit_occurrence_id, person_id,
+                       visit_concept_id, visit_start_date, visit_end_date,
+                       visit_type_concept_id)
+                   VALUES ({CASE_ID}, {CASE_ID}, 10, DATE '2024-01-01',
+                       DATE '2024-01-01', 11)"""
+            )
+        )
+        db.session.execute(
+            text(
+                f"""INSERT INTO display_config (id, user_email, case_id)
+                   VALUES ('{CONFIG_ID}', '{USER_EMAIL}', {CASE_ID})"""
+            )
+        )
+        db.session.execute(
+            text(
+                """INSERT INTO system_config (id, json_config)
+                   VALUES ('page_config',
+                       '{"BACKGROUND": {"Family History": [4167217]}}')"""
+            )
+        )
+        db.session.commit()
+
+    yield served_app
+
+    with served_app.app_context():
+        for statement in COMMITTED_ROWS:
+            db.session.execute(text(statement))
+        db.session.commit()
+        db.session.remove()
+
+
+def test_served_app_commits_case_tree_built_on_a_miss(served_app, mocker):
+    mocker.patch(
+        "src.user.utils.auth_utils.validate_jwt_and_refresh", return_value=None
+    )
+    mocker.patch(
+        "src.cases.service.case_service.get_user_email_from_jwt",
+        return_value=USER_EMAIL,
+    )
+
+    response = served_app.test_client().get(f"/api/case-reviews/{CONFIG_ID}")
+
+    assert response.status_code == 200
+    with db.engine.connect() as connection:
+        stored = connection.execute(
+            text(f"SELECT count(*) FROM case_tree_cache WHERE case_id = {CASE_ID}")
+        ).scalar()
+    assert stored == 1
@@ -2,6 +2,8 @@ import json
 
 import pytest
 
+from src.user.utils.path_trie import compile_path_config
+
 VALID_API_KEY = "test-export-key"
 
 
@@ -246,6 +248,25 @@ def test_batch_create_configs(client, mocker, auth_headers):
     assert response.status_code == 201
 
 
+def test_batch_create_configs_compiles_path_trie(client, mocker, auth_headers):
+    db = mocker.patch("src.experiment.controller.experiment_controller.db")
+    path_config = [{"path": "BACKGROUND.Medical History.Diabetes: Yes", "style": {"top": 1}}]
+
+    response = client.post(
+        "/api/v1/configs/batch",
+        headers=auth_headers,
+        data=json.dumps({
+            "configs": [
+                {"user_email": "test@example.com", "case_id": 101, "path_config": path_config}
+            ]
+        }),
+    )
+
+    assert response.status_code == 201
+    saved = db.session.add.call_args.args[0]
+    assert saved.path_trie == compile_path_config(path_config)
+
+
 def test_batch_create_configs_missing_configs(client, auth_headers):
     response = client.post(
         "/api/v1/configs/batch",
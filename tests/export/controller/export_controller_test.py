@@ -1,5 +1,6 @@
 import json
 import os
+from datetime import datetime
 
 import pytest
 
@@ -215,3 +216,64 @@ def test_export_participants(client, mocker, auth_headers):
     assert response.status_code == 200
     data = json.loads(response.data)
     assert data["data"][0]["cases_completed"] == 50
+
+
+def test_export_answers_with_cursor(client, mocker, auth_headers, mock_answer_data):
+    export = mocker.patch(
+        "src.export.service.export_service.ExportService.export_answers",
+        return_value=mock_answer_data,
+    )
+
+    response = client.get(
+        "/api/v1/export/answers?limit=50&cursor=abc",
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    export.assert_called_once_with(limit=50, offset=0, since=None, cursor="abc")
+
+
+def test_export_answers_rejects_invalid_cursor(client, auth_headers):
+    response = client.get(
+        "/api/v1/export/answers?cursor=abc",
+        headers=auth_headers,
+    )
+    assert response.status_code == 400
+
+
+# --- Streaming ---
+
+
+def test_export_answers_stream_csv(client, mocker, auth_headers, mock_answer_data):
+    stream = mocker.patch(
+        "src.export.service.export_service.ExportService.stream_answers",
+        return_value=iter(mock_answer_data["data"]),
+    )
+
+    response = client.get(
+        "/api/v1/export/answers?stream=true&since=2024-01-01T00:00:00",
+        headers={**auth_headers, "Accept": "text/csv"},
+    )
+
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.content_type == "text/csv; charset=utf-8"
+    assert response.data.decode().startswith("answer_id,case_id,user_email")
+    stream.assert_called_once_with(since=datetime(2024, 1, 1))
+
+
+def test_export_participants_stream_ndjson(client, mocker, auth_headers):
+    rows = [{"user_id": 1, "cases_completed": 5}, {"user_id": 2, "cases_completed": 0}]
+    mocker.patch(
+        "src.export.service.export_service.ExportService.stream_participants",
+        return_value=iter(rows),
+    )
+
+    response = client.get(
+        "/api/v1/export/participants?stream=true",
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.content_type == "application/x-ndjson"
+    lines = response.data.decode().splitlines()
+    assert [json.loads(line) for line in lines] == rows
@@ -0,0 +1,103 @@
+import pytest
+from sqlalchemy import text
+
+from src.answer.model.answer import Answer
+from src.export.repository.export_repository import ExportRepository
+from src.user.model.display_config import DisplayConfig
+
+
+@pytest.fixture
+def export_repository(session):
+    # other tests commit answers; start this transaction from empty tables
+    session.execute(text("DELETE FROM answer"))
+    session.query(DisplayConfig).delete()
+    return ExportRepository(session)
+
+
+def all_pages(get_page, key, limit):
+    rows, after = [], None
+    while True:
+        page = get_page(limit=limit, after=after)
+        rows += page
+        if len(page) < limit:
+            return rows
+        after = [page[-1][column.field] for column in key]
+
+
+def test_answer_pages_after_cursor_match_offset_pages(export_repository, session):
+    # Given
+    for case_id, user_email in enumerate(
+        ["b@test.com", "a@test.com", "b@test.com", None, "b@test.com", "a@test.com"]
+    ):
+        session.add(Answer(task_id=str(case_id), case_id=case_id, user_email=user_email))
+    session.flush()
+
+    # When
+    by_cursor = all_pages(
+        export_repository.get_answers, ExportRepository.ANSWER_KEY, limit=2
+    )
+    by_offset = export_repository.get_answers(limit=100)
+
+    # Then
+    assert by_cursor == by_offset
+    assert [(row["user_email"], row["order_id"]) for row in by_cursor] == [
+        ("a@test.com", 1),
+        ("a@test.com", 2),
+        ("b@test.com", 1),
+        ("b@test.com", 2),
+        ("b@test.com", 3),
+        (None, 1),
+    ]
+
+
+def test_display_config_pages_cover_null_keys(export_repository, session):
+    for index, (user_email, case_id) in enumerate(
+        [("a@test.com", 2), ("a@test.com", None), (None, 1), ("a@test.com", 2)]
+    ):
+        session.add(DisplayConfig(user_email, case_id, id=f"export-{index}"))
+    session.flush()
+
+    by_cursor = all_pages(
+        export_repository.get_display_configs,
+        ExportRepository.DISPLAY_CONFIG_KEY,
+        limit=1,
+    )
+
+    assert [row["config_id"] for row in by_cursor] == [
+        "export-0",
+        "export-3",
+        "export-1",
+        "export-2",
+    ]
+
+
+def test_stream_answers_reads_all_pages_through_server_side_cursor(
+    export_repository, session, mocker
+):
+    # Given
+    for case_id, user_email in enumerate(["b@test.com", "a@test.com", "b@test.com"]):
+        session.add(Answer(task_id=str(case_id), case_id=case_id, user_email=user_email))
+    session.flush()
+    execute = mocker.spy(session, "execute")
+
+    # When
+    streamed = export_repository.stream_answers()
+    assert execute.call_count == 0
+    rows = list(streamed)
+
+    # Then
+    assert execute.call_args.kwargs["execution_options"] == {
+        "yield_per": ExportRepository.STREAM_BATCH_SIZE
+    }
+    assert rows == export_repository.get_answers(limit=100)
+
+
+def test_stream_display_configs_returns_every_row(export_repository, session):
+    for index in range(3):
+        session.add(DisplayConfig("a@test.com", index, id=f"export-{index}"))
+    session.flush()
+
+    rows = list(export_repository.stream_display_configs())
+
+    assert rows == export_repository.get_display_configs(limit=100)
+    assert len(rows) == 3
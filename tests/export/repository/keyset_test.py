@@ -0,0 +1,36 @@
+from src.export.repository.keyset import KeyColumn, keyset_page
+
+KEY = (
+    KeyColumn("user_email", "user_email", nullable=True),
+    KeyColumn("id", "answer_id"),
+)
+
+
+def test_page_without_cursor_uses_offset():
+    sql, params = keyset_page("answer", KEY, ["t.created_timestamp >= :since"])
+
+    assert sql == (
+        "SELECT t.user_email, t.id FROM answer t "
+        "WHERE t.created_timestamp >= :since "
+        "ORDER BY user_email, id LIMIT :limit OFFSET :offset"
+    )
+    assert params == {}
+
+
+def test_page_after_cursor_is_a_union_of_ranges():
+    sql, params = keyset_page("answer", KEY, after=["b@test.com", 7])
+
+    assert "OFFSET" not in sql
+    assert sql.count("UNION ALL") == 2
+    assert "WHERE t.user_email > :after_0 ORDER BY" in sql
+    assert "WHERE t.user_email IS NULL ORDER BY" in sql
+    assert "WHERE t.user_email = :after_0 AND t.id > :after_1 ORDER BY" in sql
+    assert params == {"after_0": "b@test.com", "after_1": 7}
+
+
+def test_page_after_null_key_only_reads_the_nulls():
+    sql, params = keyset_page("answer", KEY, after=[None, 7])
+
+    assert "UNION ALL" not in sql
+    assert "WHERE t.user_email IS NULL AND t.id > :after_1 ORDER BY" in sql
+    assert params == {"after_1": 7}
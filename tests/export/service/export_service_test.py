@@ -1,8 +1,15 @@
+import json
 from datetime import datetime
 from unittest.mock import MagicMock
 
 import pytest
 
+from src.export.repository.export_repository import ExportRepository
+from src.export.service.export_cursor import (
+    InvalidCursor,
+    decode_cursor,
+    encode_cursor,
+)
 from src.export.service.export_service import ExportService
 
 
@@ -124,3 +131,96 @@ def test_has_more_true_when_more_data(service, mock_repo):
 
     result = service.export_answers(limit=10, offset=0)
     assert result["pagination"]["has_more"] is True
+
+
+def test_offset_page_returns_cursor_of_its_last_row(service, mock_repo):
+    mock_repo.ANSWER_KEY = ExportRepository.ANSWER_KEY
+    mock_repo.get_answers.return_value = [
+        {"answer_id": 1, "user_email": "a@test.com"},
+        {"answer_id": 9, "user_email": "b@test.com"},
+    ]
+    mock_repo.count_answers.return_value = 5
+
+    result = service.export_answers(limit=2, offset=0)
+
+    assert decode_cursor(result["pagination"]["next_cursor"], 2) == ["b@test.com", 9]
+
+
+def test_cursor_page_reads_after_cursor_without_counting(service, mock_repo):
+    mock_repo.ANSWER_KEY = ExportRepository.ANSWER_KEY
+    mock_repo.get_answers.return_value = [
+        {"answer_id": 10, "user_email": "b@test.com"},
+        {"answer_id": 11, "user_email": "b@test.com"},
+        {"answer_id": 12, "user_email": "c@test.com"},
+    ]
+    since = datetime(2024, 1, 1)
+
+    result = service.export_answers(
+        limit=2, since=since, cursor=encode_cursor(["b@test.com", 9])
+    )
+
+    mock_repo.get_answers.assert_called_once_with(
+        limit=3, since=since, after=["b@test.com", 9]
+    )
+    mock_repo.count_answers.assert_not_called()
+    assert [row["answer_id"] for row in result["data"]] == [10, 11]
+    assert result["pagination"]["total"] is None
+    assert result["pagination"]["has_more"] is True
+    assert decode_cursor(result["pagination"]["next_cursor"], 2) == ["b@test.com", 11]
+
+
+def test_last_cursor_page_has_no_next_cursor(service, mock_repo):
+    mock_repo.PARTICIPANT_KEY = ExportRepository.PARTICIPANT_KEY
+    mock_repo.get_participants.return_value = [{"user_id": 4}]
+
+    result = service.export_participants(limit=2, cursor=encode_cursor([3]))
+
+    assert result["pagination"]["has_more"] is False
+    assert result["pagination"]["next_cursor"] is None
+
+
+@pytest.mark.parametrize("cursor", ["not a cursor", encode_cursor([1]), encode_cursor([{}, 1])])
+def test_invalid_cursor_is_rejected(service, mock_repo, cursor):
+    mock_repo.ANSWER_KEY = ExportRepository.ANSWER_KEY
+
+    with pytest.raises(InvalidCursor):
+        service.export_answers(cursor=cursor)
+
+
+def test_stream_answers_reads_from_repository(service, mock_repo):
+    since = datetime(2024, 1, 1)
+    mock_repo.stream_answers.return_value = iter([{"answer_id": 1}])
+
+    assert list(service.stream_answers(since=since)) == [{"answer_id": 1}]
+    mock_repo.stream_answers.assert_called_once_with(since=since)
+
+
+def test_iter_csv_chunks_match_rows_to_csv(monkeypatch):
+    monkeypatch.setattr(ExportService, "STREAM_CHUNK_ROWS", 2)
+    rows = [
+        {"id": i, "created": datetime(2024, 1, i + 1), "config": {"n": i}}
+        for i in range(5)
+    ]
+
+    chunks = list(ExportService.iter_csv(iter(rows)))
+
+    assert len(chunks) == 3
+    assert "".join(chunks) == ExportService.rows_to_csv(rows)
+    assert chunks[0].startswith("id,created,config\r\n")
+
+
+def test_iter_csv_of_no_rows_is_empty():
+    assert list(ExportService.iter_csv(iter([]))) == []
+
+
+def test_iter_ndjson_writes_one_object_per_line(monkeypatch):
+    monkeypatch.setattr(ExportService, "STREAM_CHUNK_ROWS", 2)
+    rows = [{"id": i, "created": datetime(2024, 1, 1)} for i in range(3)]
+
+    chunks = list(ExportService.iter_ndjson(iter(rows)))
+
+    assert len(chunks) == 2
+    lines = "".join(chunks).splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"id": i, "created": "2024-01-01 00:00:00"} for i in range(3)
+    ]
@@ -0,0 +1,236 @@
+"""
+Query-plan regression suite: every hot repository query is captured as it is
+sent to Postgres, re-run under EXPLAIN against large synthetic tables, and
+must not fall back to a sequential scan of any of them.
+
+Bulk exports, full-table listings and deletes are intentionally not covered;
+scanning is what they are for.
+"""
+
+import pytest
+from sqlalchemy import event, text
+
+from src.answer.repository.answer_repository import AnswerRepository
+from src.cases.repository.case_progress_repository import CaseProgressRepository
+from src.cases.repository.case_tree_cache_repository import CaseTreeCacheRepository
+from src.cases.repository.concept_repository import ConceptRepository
+from src.cases.repository.drug_exposure_repository import DrugExposureRepository
+from src.cases.repository.measurement_repository import (
+    PARENT_RELATIONSHIP_IDS,
+    MeasurementRepository,
+)
+from src.cases.repository.observation_repository import ObservationRepository
+from src.cases.repository.person_repository import PersonRepository
+from src.cases.repository.visit_occurrence_repository import VisitOccurrenceRepository
+from src.user.repository.display_config_repository import DisplayConfigRepository
+
+VISITS = 5_000
+CLINICAL_ROWS = 100_000
+CONCEPTS = 20_000
+USERS = 1_000
+CONFIGS_PER_USER = 40
+# keeps synthetic ids clear of rows other tests commit
+BASE = 1_000_000
+
+SYNTHETIC_DATA = [
+    f"""INSERT INTO person (person_id, gender_concept_id, year_of_birth,
+           race_concept_id, ethnicity_concept_id)
+       SELECT {BASE} + i, 2, 1980, 3, 4 FROM generate_series(1, {VISITS}) i""",
+    f"""INSERT INTO visit_occurrence (visit_occurrence_id, person_id,
+           visit_concept_id, visit_start_date, visit_end_date, visit_type_concept_id)
+       SELECT {BASE} + i, {BASE} + i, 10, DATE '2024-01-01', DATE '2024-01-01', 11
+       FROM generate_series(1, {VISITS}) i""",
+    f"""INSERT INTO concept (concept_id, concept_name, domain_id, vocabulary_id,
+           concept_class_id, concept_code, valid_start_date, valid_end_date)
+       SELECT {BASE} + i, 'concept ' || i, '1', '1', '1', 'code', DATE '2024-01-01',
+           DATE '2099-01-01'
+       FROM generate_series(1, {CONCEPTS}) i""",
+    f"""INSERT INTO concept_relationship (concept_id_1, concept_id_2,
+           relationship_id, valid_start_date, valid_end_date)
+       SELECT {BASE} + i % {CONCEPTS} + 1, {BASE} + i,
+           (ARRAY['Subsumes', 'Is a', 'Maps to', 'Is characterized by'])[i % 4 + 1],
+           DATE '2024-01-01', DATE '2099-01-01'
+       FROM generate_series(1, {CLINICAL_ROWS}) i""",
+    f"""INSERT INTO observation (observation_id, person_id, observation_concept_id,
+           observation_date, observation_type_concept_id, visit_occurrence_id)
+       SELECT {BASE} + i, {BASE} + i % {VISITS} + 1, {BASE} + i % 500 + 1,
+           DATE '2024-01-01', i % 20, {BASE} + i % {VISITS} + 1
+       FROM generate_series(1, {CLINICAL_ROWS}) i""",
+    f"""INSERT INTO measurement (measurement_id, person_id, measurement_concept_id,
+           measurement_date, measurement_type_concept_id, visit_occurrence_id)
+       SELECT {BASE} + i, {BASE} + i % {VISITS} + 1, {BASE} + i % 500 + 1,
+           DATE '2024-01-01', 0, {BASE} + i % {VISITS} + 1
+       FROM generate_series(1, {CLINICAL_ROWS}) i""",
+    f"""INSERT INTO drug_exposure (drug_exposure_id, person_id, drug_concept_id,
+           drug_exposure_start_date, drug_exposure_end_date, drug_type_concept_id,
+           visit_occurrence_id)
+       SELECT {BASE} + i, {BASE} + i % {VISITS} + 1, {BASE} + i % 500 + 1,
+           DATE '2024-01-01', DATE '2024-01-01', 0, {BASE} + i % {VISITS} + 1
+       FROM generate_series(1, {CLINICAL_ROWS}) i""",
+    f"""INSERT INTO display_config (id, user_email, case_id)
+       SELECT 'plan-' || i, 'user' || (i % {USERS}) || '@plan.test',
+           {BASE} + i % {VISITS} + 1
+       FROM generate_series(1, {USERS * CONFIGS_PER_USER}) i""",
+    f"""INSERT INTO answer (task_id, case_id, user_email, ai_score_shown)
+       SELECT 'plan-' || i, {BASE} + i % {VISITS} + 1,
+           'user' || (i % {USERS}) || '@plan.test', false
+       FROM generate_series(1, {USERS * CONFIGS_PER_USER}) i
+       WHERE i % 3 <> 0""",
+    f"""INSERT INTO case_tree_cache (case_id, page_config_hash, tree)
+       SELECT {BASE} + i, 'hash', '[]'::json FROM generate_series(1, {VISITS}) i""",
+    f"""INSERT INTO case_progress (user_email, next_config_id)
+       SELECT 'user' || i || '@plan.test', 'plan-' || i
+       FROM generate_series(1, {USERS}) i""",
+    f"""INSERT INTO user_answer_count (user_email, answer_count)
+       SELECT 'user' || i || '@plan.test', {CONFIGS_PER_USER}
+       FROM generate_series(1, {USERS}) i""",
+]
+
+LARGE_TABLES = {
+    "person",
+    "visit_occurrence",
+    "concept",
+    "concept_relationship",
+    "observation",
+    "measurement",
+    "drug_exposure",
+    "display_config",
+    "answer",
+    "case_tree_cache",
+    "case_progress",
+    "user_answer_count",
+}
+
+USER = "user7@plan.test"
+VISIT = BASE + 42
+CONCEPT = BASE + 42
+VISITS_OF_BATCH = [BASE + i for i in range(42, 52)]
+
+
+@pytest.fixture
+def large_tables(session):
+    # Synthetic rows do not satisfy every OMOP foreign key (provider, vocabulary,
+    # ...); replica mode skips FK triggers for this transaction only.
+    session.execute(text("SET LOCAL session_replication_role = replica"))
+    for statement in SYNTHETIC_DATA:
+        session.execute(text(statement))
+    for table in LARGE_TABLES:
+        session.execute(text(f"ANALYZE {table}"))
+    return session
+
+
+def seq_scans(plan: dict) -> list[str]:
+    found = []
+    if plan.get("Node Type") == "Seq Scan" and plan["Relation Name"] in LARGE_TABLES:
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found.extend(seq_scans(child))
+    return found
+
+
+def captured_statements(session, query):
+    connection = session.connection()
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(connection, "before_cursor_execute", capture)
+    try:
+        query(session)
+    finally:
+        event.remove(connection, "before_cursor_execute", capture)
+    return statements
+
+
+QUERIES = {
+    "visit_occurrence.get_visit_occurrence": lambda s: VisitOccurrenceRepository(
+        s
+    ).get_visit_occurrence(VISIT),
+    "visit_occurrence.get_visit_occurrences": lambda s: VisitOccurrenceRepository(
+        s
+    ).get_visit_occurrences(VISITS_OF_BATCH),
+    "person.get_persons": lambda s: PersonRepository(s).get_persons(VISITS_OF_BATCH),
+    "observation.get_observations_by_visits": lambda s: ObservationRepository(
+        s
+    ).get_observations_by_visits(VISITS_OF_BATCH),
+    "measurement.get_measurements_by_visits": lambda s: MeasurementRepository(
+        s
+    ).get_measurements_by_visits(VISITS_OF_BATCH),
+    "case_tree_cache.get_case_trees": lambda s: CaseTreeCacheRepository(
+        s
+    ).get_case_trees(VISITS_OF_BATCH, "hash"),
+    "display_config.get_configurations_by_ids": lambda s: DisplayConfigRepository(
+        s
+    ).get_configurations_by_ids(["plan-42", "plan-43"]),
+    "display_config.get_unanswered_configurations": lambda s: DisplayConfigRepository(
+        s
+    ).get_unanswered_configurations(USER, 5),
+    "person.get_person": lambda s: PersonRepository(s).get_person(VISIT),
+    "concept.get_concept": lambda s: ConceptRepository(s).get_concept(CONCEPT),
+    "concept.get_concept_names": lambda s: ConceptRepository(s).get_concept_names(
+        [CONCEPT, CONCEPT + 1, CONCEPT + 2]
+    ),
+    "concept.get_concept_relationships": lambda s: ConceptRepository(
+        s
+    ).get_concept_relationships([CONCEPT, CONCEPT + 1], PARENT_RELATIONSHIP_IDS),
+    "observation.get_observations_by_type": lambda s: ObservationRepository(
+        s
+    ).get_observations_by_type(VISIT, [1, 2]),
+    "observation.get_observations_by_concept": lambda s: ObservationRepository(
+        s
+    ).get_observations_by_concept(VISIT, [CONCEPT, CONCEPT + 1]),
+    "observation.get_observations_by_visit": lambda s: ObservationRepository(
+        s
+    ).get_observations_by_visit(VISIT),
+    "observation.get_observations_of_concepts": lambda s: ObservationRepository(
+        s
+    ).get_observations_of_concepts(VISIT, [CONCEPT, CONCEPT + 1], [1, 2]),
+    "observation.get_valued_observation_concepts": lambda s: ObservationRepository(
+        s
+    ).get_valued_observation_concepts(VISIT, [CONCEPT, CONCEPT + 1]),
+    "measurement.get_measurements_by_visit": lambda s: MeasurementRepository(
+        s
+    ).get_measurements_by_visit(VISIT),
+    "measurement.get_measurements_of_concepts": lambda s: MeasurementRepository(
+        s
+    ).get_measurements_of_concepts(VISIT, [CONCEPT, CONCEPT + 1]),
+    "drug_exposure.get_drugs": lambda s: DrugExposureRepository(s).get_drugs(VISIT),
+    "display_config.get_configuration_by_id": lambda s: DisplayConfigRepository(
+        s
+    ).get_configuration_by_id("plan-42"),
+    "display_config.get_next_unanswered_configuration": lambda s: DisplayConfigRepository(
+        s
+    ).get_next_unanswered_configuration(USER),
+    "display_config.get_next_unanswered_configuration(cursor)": lambda s: DisplayConfigRepository(
+        s
+    ).get_next_unanswered_configuration(USER, "plan-7"),
+    "answer.get_answer_count": lambda s: AnswerRepository(s).get_answer_count(USER),
+    "case_tree_cache.get_case_tree": lambda s: CaseTreeCacheRepository(
+        s
+    ).get_case_tree(VISIT, "hash"),
+    "case_progress.get_progress": lambda s: CaseProgressRepository(s).get_progress(
+        USER
+    ),
+}
+
+
+def test_repository_queries_avoid_seq_scans(large_tables):
+    # One test so the synthetic data is loaded once; every offender is reported.
+    session = large_tables
+    offenders = {}
+    for name, query in QUERIES.items():
+        session.expire_all()
+        statements = captured_statements(session, query)
+        assert statements, f"{name} sent no SQL"
+        for statement, parameters in statements:
+            plan = (
+                session.connection()
+                .exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+                .scalar()
+            )
+            scanned = seq_scans(plan[0]["Plan"])
+            if scanned:
+                offenders[name] = scanned
+
+    assert offenders == {}
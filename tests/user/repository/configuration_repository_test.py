@@ -1,5 +1,6 @@
 import pytest
 
+from src.answer.model.answer import Answer
 from src.user.model.display_config import DisplayConfig
 from src.user.repository.display_config_repository import DisplayConfigRepository
 
@@ -74,43 +75,12 @@ def test_get_configuration_by_id(config_repository):
     assert found.__eq__(new_config)
 
 
-def test_get_case_configurations_by_user_empty(config_repository):
-    assert config_repository.get_case_configurations_by_user("usera@example.com") == []
-
-
-def test_get_case_configurations_by_user_single_user_multiple_configs(
-    config_repository,
-):
-    configs = [
-        DisplayConfig(
-            user_email="usera@example.com",
-            case_id=1,
-        ),
-        DisplayConfig(
-            user_email="usera@example.com",
-            case_id=2,
-        ),
-    ]
-    for config in configs:
-        config_repository.save_configuration(config)
-
-    result = config_repository.get_case_configurations_by_user("usera@example.com")
-    assert result.__len__() == 2
-    assert result[0].__eq__(configs[0])
-    assert result[1].__eq__(configs[1])
-
-
 def test_should_avoid_duplicate_configurations(config_repository):
     config = DisplayConfig(user_email="usera@example.com", case_id=1)
     config_repository.save_configuration(config)
-    first_save_result = config_repository.get_case_configurations_by_user(
-        "usera@example.com"
-    )
     config_repository.save_configuration(config)
-    second_save_result = config_repository.get_case_configurations_by_user(
-        "usera@example.com"
-    )
-    assert first_save_result.__eq__(second_save_result)
+
+    assert len(config_repository.get_all_configurations()) == 1
 
 
 def test_should_generate_same_configuration_id_for_same_configuration(
@@ -124,3 +94,94 @@ def test_should_generate_same_configuration_id_for_same_configuration(
         DisplayConfig(user_email="usera@example.com", case_id=1)
     )
     assert config.id.__eq__(new_config_id)
+
+
+def test_get_next_unanswered_configuration(config_repository, session):
+    first = config_repository.save_configuration(
+        DisplayConfig(user_email="usera@example.com", case_id=1)
+    )
+    second = config_repository.save_configuration(
+        DisplayConfig(user_email="usera@example.com", case_id=2)
+    )
+    config_repository.save_configuration(
+        DisplayConfig(user_email="userb@example.com", case_id=3)
+    )
+    # another user's answer to the same task does not count
+    session.add(Answer(task_id=second.id, case_id=2, user_email="userb@example.com"))
+    session.add(Answer(task_id=first.id, case_id=1, user_email="usera@example.com"))
+    session.flush()
+
+    assert config_repository.get_next_unanswered_configuration(
+        "usera@example.com"
+    ) == (2, second.id)
+    assert (
+        config_repository.get_next_unanswered_configuration(
+            "usera@example.com", first.id
+        )
+        is None
+    )
+    assert config_repository.get_next_unanswered_configuration(
+        "usera@example.com", second.id
+    ) == (2, second.id)
+
+
+def test_get_next_unanswered_configuration_when_all_answered(
+    config_repository, session
+):
+    config = config_repository.save_configuration(
+        DisplayConfig(user_email="usera@example.com", case_id=1)
+    )
+    session.add(Answer(task_id=config.id, case_id=1, user_email="usera@example.com"))
+    session.flush()
+
+    assert config_repository.get_next_unanswered_configuration("usera@example.com") is None
+
+
+def test_get_next_unanswered_configuration_in_id_order(config_repository):
+    configs = [
+        config_repository.save_configuration(
+            DisplayConfig(user_email="usera@example.com", case_id=case_id)
+        )
+        for case_id in (1, 2, 3)
+    ]
+    first = min(configs, key=lambda config: config.id)
+
+    assert config_repository.get_next_unanswered_configuration(
+        "usera@example.com"
+    ) == (first.case_id, first.id)
+
+
+def test_get_configurations_by_ids(config_repository):
+    first = config_repository.save_configuration(
+        DisplayConfig(user_email="usera@example.com", case_id=1)
+    )
+    config_repository.save_configuration(
+        DisplayConfig(user_email="usera@example.com", case_id=2)
+    )
+
+    found = config_repository.get_configurations_by_ids([first.id, "missing"])
+
+    assert [config.id for config in found] == [first.id]
+
+
+def test_get_unanswered_configurations(config_repository, session):
+    first = config_repository.save_configuration(
+        DisplayConfig(user_email="usera@example.com", case_id=1)
+    )
+    second = config_repository.save_configuration(
+        DisplayConfig(user_email="usera@example.com", case_id=2)
+    )
+    third = config_repository.save_configuration(
+        DisplayConfig(user_email="usera@example.com", case_id=3)
+    )
+    config_repository.save_configuration(
+        DisplayConfig(user_email="userb@example.com", case_id=4)
+    )
+    session.add(Answer(task_id=first.id, case_id=1, user_email="usera@example.com"))
+    session.flush()
+
+    found = config_repository.get_unanswered_configurations("usera@example.com", 5)
+    limited = config_repository.get_unanswered_configurations("usera@example.com", 1)
+
+    assert [config.id for config in found] == sorted([second.id, third.id])
+    assert limited == found[:1]
@@ -10,6 +10,7 @@ from src.common.exception.BusinessException import (
 )
 from src.user.repository.display_config_repository import DisplayConfigRepository
 from src.user.service.configuration_service import ConfigurationService
+from src.user.utils.path_trie import compile_path_config
 
 
 @pytest.fixture
@@ -114,3 +115,13 @@ def test_database_save_error(mocker, mock_repo, valid_csv_file):
     assert response[0]["user_case_key"] == "usera@example.com-1"
     assert response[0]["status"] == "failed"
     mock_repo.clean_configurations.assert_called_once()
+
+
+def test_process_csv_file_compiles_path_trie(mock_repo, valid_csv_file):
+    service = ConfigurationService(repository=mock_repo)
+
+    service.process_csv_file(valid_csv_file)
+
+    saved = mock_repo.save_configuration.call_args_list[0].args[0]
+    assert saved.path_trie == compile_path_config(saved.path_config)
+    assert "keep" in saved.path_trie["root"]["Background"]
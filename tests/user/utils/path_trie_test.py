@@ -0,0 +1,87 @@
+from src.user.model.display_config import DisplayConfig
+from src.user.utils.path_trie import (
+    PATH_TRIE_VERSION,
+    compile_path_config,
+    find_parent,
+    get_path_trie,
+)
+
+
+def test_compile_merges_entries_of_same_parent():
+    path_trie = compile_path_config(
+        [
+            {"path": "BACKGROUND.Family History.Cancer", "style": {"collapse": True}},
+            {"path": "BACKGROUND.Family History.Diabetes", "style": {"top": 2}},
+            {"path": "BACKGROUND.Family History.Cancer", "style": {"top": 1}},
+            {"path": "BACKGROUND.Social History.Smoke.No"},
+        ]
+    )
+
+    family_history = find_parent(path_trie, ["BACKGROUND", "Family History"])
+    assert family_history["keep"] == ["Cancer", "Diabetes"]
+    assert family_history["style"] == {"collapse": False, "top": 2}
+    assert find_parent(path_trie, ["BACKGROUND", "Social History", "Smoke"]) == {
+        "children": {},
+        "keep": ["No"],
+        "style": {},
+    }
+
+
+def test_find_parent_ignores_nodes_without_leaves():
+    path_trie = compile_path_config([{"path": "BACKGROUND.Social History.Smoke.No"}])
+
+    assert find_parent(path_trie, ["BACKGROUND", "Social History"]) is None
+    assert find_parent(path_trie, ["BACKGROUND", "Medical History"]) is None
+
+
+def test_compile_skips_invalid_paths():
+    path_trie = compile_path_config(
+        [{"path": ""}, {"path": None}, {"path": "BACKGROUND"}, {"style": {"top": 1}}]
+    )
+
+    assert path_trie["root"] == {}
+
+
+def test_compile_extracts_crc_and_physical_examination():
+    path_trie = compile_path_config(
+        [
+            {"path": "RISK ASSESSMENT.Colorectal Cancer Score: 7"},
+            {"path": "RISK ASSESSMENT.CRC risk assessments"},
+            {"path": "PHYSICAL EXAMINATION.Vital Signs.Pulse"},
+            {"path": "PHYSICAL EXAMINATION.Abdominal.Pulse"},
+            {"path": "PHYSICAL EXAMINATION.Abdominal"},
+        ]
+    )
+
+    assert path_trie["crc_score_leaves"] == ["Colorectal Cancer Score: 7"]
+    assert path_trie["crc_toggle"] is True
+    assert path_trie["section_keep"] == {"PHYSICAL EXAMINATION": ["Pulse"]}
+
+
+def test_compile_empty_path_config():
+    path_trie = compile_path_config(None)
+
+    assert path_trie == {
+        "version": PATH_TRIE_VERSION,
+        "root": {},
+        "crc_score_leaves": [],
+        "crc_toggle": False,
+        "section_keep": {},
+    }
+
+
+def test_get_path_trie_uses_stored_trie():
+    stored = compile_path_config([{"path": "BACKGROUND.Family History.Cancer"}])
+    config = DisplayConfig("a@b.com", 1, path_config=[], path_trie=stored)
+
+    assert get_path_trie(config) is stored
+
+
+def test_get_path_trie_compiles_missing_or_outdated_trie():
+    path_config = [{"path": "BACKGROUND.Family History.Cancer"}]
+
+    for path_trie in (None, {"version": PATH_TRIE_VERSION - 1}):
+        config = DisplayConfig(
+            "a@b.com", 1, path_config=path_config, path_trie=path_trie
+        )
+        assert get_path_trie(config) == compile_path_config(path_config)